@@ -86,6 +86,10 @@ class App(QObject):
         self._internalMeshActors = internalMeshActors
         self.showMesh()
 
+    def transformVtk(self, transform):
+        if self._vtkMesh:
+            self._vtkMesh.transform(transform, [*self._cellZoneActors.values(), *self._internalMeshActors.values()])
+
     def updateMesh(self):
         self._window.meshUpdated()
 
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import re
+from pathlib import Path
+
+import psutil
+
+from libbaram.mpi import ParallelEnvironment, ParallelType
+from libbaram.openfoam.constants import Directory
+from libbaram.process import getAvailablePhysicalCores
+
+
+MEMORY_PER_CELL = 1024  # Rough estimate of the memory in bytes a solver needs for a cell
+
+_CELLS_PATTERN = re.compile(rb'nCells:\s*(\d+)')
+
+
+def countCells(casePath: Path) -> int:
+    """Returns the number of cells of the case, read from the notes of the owner files
+
+    Returns:
+        Number of cells, or 0 if not known
+    """
+    def count(paths):
+        nCells = 0
+        for path in paths:
+            with path.open('rb') as f:
+                if match := _CELLS_PATTERN.search(f.read(4096)):
+                    nCells += int(match.group(1))
+
+        return nCells
+
+    constant = casePath / Directory.CONSTANT_DIRECTORY_NAME
+    if nCells := count(constant.glob(f'**/{Directory.POLY_MESH_DIRECTORY_NAME}/owner')):
+        return nCells
+
+    return count(casePath.glob(f'processor*/{Directory.CONSTANT_DIRECTORY_NAME}/**/'
+                               f'{Directory.POLY_MESH_DIRECTORY_NAME}/owner'))
+
+
+def batchConcurrency(environment: ParallelEnvironment, nCells: int) -> int:
+    """Returns the number of batch cases to run at once
+
+    Cases run on the local machine share its physical cores, each case using as many cores as its decomposition.
+    The number is also limited by the available memory estimated from the number of cells of a case.
+    Cases run on clusters are run one by one, because the cores of the hosts are not known.
+    """
+    if environment.type() != ParallelType.LOCAL_MACHINE:
+        return 1
+
+    concurrency = max(1, getAvailablePhysicalCores() // environment.np())
+    if nCells > 0:
+        concurrency = min(concurrency, max(1, psutil.virtual_memory().available // (nCells * MEMORY_PER_CELL)))
+
+    return concurrency
@@ -1,15 +1,19 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import asyncio
+import re
+from collections import deque
 from pathlib import Path
 from threading import Lock
 
-from PySide6.QtCore import Signal, QTimer, QObject
+from PySide6.QtCore import Signal, QObject
 
 from libbaram.utils import rmtree
-from libbaram.openfoam.constants import CASE_DIRECTORY_NAME
+from libbaram.openfoam.constants import CASE_DIRECTORY_NAME, Directory
 from libbaram.run import launchSolver, runParallelUtility, STDOUT_FILE_NAME, STDERR_FILE_NAME
 
+from baramFlow.batch_scheduler import batchConcurrency, countCells
 from baramFlow.coredb import coredb
 from baramFlow.coredb.project import Project
 from baramFlow.openfoam import parallel
@@ -21,7 +25,6 @@ from .solver_status import SolverStatus, RunType, SolverProcess
 from .coredb.coredb_reader import CoreDBReader
 
 
-SOLVER_CHECK_INTERVAL = 500
 BATCH_DIRECTORY_NAME = 'batch'
 
 _mutex = Lock()
@@ -32,6 +35,7 @@ class CaseManager(QObject):
     caseLoaded = Signal(str)
     caseCleared = Signal()
     batchCleared = Signal()
+    batchStatusChanged = Signal(str, SolverStatus)
 
     def __new__(cls, *args, **kwargs):
         with _mutex:
@@ -58,8 +62,9 @@ class CaseManager(QObject):
 
         self._monitor = None
         self._generator = None
-        self._batchProcess = None
+        self._batchProcesses = {}
         self._batchRunning = False
+        self._batchStop = False
 
     @property
     def name(self):
@@ -127,8 +132,8 @@ class CaseManager(QObject):
         if self._process:
             self._process.kill()
 
-        if self._batchProcess:
-            self._batchProcess.terminate()
+        for process in self._batchProcesses.values():
+            process.terminate()
 
     async def liveRun(self):
         self.loadLiveCase()
@@ -150,32 +155,47 @@ class CaseManager(QObject):
         await self._initializeCase()
 
     async def batchRun(self, cases):
+        """Runs batch cases, as many at once as the machine can afford
+
+        Cases are prepared one by one as the current case, while the solvers of the cases prepared earlier are running.
+        """
         self._batchStop = False
         self._batchRunning = True
-        for case, parameters in cases:
-            self.loadBatchCase(case, parameters)
 
-            await self._initializeCase()
+        environment = parallel.getEnvironment()
+        slots = asyncio.Semaphore(batchConcurrency(environment, countCells(self._livePath())))
 
-            caseRoot = FileSystem.caseRoot()
-            stdout = open(caseRoot / STDOUT_FILE_NAME, 'w')
-            stderr = open(caseRoot / STDERR_FILE_NAME, 'w')
+        # Cases are run in the order given, because they share the mesh and no case is known to be cheaper
+        queue = deque(cases)
+        for name, _ in queue:
+            self._setBatchStatus(name, SolverStatus.WAITING)
 
-            solver = findSolver()
-            self._batchProcess = await runParallelUtility(solver, parallel=parallel.getEnvironment(), cwd=caseRoot,
-                                                          stdout=stdout, stderr=stderr)
-            self._setStatus(SolverStatus.RUNNING)
-            result = await self._batchProcess.wait()
+        solving = []
+        try:
+            while queue and not self._batchStop:
+                # The case stays in the queue until its solver starts
+                name, parameters = queue[0]
+                self.loadBatchCase(name, parameters)
 
-            if self._batchStop:
-                self._setStatus(SolverStatus.ENDED)
-                break
+                await self._initializeCase()
+                solver = findSolver()
 
-            self._setStatus(SolverStatus.ENDED if result == 0 else SolverStatus.ERROR)
+                await slots.acquire()
+                if self._batchStop:
+                    slots.release()
+                    break
 
-        self._batchProcess = None
-        self._batchRunning = False
-        self._project.updateSolverStatus(None, SolverStatus.ENDED, None)
+                queue.popleft()
+                solving.append(asyncio.create_task(
+                    self._solveBatchCase(name, FileSystem.caseRoot(), solver, environment, slots)))
+        finally:
+            for name, _ in queue:
+                self._setBatchStatus(name, SolverStatus.NONE)
+
+            await asyncio.gather(*solving, return_exceptions=True)
+
+            self._batchRunning = False
+            self._project.updateSolverStatus(None, SolverStatus.ENDED, None)
 
     def saveAndStop(self):
         controlDict = ControlDict().build()
@@ -187,9 +207,21 @@ class CaseManager(QObject):
             self._generator.cancel()
             self._generator = None
 
-    def stopBatchRun(self):
+    def stopBatchRun(self, stopAt=None):
+        """Stops starting batch cases
+
+        Args:
+            stopAt: "stopAt" of controlDict to write for the running cases other than the current case
+        """
         self._batchStop = True
 
+        if stopAt is None:
+            return
+
+        for name in self._batchProcesses:
+            if name != self._caseName:
+                self._setStopAt(self._batchPath(name), stopAt)
+
     def clearCases(self):
         livePath = self._livePath()
         FileSystem.createCase(livePath)
@@ -234,6 +266,39 @@ class CaseManager(QObject):
         self._status = status
         self._project.updateSolverStatus(self._caseName, status, self._process)
 
+    def _setBatchStatus(self, name, status):
+        if name == self._caseName:
+            self._setStatus(status)
+        else:
+            # Not the status of the current case
+            self._project.updateBatchStatus(name, status)
+
+        self.batchStatusChanged.emit(name, status)
+
+    async def _solveBatchCase(self, name, caseRoot, solver, environment, slots):
+        try:
+            with open(caseRoot / STDOUT_FILE_NAME, 'w') as stdout, open(caseRoot / STDERR_FILE_NAME, 'w') as stderr:
+                process = await runParallelUtility(solver, parallel=environment, cwd=caseRoot,
+                                                   stdout=stdout, stderr=stderr)
+                self._batchProcesses[name] = process
+                self._setBatchStatus(name, SolverStatus.RUNNING)
+                result = await process.wait()
+        finally:
+            self._batchProcesses.pop(name, None)
+            slots.release()
+
+        if self._batchStop:
+            self._setBatchStatus(name, SolverStatus.ENDED)
+        else:
+            self._setBatchStatus(name, SolverStatus.ENDED if result == 0 else SolverStatus.ERROR)
+
+    def _setStopAt(self, caseRoot, stopAt):
+        path = caseRoot / Directory.SYSTEM_DIRECTORY_NAME / 'controlDict'
+        if path.is_file():
+            temp = path.with_suffix('.tmp')
+            temp.write_text(re.sub(r'(\bstopAt\s+)\w+;', rf'\g<1>{stopAt};', path.read_text()))
+            temp.replace(path)
+
     def _setLiveProcess(self, process):
         self._runType = RunType.PROCESS
         self._process = process
@@ -241,17 +306,22 @@ class CaseManager(QObject):
         self._startMonitor()
 
     def _startMonitor(self):
-        if self._monitor is None:
-            self._monitor = QTimer()
-            self._monitor.setInterval(SOLVER_CHECK_INTERVAL)
-            self._monitor.timeout.connect(self._updateStatus)
-            self._monitor.start()
+        if self._monitor is None and self._status == SolverStatus.RUNNING:
+            self._monitor = asyncio.create_task(self._monitorProcess(self._process))
 
     def _stopMonitor(self):
         if self._monitor:
-            self._monitor.stop()
+            self._monitor.cancel()
             self._monitor = None
-            self._process = None
+        self._process = None
+
+    async def _monitorProcess(self, process):
+        # The status is updated when the solver exits, instead of checking the process periodically
+        await process.wait()
+
+        self._monitor = None
+        self._updateStatus()
+        self._startMonitor()
 
     def _loadLiveStatus(self):
         process = self._project.solverProcess()
@@ -253,37 +253,38 @@ def getBoundaryElements(rname):
 class MaterialObserver(IMaterialObserver):
     def specieAdded(self, db, mid, mixtureID):
         for mixture in db.getElements(f'{BOUNDARY_CONDITION_XPATH}/species/mixture[mid="{mixtureID}"]'):
-            mixture.append(xml.createElement('<specie xmlns="http://www.baramcfd.org/baram">'
-                                             f' <mid>{mid}</mid><value>0</value>'
-                                             '</specie>'))
+            db.appendChild(mixture, xml.createElement('<specie xmlns="http://www.baramcfd.org/baram">'
+                                                      f' <mid>{mid}</mid><value>0</value>'
+                                                      '</specie>'))
 
     def materialRemoving(self, db, mid: int):
         for wallAdhesion in db.getElements(
                 f'{BOUNDARY_CONDITION_XPATH}/wall/wallAdhesions/wallAdhesion[mid="{mid}"]'):
-            wallAdhesion.getparent().remove(wallAdhesion)
+            db.removeChild(wallAdhesion)
 
         for volumeFraction in db.getElements(
                 f'{BOUNDARY_CONDITION_XPATH}/volumeFractions/volumeFraction[material="{mid}"]'):
-            volumeFraction.getparent().remove(volumeFraction)
+            db.removeChild(volumeFraction)
 
     def specieRemoving(self, db, mid, primarySpecie):
         for boundaryCondition in db.getElements(BOUNDARY_CONDITION_XPATH):
             for specie in xml.getElements(boundaryCondition, f'species/mixture/specie[mid="{mid}"]'):
-                self._removeSpecieInComposition(primarySpecie, specie)
+                self._removeSpecieInComposition(db, primarySpecie, specie)
 
 
 class RegionMaterialObserver(IRegionMaterialObserver):
     def materialsUpdating(self, db, rname, primary, secondaries, species):
         def addWallAdhesion(parent, mid1, mid2):
             if xml.getElement(parent, f'wallAdhesion[mid="{mid1}"][mid="{mid2}"]') is None:
-                parent.append(xml.createElement('<wallAdhesion xmlns="http://www.baramcfd.org/baram"> '
-                                                f'  <mid>{mid1}</mid>'
-                                                f'  <mid>{mid2}</mid>'
-                                                '   <contactAngle>90</contactAngle>'
-                                                '   <advancingContactAngle>90</advancingContactAngle>'
-                                                '   <recedingContactAngle>90</recedingContactAngle>'
-                                                '   <characteristicVelocityScale>0.001</characteristicVelocityScale>'
-                                                '</wallAdhesion>'))
+                db.appendChild(parent,
+                               xml.createElement('<wallAdhesion xmlns="http://www.baramcfd.org/baram"> '
+                                                 f'  <mid>{mid1}</mid>'
+                                                 f'  <mid>{mid2}</mid>'
+                                                 '   <contactAngle>90</contactAngle>'
+                                                 '   <advancingContactAngle>90</advancingContactAngle>'
+                                                 '   <recedingContactAngle>90</recedingContactAngle>'
+                                                 '   <characteristicVelocityScale>0.001</characteristicVelocityScale>'
+                                                 '</wallAdhesion>'))
 
         speicesXML = f'''<mixture xmlns="http://www.baramcfd.org/baram">
                             <mid>{primary}</mid>{self._specieRatiosXML(species)}
@@ -301,12 +302,13 @@ class RegionMaterialObserver(IRegionMaterialObserver):
                     addWallAdhesion(wallAdhesions, secondaries[i], secondaries[j])
 
                 if xml.getElement(volumeFractions, f'volumeFraction[material="{secondaries[i]}"]') is None:
-                    volumeFractions.append(xml.createElement('<volumeFraction xmlns="http://www.baramcfd.org/baram">'
-                                                             f' <material>{secondaries[i]}</material>'
-                                                             f' <fraction>0</fraction>'
-                                                             '</volumeFraction>'))
+                    db.appendChild(volumeFractions,
+                                   xml.createElement('<volumeFraction xmlns="http://www.baramcfd.org/baram">'
+                                                     f' <material>{secondaries[i]}</material>'
+                                                     f' <fraction>0</fraction>'
+                                                     '</volumeFraction>'))
 
             speciesElement = xml.getElement(boundaryCondtion, 'species')
-            speciesElement.clear()
+            db.clearChildren(speciesElement)
             if species:
-                speciesElement.append(xml.createElement(speicesXML))
+                db.appendChild(speciesElement, xml.createElement(speicesXML))
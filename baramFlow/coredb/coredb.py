@@ -5,12 +5,12 @@ from __future__ import annotations
 
 import copy
 import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Optional
 
 from lxml import etree
-import xmlschema
 import h5py
-from xmlschema.names import XSD_DOUBLE, XSD_MIN_INCLUSIVE, XSD_MAX_INCLUSIVE, XSD_MIN_EXCLUSIVE, XSD_MAX_EXCLUSIVE
 
 # To use ".qrc" QT Resource files
 # noinspection PyUnresolvedReferences
@@ -18,9 +18,13 @@ import resource_rc
 
 from resources import resource
 from baramFlow.coredb import migrate
+from .element_index import ElementIndex, REGION_TAG, BOUNDARY_CONDITION_TAG, CELL_ZONE_TAG, NAME_TAG
+from .journal import Journal, ReadOnlyJournal
 from .libdb import nsmap, ns, DBError, ValueException
+from .schema_index import ValueType, schemaIndex
 
 __instance: Optional[_CoreDB] = None
+_snapshot: ContextVar[Optional[_CoreDB]] = ContextVar('snapshot', default=None)
 
 logger = logging.getLogger(__name__)
 
@@ -31,11 +35,28 @@ class Cancel(Exception):
 
 def CoreDB():
     global __instance
+    if (db := _snapshot.get()) is not None:
+        return db
+
     assert(__instance is not None)
 
     return __instance
 
 
+@contextmanager
+def snapshot():
+    """Makes CoreDB() return a read-only copy of the configuration in the current context
+
+    Only the current context is affected, including the threads run in copies of it,
+    so the configuration can be edited in the others while the copy is being read.
+    """
+    token = _snapshot.set(CoreDB().readOnlyCopy())
+    try:
+        yield _snapshot.get()
+    finally:
+        _snapshot.reset(token)
+
+
 def createDB():
     global __instance
     assert(__instance is None)
@@ -87,7 +108,7 @@ class _CoreDB(object):
     MONITOR_MAX_INDEX = 100
     MATERIAL_MAX_INDEX = 1000
     CELL_ZONE_MAX_INDEX = 1000
-    BOUNDARY_CONDITION_MAX_INDEX = 10000
+    BOUNDARY_CONDITION_MAX_INDEX = 100000
     USER_DEFINED_SCALAR_MAX_INDEX = 10000
 
     def __init__(self):
@@ -96,31 +117,35 @@ class _CoreDB(object):
         self._configCount = 0
         self._configCountAtSave = self._configCount
         self._inContext = False
-        self._backupTree = None
+        self._journal = Journal()
         self._lastError = None
         self._lastNote = None
 
-        self._schema = xmlschema.XMLSchema(resource.file(self.XSD_PATH))
+        self._schemaIndex = schemaIndex(self.XSD_PATH)
 
         xsdTree = etree.parse(resource.file(self.XSD_PATH))
         self._xmlSchema = etree.XMLSchema(etree=xsdTree)
         self._xmlParser = etree.XMLParser(schema=self._xmlSchema)
 
         self._xmlTree = None
+        self._index = None
+        self._templates = {}
 
     def __enter__(self):
         logger.debug('enter')
-        self._backupTree = copy.deepcopy(self._xmlTree)
+        self._journal.begin()
         self._lastError = None
         self._inContext = True
         return self
 
     def __exit__(self, eType, eValue, eTraceback):
         if self._lastError is not None or eType is not None:
-            self._xmlTree = self._backupTree
+            self._journal.rollback()
+            self._index.invalidate()
+        else:
+            self._journal.commit()
 
         self._lastError = None
-        self._backupTree = None
         self._inContext = False
 
         if eType == Cancel:
@@ -180,6 +205,7 @@ class _CoreDB(object):
             raise LookupError
 
         oldValue = elements[0].get(name)
+        self._journal.recordAttribute(elements[0], name)
         elements[0].set(name, value)
         if value != oldValue:
             self._configCount += 1
@@ -204,13 +230,12 @@ class _CoreDB(object):
         if parameter := element.get('batchParameter'):
             return '$' + parameter
 
-        path = self._xmlTree.getelementpath(element)
-        schema = self._schema.find(".//" + path, namespaces=nsmap)
+        schema = self._schemaIndex.find(self._elementPath(element))
 
         if schema is None:
             raise LookupError
 
-        if not schema.type.has_simple_content():
+        if not schema.hasSimpleContent:
             raise LookupError
 
         logger.debug(f'getValue( {xpath} -> {element.text} )')
@@ -237,19 +262,18 @@ class _CoreDB(object):
         """
         element = self.getElement(xpath)
 
-        path = self._xmlTree.getelementpath(element)
-        schema = self._schema.find(".//" + path, namespaces=nsmap)
+        schema = self._schemaIndex.find(self._elementPath(element))
 
         if schema is None:
             raise LookupError
 
-        if not schema.type.has_simple_content():
+        if not schema.hasSimpleContent:
             raise LookupError
 
         batchParameter = None
         value = value.strip()
 
-        if schema.type.is_complex() and 'batchParameter' in schema.type.attributes:
+        if schema.batchParameter:
             if value and value[0] == '$':
                 batchParameter = value[1:]
                 batchParameterXPath = f'.//runCalculation/batch/parameters/parameter[name="{batchParameter}"]'
@@ -260,7 +284,7 @@ class _CoreDB(object):
                 else:
                     batchParameter = None
 
-        if schema.type.local_name == 'inputNumberListType':
+        if schema.valueType == ValueType.NUMBER_LIST:
             numbers = value.split()
             # To check if the strings in value are valid numbers
             # 'ValueError' exception is raised if invalid number found
@@ -272,46 +296,33 @@ class _CoreDB(object):
 
             return element, ' '.join(numbers), None
 
-        elif schema.type.is_derived(schema.type.maps.types[XSD_DOUBLE]):  # The case when the type has restrictions or attributes
+        elif schema.valueType == ValueType.DOUBLE:  # The case when the type has restrictions or attributes
             try:
                 decimal = float(value)
             except ValueError:
                 self._lastError = DBError.FLOAT_ONLY
                 raise ValueException(DBError.FLOAT_ONLY, self._lastNote)
 
-            if (minValue := getattr(schema.type.base_type.get_facet(XSD_MIN_INCLUSIVE), 'value', None)) is not None:
-                if decimal < minValue:
-                    self._lastError = DBError.OUT_OF_RANGE
-                    raise ValueException(DBError.OUT_OF_RANGE, self._lastNote)
+            if schema.minInclusive is not None and decimal < schema.minInclusive:
+                self._lastError = DBError.OUT_OF_RANGE
+                raise ValueException(DBError.OUT_OF_RANGE, self._lastNote)
 
-            if (maxValue := getattr(schema.type.base_type.get_facet(XSD_MAX_INCLUSIVE), 'value', None)) is not None:
-                if decimal > maxValue:
-                    self._lastError = DBError.OUT_OF_RANGE
-                    raise ValueException(DBError.OUT_OF_RANGE, self._lastNote)
+            if schema.maxInclusive is not None and decimal > schema.maxInclusive:
+                self._lastError = DBError.OUT_OF_RANGE
+                raise ValueException(DBError.OUT_OF_RANGE, self._lastNote)
 
-            if (minValue := getattr(schema.type.base_type.get_facet(XSD_MIN_EXCLUSIVE), 'value', None)) is not None:
-                if decimal <= minValue:
-                    self._lastError = DBError.OUT_OF_RANGE
-                    raise ValueException(DBError.OUT_OF_RANGE, self._lastNote)
+            if schema.minExclusive is not None and decimal <= schema.minExclusive:
+                self._lastError = DBError.OUT_OF_RANGE
+                raise ValueException(DBError.OUT_OF_RANGE, self._lastNote)
 
-            if (maxValue := getattr(schema.type.base_type.get_facet(XSD_MAX_EXCLUSIVE), 'value', None)) is not None:
-                if decimal >= maxValue:
-                    self._lastError = DBError.OUT_OF_RANGE
-                    raise ValueException(DBError.OUT_OF_RANGE, self._lastNote)
+            if schema.maxExclusive is not None and decimal >= schema.maxExclusive:
+                self._lastError = DBError.OUT_OF_RANGE
+                raise ValueException(DBError.OUT_OF_RANGE, self._lastNote)
 
             return element, value.lower(), batchParameter
 
-        elif schema.type.is_decimal():
-            if schema.type.is_simple():
-                name = schema.type.local_name.lower()
-                minValue = schema.type.min_value
-                maxValue = schema.type.max_value
-            else:
-                name = schema.type.content.primitive_type.local_name.lower()
-                minValue = schema.type.content.min_value
-                maxValue = schema.type.content.max_value
-
-            if 'integer' in name:
+        elif schema.valueType == ValueType.DECIMAL:
+            if schema.isInteger:
                 try:
                     decimal = int(value)
                 except ValueError:
@@ -324,11 +335,11 @@ class _CoreDB(object):
                     self._lastError = DBError.FLOAT_ONLY
                     raise ValueException(DBError.FLOAT_ONLY, self._lastNote)
 
-            if minValue is not None and decimal < minValue:
+            if schema.minInclusive is not None and decimal < schema.minInclusive:
                 self._lastError = DBError.OUT_OF_RANGE
                 raise ValueException(DBError.OUT_OF_RANGE, self._lastNote)
 
-            if maxValue is not None and decimal > maxValue:
+            if schema.maxInclusive is not None and decimal > schema.maxInclusive:
                 self._lastError = DBError.OUT_OF_RANGE
                 raise ValueException(DBError.OUT_OF_RANGE, self._lastNote)
 
@@ -338,7 +349,7 @@ class _CoreDB(object):
         # For now, string value is set only by VIEW code not by user.
         # Therefore, raising exception(not returning value) is reasonable.
         else:
-            if schema.type.is_restriction() and value not in schema.type.enumeration:
+            if schema.enumeration is not None and value not in schema.enumeration:
                 raise ValueError
 
             return element, value, None
@@ -364,13 +375,16 @@ class _CoreDB(object):
             if element.text or value:     # the case of (element.text=='' and oldValue is None) happens because of XML processing
                 self._configCount += 1
 
+            self._journal.recordText(element)
             element.text = value
+            self._textChanged(element)
 
         logger.debug(f'setValue( {xpath} -> {element.text} )')
 
-        self._xmlSchema.assertValid(self._xmlTree)
+        self._validateElement(element)
 
         if element.get('batchParameter') != parameter:
+            self._journal.recordAttribute(element, 'batchParameter')
             if parameter:
                 element.set('batchParameter', parameter)
             else:
@@ -432,11 +446,13 @@ class _CoreDB(object):
         if len(elements) != 1:
             raise LookupError
 
+        self._journal.recordContent(elements[0])
         elements[0].clear()
         _setBulkInternal(elements[0], value)
+        self._index.invalidate()
         self._configCount += 1
 
-        self._xmlSchema.assertValid(self._xmlTree)
+        self._validateElement(elements[0])
 
     def getBulk(self, xpath: str) -> dict:
         """Get the value at the specified path
@@ -530,7 +546,7 @@ class _CoreDB(object):
                     for e in elements if e.findtext('type', namespaces=nsmap) == type_]
 
     def addRegion(self, rname: str):
-        region = self._xmlTree.find(f'.//regions/region[name="{rname}"]', namespaces=nsmap)
+        region = self._index.region(rname)
 
         if region is not None:
             raise FileExistsError
@@ -538,8 +554,10 @@ class _CoreDB(object):
         parent = self._xmlTree.find('.//regions', namespaces=nsmap)
 
         region = etree.SubElement(parent, f'{{{ns}}}region')
+        self._journal.recordPosition(region)
 
         etree.SubElement(region, f'{{{ns}}}name').text = rname
+        self._index.added(region)
 
         # set default material for the region
         materials = self.getMaterials()
@@ -584,7 +602,7 @@ class _CoreDB(object):
 
         self._configCount += 1
 
-        self._xmlSchema.assertValid(self._xmlTree)
+        self._validateElement(region)
 
     def getRegions(self) -> list[str]:
         elements = self._xmlTree.findall(f'.//regions/region', namespaces=nsmap)
@@ -597,43 +615,64 @@ class _CoreDB(object):
 
     def clearRegions(self):
         parent = self._xmlTree.find('.//regions', namespaces=nsmap)
-        parent.clear()
+        self.clearChildren(parent)
 
     def hasMultipleRegions(self):
         return len(self._xmlTree.findall(f'.//regions/region', namespaces=nsmap)) > 1
 
     def addCellZone(self, rname: str, zname: str) -> int:
-        zone = self._xmlTree.find(f'.//region[name="{rname}"]/cellZones/cellZone[name="{zname}"]', namespaces=nsmap)
+        return self.addCellZones(rname, [zname])[0]
 
-        if zone is not None:
-            raise FileExistsError
+    def addCellZones(self, rname: str, znames: list[str]) -> list[int]:
+        """Adds cell zones to the region
 
-        idList = self._xmlTree.xpath(f'.//x:cellZones/x:cellZone/@czid', namespaces={'x': ns})
+        Args:
+            rname: region name
+            znames: names of the cell zones
 
-        for index in range(1, self.CELL_ZONE_MAX_INDEX):
-            if str(index) not in idList:
-                break
-        else:
-            raise OverflowError
+        Returns:
+            czid of the cell zones added
+
+        Raises:
+            LookupError: The region does not exist
+            FileExistsError: A cell zone of the name already exists in the region
+            OverflowError: No more cell zone can be added
+        """
+        region = self._index.region(rname)
+        if region is None:
+            raise LookupError
 
-        # 'region' cannot be None because zoneTree lookup above succeeded
-        cellZones = self._xmlTree.find(f'.//region[name="{rname}"]/cellZones', namespaces=nsmap)
+        cellZones = region.find('cellZones', namespaces=nsmap)
 
-        zoneTree = etree.parse(resource.file(self.CELL_ZONE_PATH), self._xmlParser)
-        zone = zoneTree.getroot()
-        zone.find('name', namespaces=nsmap).text = zname
-        zone.attrib['czid'] = str(index)
+        indexes = []
+        zones = []
+        for zname in znames:
+            if self._index.cellZoneByName(rname, zname) is not None:
+                raise FileExistsError
 
-        cellZones.append(zone)
+            index = self._index.availableCzid()
 
-        self._configCount += 1
+            zone = self._template(self.CELL_ZONE_PATH)
+            zone.find('name', namespaces=nsmap).text = zname
+            zone.attrib['czid'] = str(index)
 
-        self._xmlSchema.assertValid(self._xmlTree)
+            self.appendChild(cellZones, zone)
 
-        return index
+            indexes.append(index)
+            zones.append(zone)
+
+        self._configCount += len(zones)
+
+        self._validateElements(cellZones, zones)
+
+        return indexes
 
     def getCellZones(self, rname: str) -> list[(int, str)]:
-        elements = self._xmlTree.findall(f'.//region[name="{rname}"]/cellZones/cellZone', namespaces=nsmap)
+        region = self._index.region(rname)
+        if region is None:
+            return []
+
+        elements = region.findall('cellZones/cellZone', namespaces=nsmap)
         return [(int(e.attrib['czid']), e.find('name', namespaces=nsmap).text) for e in elements]
 
     def getCellZonesByType(self, rname: str, zoneType: str) -> list[(int)]:
@@ -642,39 +681,56 @@ class _CoreDB(object):
         return [e.attrib['czid'] for e in elements]
 
     def addBoundaryCondition(self, rname: str, bname: str, geometricalType: str, physicalType: str) -> int:
-        bc = self._xmlTree.find(f'.//region[name="{rname}"]/boundaryConditions/boundaryCondition[name="{bname}"]',
-                                namespaces=nsmap)
+        return self.addBoundaryConditions(rname, [(bname, geometricalType, physicalType)])[0]
 
-        if bc is not None:
-            raise FileExistsError
+    def addBoundaryConditions(self, rname: str, boundaries: list[(str, str, str)]) -> list[int]:
+        """Adds boundary conditions to the region
 
-        idList = self._xmlTree.xpath(f'.//x:boundaryConditions/x:boundaryCondition/@bcid', namespaces={'x': ns})
+        Args:
+            rname: region name
+            boundaries: boundary conditions to add in tuple, '(name, geometricalType, physicalType)'
 
-        for index in range(1, self.BOUNDARY_CONDITION_MAX_INDEX):
-            if str(index) not in idList:
-                break
-        else:
-            raise OverflowError
+        Returns:
+            bcid of the boundary conditions added
 
-        parent = self._xmlTree.find(f'.//region[name="{rname}"]/boundaryConditions', namespaces=nsmap)
+        Raises:
+            LookupError: The region does not exist
+            FileExistsError: A boundary condition of the name already exists in the region
+            OverflowError: No more boundary condition can be added
+        """
+        region = self._index.region(rname)
+        if region is None:
+            raise LookupError
 
-        bcTree = etree.parse(resource.file(self.BOUNDARY_CONDITION_PATH), self._xmlParser)
-        bc = bcTree.getroot()
-        bc.find('name', namespaces=nsmap).text = bname
-        bc.attrib['bcid'] = str(index)
+        parent = region.find('boundaryConditions', namespaces=nsmap)
 
-        if geometricalType is not None:
-            bc.find('geometricalType', namespaces=nsmap).text = geometricalType
+        indexes = []
+        elements = []
+        for bname, geometricalType, physicalType in boundaries:
+            if self._index.boundaryConditionByName(rname, bname) is not None:
+                raise FileExistsError
 
-        bc.find('physicalType', namespaces=nsmap).text = physicalType
+            index = self._index.availableBcid()
 
-        parent.append(bc)
+            bc = self._template(self.BOUNDARY_CONDITION_PATH)
+            bc.find('name', namespaces=nsmap).text = bname
+            bc.attrib['bcid'] = str(index)
 
-        self._configCount += 1
+            if geometricalType is not None:
+                bc.find('geometricalType', namespaces=nsmap).text = geometricalType
 
-        self._xmlSchema.assertValid(self._xmlTree)
+            bc.find('physicalType', namespaces=nsmap).text = physicalType
 
-        return index
+            self.appendChild(parent, bc)
+
+            indexes.append(index)
+            elements.append(bc)
+
+        self._configCount += len(elements)
+
+        self._validateElements(parent, elements)
+
+        return indexes
 
     def getBoundaryConditions(self, rname: str) -> list[(int, str, str)]:
         """Returns list of boundary conditions in the region
@@ -687,8 +743,11 @@ class _CoreDB(object):
         Returns:
             List of boundary conditions in tuple, '(bcid, name, physicalType)'
         """
-        elements = self._xmlTree.findall(
-            f'.//region[name="{rname}"]/boundaryConditions/boundaryCondition', namespaces=nsmap)
+        region = self._index.region(rname)
+        if region is None:
+            return []
+
+        elements = region.findall('boundaryConditions/boundaryCondition', namespaces=nsmap)
         return [(int(e.attrib['bcid']),
                  e.find('name', namespaces=nsmap).text,
                  e.find('physicalType', namespaces=nsmap).text) for e in elements]
@@ -715,7 +774,10 @@ class _CoreDB(object):
         new.set('bcid', str(targetID))
         new.find('name', namespaces=nsmap).text = old.find('name', namespaces=nsmap).text
         new.find('geometricalType', namespaces=nsmap).text = old.find('geometricalType', namespaces=nsmap).text
-        old.getparent().replace(old, new)
+        old.addnext(new)
+        self._journal.recordPosition(new)
+        self.removeChild(old)
+        self._index.added(new)
 
     def hasMesh(self):
         return True if self._xmlTree.findall(f'.//regions/region', namespaces=nsmap) else False
@@ -735,11 +797,11 @@ class _CoreDB(object):
         forceTree = etree.parse(resource.file(self.FORCE_MONITOR_PATH), self._xmlParser)
         forceTree.find('name', namespaces=nsmap).text = monitorName
 
-        parent.append(forceTree.getroot())
+        self.appendChild(parent, forceTree.getroot())
 
         self._configCount += 1
 
-        self._xmlSchema.assertValid(self._xmlTree)
+        self._validateElement(forceTree.getroot())
 
         return monitorName
 
@@ -748,8 +810,7 @@ class _CoreDB(object):
         if monitor is None:
             raise LookupError
 
-        parent = self._xmlTree.find(f'.//monitors/forces', namespaces=nsmap)
-        parent.remove(monitor)
+        self.removeChild(monitor)
 
         self._configCount += 1
 
@@ -759,7 +820,7 @@ class _CoreDB(object):
 
     def clearForceMonitors(self):
         parent = self._xmlTree.find('.//monitors/forces', namespaces=nsmap)
-        parent.clear()
+        self.clearChildren(parent)
 
     def addPointMonitor(self) -> str:
         names = self.getPointMonitors()
@@ -776,11 +837,11 @@ class _CoreDB(object):
         pointTree = etree.parse(resource.file(self.POINT_MONITOR_PATH), self._xmlParser)
         pointTree.find('name', namespaces=nsmap).text = monitorName
 
-        parent.append(pointTree.getroot())
+        self.appendChild(parent, pointTree.getroot())
 
         self._configCount += 1
 
-        self._xmlSchema.assertValid(self._xmlTree)
+        self._validateElement(pointTree.getroot())
 
         return monitorName
 
@@ -789,8 +850,7 @@ class _CoreDB(object):
         if monitor is None:
             raise LookupError
 
-        parent = self._xmlTree.find(f'.//monitors/points', namespaces=nsmap)
-        parent.remove(monitor)
+        self.removeChild(monitor)
 
         self._configCount += 1
 
@@ -800,7 +860,7 @@ class _CoreDB(object):
 
     def clearPointMonitors(self):
         parent = self._xmlTree.find('.//monitors/points', namespaces=nsmap)
-        parent.clear()
+        self.clearChildren(parent)
 
     def addSurfaceMonitor(self) -> str:
         names = self.getSurfaceMonitors()
@@ -817,11 +877,11 @@ class _CoreDB(object):
         surfaceTree = etree.parse(resource.file(self.SURFACE_MONITOR_PATH), self._xmlParser)
         surfaceTree.find('name', namespaces=nsmap).text = monitorName
 
-        parent.append(surfaceTree.getroot())
+        self.appendChild(parent, surfaceTree.getroot())
 
         self._configCount += 1
 
-        self._xmlSchema.assertValid(self._xmlTree)
+        self._validateElement(surfaceTree.getroot())
 
         return monitorName
 
@@ -830,8 +890,7 @@ class _CoreDB(object):
         if monitor is None:
             raise LookupError
 
-        parent = self._xmlTree.find(f'.//monitors/surfaces', namespaces=nsmap)
-        parent.remove(monitor)
+        self.removeChild(monitor)
 
         self._configCount += 1
 
@@ -841,7 +900,7 @@ class _CoreDB(object):
 
     def clearSurfacesMonitors(self):
         parent = self._xmlTree.find('.//monitors/surfaces', namespaces=nsmap)
-        parent.clear()
+        self.clearChildren(parent)
 
     def addVolumeMonitor(self) -> str:
         names = self.getVolumeMonitors()
@@ -858,11 +917,11 @@ class _CoreDB(object):
         volumeTree = etree.parse(resource.file(self.VOLUME_MONITOR_PATH), self._xmlParser)
         volumeTree.find('name', namespaces=nsmap).text = monitorName
 
-        parent.append(volumeTree.getroot())
+        self.appendChild(parent, volumeTree.getroot())
 
         self._configCount += 1
 
-        self._xmlSchema.assertValid(self._xmlTree)
+        self._validateElement(volumeTree.getroot())
 
         return monitorName
 
@@ -871,8 +930,7 @@ class _CoreDB(object):
         if monitor is None:
             raise LookupError
 
-        parent = self._xmlTree.find(f'.//monitors/volumes', namespaces=nsmap)
-        parent.remove(monitor)
+        self.removeChild(monitor)
 
         self._configCount += 1
 
@@ -882,7 +940,7 @@ class _CoreDB(object):
 
     def clearVolumeMonitors(self):
         parent = self._xmlTree.find('.//monitors/volumes', namespaces=nsmap)
-        parent.clear()
+        self.clearChildren(parent)
 
     def clearMonitors(self):
         self.clearForceMonitors()
@@ -952,14 +1010,14 @@ class _CoreDB(object):
             '       </laminarAndTurbulentViscosity>'
             '  </diffusivity>'
             '</scalar>')
-        parent.append(scalar)
+        self.appendChild(parent, scalar)
 
         parent = self._xmlTree.find('general/atmosphericBoundaryLayer/userDefinedScalars', namespaces=nsmap)
         scalar = etree.fromstring('<scalar xmlns="http://www.baramcfd.org/baram">'
                                   f' <scalarID>{scalarID}</scalarID>'
                                   '  <value>0</value>'
                                   '</scalar>')
-        parent.append(scalar)
+        self.appendChild(parent, scalar)
 
         for parent in self._xmlTree.findall('regions/region/cellZones/cellZone/sourceTerms/userDefinedScalars',
                                             namespaces=nsmap):
@@ -971,7 +1029,7 @@ class _CoreDB(object):
                                       '  <piecewiseLinear><t>0</t><v>0</v></piecewiseLinear>'
                                       '  <polynomial>0</polynomial>'
                                       '</scalarSource>')
-            parent.append(source)
+            self.appendChild(parent, source)
 
         for parent in self._xmlTree.findall('regions/region/cellZones/cellZone/fixedValues/userDefinedScalars',
                                             namespaces=nsmap):
@@ -979,7 +1037,7 @@ class _CoreDB(object):
                                       f' <scalarID>{scalarID}</scalarID>'
                                       '  <value disabled="true">0</value>'
                                       '</scalar>')
-            parent.append(scalar)
+            self.appendChild(parent, scalar)
 
         for parent in self._xmlTree.findall('regions/region/boundaryConditions/boundaryCondition/userDefinedScalars',
                                             namespaces=nsmap):
@@ -987,7 +1045,7 @@ class _CoreDB(object):
                                       f' <scalarID>{scalarID}</scalarID>'
                                       '  <value>0</value>'
                                       '</scalar>')
-            parent.append(scalar)
+            self.appendChild(parent, scalar)
 
         for parent in self._xmlTree.findall('regions/region/initialization/initialValues/userDefinedScalars',
                                             namespaces=nsmap):
@@ -995,7 +1053,7 @@ class _CoreDB(object):
                                       f' <scalarID>{scalarID}</scalarID>'
                                       '  <value disabled="true">0</value>'
                                       '</scalar>')
-            parent.append(scalar)
+            self.appendChild(parent, scalar)
 
         for parent in self._xmlTree.findall('regions/region/initialization/advanced/sections/section/userDefinedScalars',
                                             namespaces=nsmap):
@@ -1003,7 +1061,7 @@ class _CoreDB(object):
                                       f' <scalarID>{scalarID}</scalarID>'
                                       '  <value disabled="true">0</value>'
                                       '</scalar>')
-            parent.append(scalar)
+            self.appendChild(parent, scalar)
         #
         # parent = self._getElement('numericalConditions/underRelaxationFactors/userDefinedScalars')
         # scalar = etree.fromstring('<scalar xmlns="http://www.baramcfd.org/baram">'
@@ -1023,30 +1081,30 @@ class _CoreDB(object):
 
     def removeUserDefinedScalar(self, scalarID):
         parent = self.getElement('models/userDefinedScalars')
-        parent.remove(parent.find(f'scalar[@scalarID="{scalarID}"]', namespaces=nsmap))
+        self.removeChild(parent.find(f'scalar[@scalarID="{scalarID}"]', namespaces=nsmap))
 
         parent = self._xmlTree.find('general/atmosphericBoundaryLayer/userDefinedScalars', namespaces=nsmap)
-        parent.remove(parent.find(f'scalar[scalarID="{scalarID}"]', namespaces=nsmap))
+        self.removeChild(parent.find(f'scalar[scalarID="{scalarID}"]', namespaces=nsmap))
 
         for parent in self._xmlTree.findall('regions/region/cellZones/cellZone/sourceTerms/userDefinedScalars',
                                             namespaces=nsmap):
-            parent.remove(parent.find(f'scalarSource[scalarID="{scalarID}"]', namespaces=nsmap))
+            self.removeChild(parent.find(f'scalarSource[scalarID="{scalarID}"]', namespaces=nsmap))
 
         for parent in self._xmlTree.findall('regions/region/cellZones/cellZone/fixedValues/userDefinedScalars',
                                             namespaces=nsmap):
-            parent.remove(parent.find(f'scalar[scalarID="{scalarID}"]', namespaces=nsmap))
+            self.removeChild(parent.find(f'scalar[scalarID="{scalarID}"]', namespaces=nsmap))
 
         for parent in self._xmlTree.findall('regions/region/boundaryConditions/boundaryCondition/userDefinedScalars',
                                             namespaces=nsmap):
-            parent.remove(parent.find(f'scalar[scalarID="{scalarID}"]', namespaces=nsmap))
+            self.removeChild(parent.find(f'scalar[scalarID="{scalarID}"]', namespaces=nsmap))
 
         for parent in self._xmlTree.findall('regions/region/initialization/initialValues/userDefinedScalars',
                                             namespaces=nsmap):
-            parent.remove(parent.find(f'scalar[scalarID="{scalarID}"]', namespaces=nsmap))
+            self.removeChild(parent.find(f'scalar[scalarID="{scalarID}"]', namespaces=nsmap))
 
         for parent in self._xmlTree.findall('regions/region/initialization/advanced/sections/section/userDefinedScalars',
                                             namespaces=nsmap):
-            parent.remove(parent.find(f'scalar[scalarID="{scalarID}"]', namespaces=nsmap))
+            self.removeChild(parent.find(f'scalar[scalarID="{scalarID}"]', namespaces=nsmap))
         #
         # parent = self._getElement('numericalConditions/underRelaxationFactors/userDefinedScalars')
         # parent.remove(parent.find(f'scalar[scalarID="{scalarID}"]', namespaces=nsmap))
@@ -1058,19 +1116,20 @@ class _CoreDB(object):
         parent = self.getElement('models/userDefinedScalars')
         for element in parent.findall('scalar', namespaces=nsmap):
             if element.get('scalarID') != '0':
-                parent.remove(element)
+                self.removeChild(element)
 
         parent = self._xmlTree.find('general/atmosphericBoundaryLayer/userDefinedScalars', namespaces=nsmap)
-        parent.clear()
+        self.clearChildren(parent)
 
     def addElementFromString(self, xpath, text):
         parent = self._xmlTree.find(xpath, namespaces=nsmap)
         if parent is None:
             raise LookupError
 
-        parent.append(etree.fromstring(text))
+        element = etree.fromstring(text)
+        self.appendChild(parent, element)
 
-        self._xmlSchema.assertValid(self._xmlTree)
+        self._validateElement(element)
 
         self._configCount += 1
 
@@ -1079,8 +1138,7 @@ class _CoreDB(object):
         if element is None:
             return
 
-        parent = self._xmlTree.find(xpath+'/..', namespaces=nsmap)
-        parent.remove(element)
+        self.removeChild(element)
 
         self._configCount += 1
 
@@ -1089,7 +1147,70 @@ class _CoreDB(object):
         if element is None:
             raise LookupError
 
+        self._journal.recordContent(element)
         element.clear()
+        self._index.invalidate()
+
+    def appendChild(self, parent, element):
+        """Appends the element to the parent
+
+        Elements of the configuration should be added or removed through CoreDB methods
+        so that the changes can be rolled back.
+        """
+        parent.append(element)
+        self._journal.recordPosition(element)
+        self._index.added(element)
+
+    def removeChild(self, element):
+        self._journal.recordPosition(element)
+        parent = element.getparent()
+        parent.remove(element)
+        self._index.removed(element, parent)
+
+    def clearChildren(self, element):
+        for child in list(element):
+            self.removeChild(child)
+
+    def setText(self, element, text):
+        self._journal.recordText(element)
+        element.text = text
+        self._textChanged(element)
+
+    def canUndo(self) -> bool:
+        return self._journal.canUndo()
+
+    def canRedo(self) -> bool:
+        return self._journal.canRedo()
+
+    def undo(self):
+        """Reverts the changes made in the last transaction
+
+        Transactions are the changes made in "with" context.
+
+        Raises:
+            RuntimeError: Called in "with" context
+            IndexError: No transaction to undo
+        """
+        if self._inContext:
+            raise RuntimeError
+
+        self._journal.undo()
+        self._index.invalidate()
+        self._configCount += 1
+
+    def redo(self):
+        """Reapplies the changes of the last undone transaction
+
+        Raises:
+            RuntimeError: Called in "with" context
+            IndexError: No transaction to redo
+        """
+        if self._inContext:
+            raise RuntimeError
+
+        self._journal.redo()
+        self._index.invalidate()
+        self._configCount += 1
 
     def getList(self, xpath) -> list[str]:
         return [e.text for e in self._xmlTree.findall(xpath, namespaces=nsmap)]
@@ -1121,7 +1242,20 @@ class _CoreDB(object):
     def configCount(self) -> int:
         return self._configCount
 
+    def validateAll(self):
+        """Validates whole configuration tree
+
+        Changes are validated only for the changed subtree when they are made.
+        This checks the relations between the subtrees as well, such as the order and the number of elements.
+
+        Raises:
+            DocumentInvalid: Configuration tree does not conform to the schema
+        """
+        self._xmlSchema.assertValid(self._xmlTree)
+
     def saveAs(self, path: str):
+        self.validateAll()
+
         f = h5py.File(path, 'w')
         try:
             dt = h5py.string_dtype(encoding='utf-8')
@@ -1135,6 +1269,8 @@ class _CoreDB(object):
         self._configCountAtSave = self._configCount
 
     def save(self, path: str):
+        self.validateAll()
+
         with h5py.File(path, 'a') as f:
             if 'configuration' in f.keys():
                 del f['configuration']
@@ -1154,23 +1290,111 @@ class _CoreDB(object):
 
             tree = etree.ElementTree(root)
             self._xmlSchema.assertValid(tree)
-            self._xmlTree = tree
+            self._setTree(tree)
+            self._journal.clear()
 
         self._configCountAtSave = self._configCount
 
     def loadDefault(self):
-        self._xmlTree = etree.parse(resource.file(self.XML_PATH), self._xmlParser)
+        self._setTree(etree.parse(resource.file(self.XML_PATH), self._xmlParser))
+        self._journal.clear()
         # Add 'air' as default material
         # self.addMaterial('air', 'air')
 
         self._configCountAtSave = self._configCount
 
     def getElement(self, xpath):
-        element = self._xmlTree.find(xpath, namespaces=nsmap)
+        try:
+            element = self._index.find(xpath)
+        except KeyError:    # Not indexed
+            element = None
+
         if element is None:
-            raise LookupError
+            element = self._xmlTree.find(xpath, namespaces=nsmap)
+            if element is None:
+                raise LookupError
 
         return element
 
     def getElements(self, xpath):
         return self._xmlTree.findall(xpath, namespaces=nsmap)
+
+    def readOnlyCopy(self) -> _CoreDB:
+        """Returns a copy of the configuration that refuses changes
+
+        The copy has its own tree and indexes, and shares only the schema with this.
+        """
+        db = copy.copy(self)
+        db._setTree(copy.deepcopy(self._xmlTree))
+        db._journal = ReadOnlyJournal()
+
+        return db
+
+    def _setTree(self, tree):
+        self._xmlTree = tree
+        self._index = ElementIndex(tree, self.BOUNDARY_CONDITION_MAX_INDEX, self.CELL_ZONE_MAX_INDEX)
+
+    def _template(self, path):
+        """Returns a copy of the element parsed from the resource file, which is parsed only once"""
+        if path not in self._templates:
+            self._templates[path] = etree.parse(resource.file(path), self._xmlParser).getroot()
+
+        return copy.deepcopy(self._templates[path])
+
+    def _textChanged(self, element):
+        if element.tag == NAME_TAG and (parent := element.getparent()) is not None:
+            if parent.tag in (REGION_TAG, BOUNDARY_CONDITION_TAG, CELL_ZONE_TAG):
+                self._index.invalidate()
+
+    def _elementPath(self, element):
+        """Returns the path of the element without positional predicates
+
+        getelementpath() counts the preceding siblings for the positions,
+        which makes it slow for the elements with many siblings such as boundary conditions.
+
+        Raises:
+            ValueError: The element is not in the configuration tree
+        """
+        root = self._xmlTree.getroot()
+        tags = []
+        while element is not root:
+            if element is None:
+                raise ValueError
+
+            tags.append(element.tag)
+            element = element.getparent()
+
+        return '/'.join(reversed(tags))
+
+    def _validateElements(self, parent, elements):
+        """Validates the elements added to the parent
+
+        If the elements are most of the children of the parent, like the boundary conditions of a mesh imported,
+        the whole configuration is validated once by the compiled schema,
+        which takes less time than validating the elements one by one.
+        """
+        if len(elements) > 1 and len(elements) * 2 > len(parent):
+            self._xmlSchema.assertValid(self._xmlTree)
+        else:
+            for element in elements:
+                self._validateElement(element)
+
+    def _validateElement(self, element):
+        """Validates the subtree of the element against its schema type
+
+        Only the subtree is validated, so the cost does not depend on the size of the configuration.
+
+        Raises:
+            LookupError: No schema definition for the element
+            DocumentInvalid: Subtree does not conform to the schema
+        """
+        schema = self._schemaIndex.find(self._elementPath(element))
+
+        if schema is None:
+            raise LookupError
+
+        if schema.isGlobal:
+            # Subtrees of global elements can be validated by the compiled schema
+            self._xmlSchema.assertValid(element)
+        elif error := next(schema.element.iter_errors(element), None):
+            raise etree.DocumentInvalid(str(error))
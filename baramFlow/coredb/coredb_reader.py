@@ -1,8 +1,12 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import hashlib
+from contextlib import contextmanager
+from contextvars import ContextVar
 from threading import Lock
 
+from lxml import etree
 from PySide6.QtCore import QCoreApplication
 
 from baramFlow.coredb import coredb
@@ -14,6 +18,7 @@ from baramFlow.coredb.region_db import RegionDB
 from baramFlow.libbaram.calculation import AverageCalculator
 
 _mutex = Lock()
+_snapshot: ContextVar = ContextVar('snapshot', default=None)
 
 
 class Region:
@@ -132,6 +137,9 @@ class Region:
 
 class CoreDBReader(_CoreDB):
     def __new__(cls, *args, **kwargs):
+        if (reader := _snapshot.get()) is not None:
+            return reader
+
         with _mutex:
             if not hasattr(cls, '_instance'):
                 cls._instance = super(CoreDBReader, cls).__new__(cls, *args, **kwargs)
@@ -147,17 +155,63 @@ class CoreDBReader(_CoreDB):
 
         super().__init__()
 
-        self._xmlTree = coredb.CoreDB()._xmlTree
+        self.reloadCoreDB()
         self._arguments = self.getBatchDefaults()
 
     def reloadCoreDB(self):
+        # The index is shared too, which is kept by CoreDB as it changes the tree
         self._xmlTree = coredb.CoreDB()._xmlTree
+        self._index = coredb.CoreDB()._index
+
+    @contextmanager
+    def snapshot(self):
+        """Makes the configuration read in the current context a read-only copy taken on entering
+
+        In the context, CoreDBReader() returns a reader of the copy, and coredb.CoreDB() returns the copy,
+        so the lookups of RegionDB, MaterialDB, BoundaryDB and others read the copy too.
+        The copy can be read from worker threads concurrently while the configuration is being edited,
+        and readers in other contexts keep reading the configuration.
+        Threads read the copy only if they are run in copies of the context, by contextvars.copy_context().
+        """
+        with coredb.snapshot() as db:
+            # Not by copy.copy(), which would make the object by __new__() returning this singleton
+            reader = object.__new__(CoreDBReader)
+            reader.__dict__.update(self.__dict__)
+            reader._arguments = dict(self._arguments)
+            reader._xmlTree = db._xmlTree
+            reader._index = db._index
+            reader._journal = db._journal
+
+            token = _snapshot.set(reader)
+            try:
+                yield reader
+            finally:
+                _snapshot.reset(token)
 
     def setParameters(self, arguments=None):
         self._arguments = self.getBatchDefaults()
         if arguments:
             self._arguments.update(arguments)
 
+    def contentHash(self, xpaths) -> str:
+        """Returns the hash of the configurations in the xpaths, with the values of the batch parameters
+
+        Args:
+            xpaths: xpaths of the elements, each of which can match any number of elements
+
+        Returns:
+            Hash string
+        """
+        h = hashlib.sha1()
+        for xpath in xpaths:
+            for element in self.getElements(xpath):
+                h.update(etree.tostring(element))
+
+        # Configurations have the names of the batch parameters, not the values
+        h.update(repr(sorted(self._arguments.items())).encode())
+
+        return h.hexdigest()
+
     def getValue(self, xpath):
         value = super().getValue(xpath)
         if value == '' or value[0] != '$':
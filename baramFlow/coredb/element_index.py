@@ -0,0 +1,249 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import re
+from threading import Lock
+
+from .libdb import nsmap, ns
+
+
+REGION_TAG = f'{{{ns}}}region'
+BOUNDARY_CONDITION_TAG = f'{{{ns}}}boundaryCondition'
+CELL_ZONE_TAG = f'{{{ns}}}cellZone'
+NAME_TAG = f'{{{ns}}}name'
+
+# XPaths made by RegionDB, BoundaryDB and CellZoneDB, followed by the path under the element
+_REGION_PATTERN = re.compile(r'/regions/region\[name="([^"]*)"\](?:/(.+))?')
+_BOUNDARY_PATTERN = re.compile(r'/regions/region/boundaryConditions/boundaryCondition\[@bcid="(\d+)"\](?:/(.+))?')
+_BOUNDARY_NAME_PATTERN = re.compile(
+    r'/regions/region\[name="([^"]*)"\]/boundaryConditions/boundaryCondition\[name="([^"]*)"\](?:/(.+))?')
+_CELL_ZONE_PATTERN = re.compile(r'/regions/region/cellZones/cellZone\[@czid="(\d+)"\](?:/(.+))?')
+_CELL_ZONE_NAME_PATTERN = re.compile(
+    r'/regions/region\[name="([^"]*)"\]/cellZones/cellZone\[name="([^"]*)"\](?:/(.+))?')
+
+
+class _IdAllocator:
+    """Smallest ids not in use, found from the lowest id that may be free"""
+    def __init__(self, maxIndex):
+        self._maxIndex = maxIndex
+        self._lowest = 1
+
+    def reset(self):
+        self._lowest = 1
+
+    def release(self, id_):
+        self._lowest = min(self._lowest, int(id_))
+
+    def available(self, used):
+        for index in range(self._lowest, self._maxIndex):
+            if str(index) not in used:
+                self._lowest = index
+                return index
+
+        raise OverflowError
+
+
+class ElementIndex:
+    """Hash indexes of regions, boundary conditions and cell zones of a configuration tree
+
+    Elements are indexed by region name, bcid, czid, and (region name, name).
+    CoreDB updates the indexes as it adds or removes the elements,
+    and invalidates them on the changes it cannot follow, such as undo,
+    then the indexes are built again from the tree on the next lookup.
+    Elements found are checked to be still in the tree with the same key, so a stale index is never trusted.
+    """
+    def __init__(self, tree, maxBoundaryConditions, maxCellZones):
+        self._tree = tree
+        self._valid = False
+        self._lock = Lock()
+
+        self._regions = {}
+        self._boundaries = {}
+        self._boundaryNames = {}
+        self._cellZones = {}
+        self._cellZoneNames = {}
+
+        self._bcidAllocator = _IdAllocator(maxBoundaryConditions)
+        self._czidAllocator = _IdAllocator(maxCellZones)
+
+    def invalidate(self):
+        self._valid = False
+
+    def region(self, rname):
+        return self._lookup(self._regions, rname, self._isRegion)
+
+    def boundaryCondition(self, bcid):
+        return self._lookup(self._boundaries, str(bcid), self._isBoundaryCondition)
+
+    def boundaryConditionByName(self, rname, bcname):
+        return self._lookup(self._boundaryNames, (rname, bcname), self._isBoundaryConditionNamed)
+
+    def cellZone(self, czid):
+        return self._lookup(self._cellZones, str(czid), self._isCellZone)
+
+    def cellZoneByName(self, rname, czname):
+        return self._lookup(self._cellZoneNames, (rname, czname), self._isCellZoneNamed)
+
+    def availableBcid(self):
+        self._ensure()
+        return self._bcidAllocator.available(self._boundaries)
+
+    def availableCzid(self):
+        self._ensure()
+        return self._czidAllocator.available(self._cellZones)
+
+    def find(self, xpath):
+        """Finds the element of the xpath using the indexes
+
+        Returns:
+            Element found, or None if the element does not exist
+
+        Raises:
+            KeyError: The xpath is not of the forms indexed
+        """
+        if match := _BOUNDARY_PATTERN.fullmatch(xpath):
+            element = self.boundaryCondition(match.group(1))
+            path = match.group(2)
+        elif match := _BOUNDARY_NAME_PATTERN.fullmatch(xpath):
+            element = self.boundaryConditionByName(match.group(1), match.group(2))
+            path = match.group(3)
+        elif match := _CELL_ZONE_PATTERN.fullmatch(xpath):
+            element = self.cellZone(match.group(1))
+            path = match.group(2)
+        elif match := _CELL_ZONE_NAME_PATTERN.fullmatch(xpath):
+            element = self.cellZoneByName(match.group(1), match.group(2))
+            path = match.group(3)
+        elif match := _REGION_PATTERN.fullmatch(xpath):
+            element = self.region(match.group(1))
+            path = match.group(2)
+        else:
+            raise KeyError
+
+        if element is None or path is None:
+            return element
+
+        return element.find(path, namespaces=nsmap)
+
+    def added(self, element):
+        """Indexes the element added to the tree, and the elements in its subtree"""
+        if self._valid:
+            self._add(element)
+
+    def removed(self, element, parent):
+        """Removes the element removed from the tree and the elements in its subtree from the indexes"""
+        if self._valid:
+            self._remove(element, parent)
+
+    def _add(self, element):
+        if element.tag == REGION_TAG:
+            rname = element.findtext('name', namespaces=nsmap)
+            self._regions[rname] = element
+            for child in element.iterfind('cellZones/cellZone', namespaces=nsmap):
+                self._addCellZone(rname, child)
+            for child in element.iterfind('boundaryConditions/boundaryCondition', namespaces=nsmap):
+                self._addBoundaryCondition(rname, child)
+        elif element.tag == BOUNDARY_CONDITION_TAG:
+            self._addBoundaryCondition(self._regionName(element), element)
+        elif element.tag == CELL_ZONE_TAG:
+            self._addCellZone(self._regionName(element), element)
+
+    def _remove(self, element, parent):
+        if element.tag == REGION_TAG:
+            rname = element.findtext('name', namespaces=nsmap)
+            self._regions.pop(rname, None)
+            for child in element.iterfind('cellZones/cellZone', namespaces=nsmap):
+                self._removeCellZone(rname, child)
+            for child in element.iterfind('boundaryConditions/boundaryCondition', namespaces=nsmap):
+                self._removeBoundaryCondition(rname, child)
+        elif element.tag == BOUNDARY_CONDITION_TAG:
+            self._removeBoundaryCondition(parent.getparent().findtext('name', namespaces=nsmap), element)
+        elif element.tag == CELL_ZONE_TAG:
+            self._removeCellZone(parent.getparent().findtext('name', namespaces=nsmap), element)
+
+    def _ensure(self):
+        # Built once even if looked up from worker threads at the same time
+        if not self._valid:
+            with self._lock:
+                if not self._valid:
+                    self._build()
+
+    def _build(self):
+        self._regions.clear()
+        self._boundaries.clear()
+        self._boundaryNames.clear()
+        self._cellZones.clear()
+        self._cellZoneNames.clear()
+        self._bcidAllocator.reset()
+        self._czidAllocator.reset()
+
+        for region in self._tree.getroot().iterfind('regions/region', namespaces=nsmap):
+            self._add(region)
+
+        self._valid = True
+
+    def _lookup(self, index, key, isValid):
+        self._ensure()
+        element = index.get(key)
+        if element is not None and not isValid(element, key):
+            self._valid = False
+            self._ensure()
+            element = index.get(key)
+
+        return element
+
+    def _addBoundaryCondition(self, rname, element):
+        bcname = element.findtext('name', namespaces=nsmap)
+        self._boundaries[element.get('bcid')] = element
+        self._boundaryNames[(rname, bcname)] = element
+
+    def _removeBoundaryCondition(self, rname, element):
+        bcid = element.get('bcid')
+        bcname = element.findtext('name', namespaces=nsmap)
+        if self._boundaries.get(bcid) is element:
+            del self._boundaries[bcid]
+            self._bcidAllocator.release(bcid)
+        if self._boundaryNames.get((rname, bcname)) is element:
+            del self._boundaryNames[(rname, bcname)]
+
+    def _addCellZone(self, rname, element):
+        czname = element.findtext('name', namespaces=nsmap)
+        self._cellZones[element.get('czid')] = element
+        self._cellZoneNames[(rname, czname)] = element
+
+    def _removeCellZone(self, rname, element):
+        czid = element.get('czid')
+        czname = element.findtext('name', namespaces=nsmap)
+        if self._cellZones.get(czid) is element:
+            del self._cellZones[czid]
+            self._czidAllocator.release(czid)
+        if self._cellZoneNames.get((rname, czname)) is element:
+            del self._cellZoneNames[(rname, czname)]
+
+    def _regionName(self, element):
+        return element.getparent().getparent().findtext('name', namespaces=nsmap)
+
+    def _inTree(self, element):
+        root = self._tree.getroot()
+        while (parent := element.getparent()) is not None:
+            element = parent
+
+        return element is root
+
+    def _isRegion(self, element, rname):
+        return element.findtext('name', namespaces=nsmap) == rname and self._inTree(element)
+
+    def _isBoundaryCondition(self, element, bcid):
+        return element.get('bcid') == bcid and self._inTree(element)
+
+    def _isBoundaryConditionNamed(self, element, key):
+        rname, bcname = key
+        return (element.findtext('name', namespaces=nsmap) == bcname
+                and self._regionName(element) == rname and self._inTree(element))
+
+    def _isCellZone(self, element, czid):
+        return element.get('czid') == czid and self._inTree(element)
+
+    def _isCellZoneNamed(self, element, key):
+        rname, czname = key
+        return (element.findtext('name', namespaces=nsmap) == czname
+                and self._regionName(element) == rname and self._inTree(element))
@@ -1,9 +1,13 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import hashlib
 import shutil
+from collections import OrderedDict
+from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
+from threading import RLock
 
 import pandas as pd
 import h5py
@@ -22,7 +26,29 @@ class FileFormatError(Exception):
     pass
 
 
+def _contentHash(df: pd.DataFrame):
+    return hashlib.sha1(pd.util.hash_pandas_object(df, index=False).to_numpy()).hexdigest()
+
+
+CACHE_SIZE = 32     # DataFrames kept decoded in memory
+
+
+@dataclass
+class _Entry:
+    """DataFrame put but not saved yet, with the attributes stored with it"""
+    df: pd.DataFrame
+    attrs: dict
+
+
 class FileDB:
+    """Tables and texts of the project stored in the configuration file along with CoreDB
+
+    The configuration file is kept open for reading while the project is open,
+    and the DataFrames read from it are cached, least recently used ones evicted.
+    Changes are journaled in memory and written only to the datasets changed when the project is saved,
+    so that unsaved changes are discarded when the project is closed without saving.
+    FileDB can be used by multiple threads.
+    """
     class Key(Enum):
         BATCH_CASES = 'BatchCases'
 
@@ -37,11 +63,18 @@ class FileDB:
 
     def __init__(self, projectPath):
         self._filePath = projectPath / self.FILE_NAME
-        self._tmpPath = projectPath / 'configuration'
         self._modifiedAfterSaved = False
 
-        if self._filePath.is_file():
-            shutil.copy(self._filePath, self._tmpPath)
+        self._lock = RLock()
+        self._store = None      # HDFStore of the configuration file opened for reading
+        self._keys = None       # Keys of the DataFrames in the configuration file
+        self._attrs = {}        # Attributes of the DataFrames in the configuration file
+        self._cache = OrderedDict()
+        self._journal = {}      # Key to _Entry put, or None if deleted
+        self._textJournal = {}  # Key to text put
+
+        # Working copy of the configuration file made by previous versions
+        (projectPath / 'configuration').unlink(missing_ok=True)
 
     @property
     def isModified(self):
@@ -52,81 +85,143 @@ class FileDB:
 
     def getFileContents(self, key):
         if key:
-            with pd.HDFStore(self._tmpPath) as store:
-                if f'/{key}' in store.keys():
-                    return store.get(key)
-                else:
+            return self.getDataFrame(key)
+
+    def getContentHash(self, key):
+        """Returns the hash of the contents of the file
+
+        The hash is stored with the contents when the file is put,
+        and calculated from the contents for the files put by previous versions.
+
+        Returns:
+            Hash string, or None if the file does not exist
+        """
+        if key:
+            with self._lock:
+                if (attrs := self._getAttrs(key)) is None:
                     return None
 
+                if 'contentHash' not in attrs:
+                    attrs['contentHash'] = _contentHash(self.getDataFrame(key))
+
+                return attrs['contentHash']
+
     def getUserFileName(self, key):
         if key:
-            with pd.HDFStore(self._tmpPath) as store:
-                if f'/{key}' in store.keys():
-                    return store.get_storer(key).attrs.fileName
-                else:
+            with self._lock:
+                if (attrs := self._getAttrs(key)) is None:
                     return None
 
+                return attrs.get('fileName')
+
     def putText(self, key, data):
-        with h5py.File(self._tmpPath, 'a') as f:
-            if key in f.keys():
-                del f[key]
-            f[key] = data
+        with self._lock:
+            self._textJournal[key] = data
 
         self._modifiedAfterSaved = True
 
     def getText(self, key):
-        try:
-            with h5py.File(self._tmpPath, 'r') as f:
-                ds = f[key]
-                return ds[()]
-        except KeyError:
-            return None
+        with self._lock:
+            if key in self._textJournal:
+                return self._textJournal[key]
+
+            if not self._filePath.is_file():
+                return None
+
+            self._close()   # Not to open the file by PyTables and h5py at the same time
+            try:
+                with h5py.File(self._filePath, 'r') as f:
+                    ds = f[key]
+                    return ds[()]
+            except KeyError:
+                return None
 
     def putDataFrame(self, name, df):
-        with pd.HDFStore(self._tmpPath) as store:
-            store.put(name, df)
+        with self._lock:
+            self._put(name, df, {})
 
         self._modifiedAfterSaved = True
 
     def getDataFrame(self, name):
-        with pd.HDFStore(self._tmpPath) as store:
-            if f'/{name}' in store.keys():
-                return store.get(name)
-            else:
+        with self._lock:
+            if name in self._journal:
+                entry = self._journal[name]
+                return None if entry is None else entry.df
+
+            if name in self._cache:
+                self._cache.move_to_end(name)
+                return self._cache[name]
+
+            if f'/{name}' not in self._savedKeys():
                 return None
 
+            df = self._open().get(name)
+            self._cache[name] = df
+            if len(self._cache) > CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+            return df
+
     def loadCoreDB(self):
         if coredb.loaded():
             raise AssertionError('Coredb has not been freed for a fresh load.')
 
         if self._filePath.is_file():
-            return coredb.loadDB(self._filePath)
+            with self._lock:
+                self._close()
+                return coredb.loadDB(self._filePath)
 
         raise FileNotFoundError
 
     def saveCoreDB(self):
         if coredb.loaded():
-            coredb.CoreDB().save(self._filePath)
-            shutil.copy(self._filePath, self._tmpPath)
+            with self._lock:
+                self._close()
+                coredb.CoreDB().save(self._filePath)
         else:
             raise AssertionError('CoreDB has not been created')
 
     def save(self):
-        self._save(self._filePath)
+        with self._lock:
+            self._save(self._filePath)
+
+            # The configuration file has the changes now
+            for key, entry in self._journal.items():
+                self._cache.pop(key, None)
+                self._attrs.pop(key, None)
+                if entry is not None:
+                    self._cache[key] = entry.df
+                    self._attrs[key] = entry.attrs
+            while len(self._cache) > CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+            self._keys = None
+            self._journal = {}
+            self._textJournal = {}
 
     def saveAs(self, directory):
-        self._save(directory / 'configuration.h5')
+        with self._lock:
+            path = directory / self.FILE_NAME
+            self._close()
+            if self._filePath.is_file():
+                shutil.copy(self._filePath, path)
+
+            self._save(path)
+
         self._modifiedAfterSaved = False
 
     def delete(self, key):
         if key:
-            path = f'/{key}'
-            with pd.HDFStore(self._tmpPath) as store:
-                if path in store.keys():
-                    del store[path]
+            with self._lock:
+                if self._has(key):
+                    self._journal[key] = None
 
             self._modifiedAfterSaved = True
 
+    def close(self):
+        with self._lock:
+            self._close()
+
     @classmethod
     def exists(cls, path):
         dbPath = path / cls.FILE_NAME
@@ -136,11 +231,11 @@ class FileDB:
     def _bcKey(self, bcid, role):
         return f'bc{bcid}{role.value}'
 
-    def _uniqKey(self, newKey, keys):
+    def _uniqKey(self, newKey):
         key = newKey
         i = 1
 
-        while f'/{key}' in keys:
+        while self._has(key):
             key = f'{newKey}_{i}'
             i += 1
 
@@ -151,18 +246,75 @@ class FileDB:
         if columnCount and len(df.columns) != columnCount:
             raise FileFormatError
 
-        with pd.HDFStore(self._tmpPath) as store:
-            key = self._uniqKey(key, store.keys())
-            store.put(key, df)
-            store.get_storer(key).attrs.fileName = filePath.name
+        with self._lock:
+            key = self._uniqKey(key)
+            self._put(key, df, {'fileName': filePath.name, 'contentHash': _contentHash(df)})
 
         self._modifiedAfterSaved = True
 
         return key
 
+    def _put(self, key, df, attrs):
+        self._journal[key] = _Entry(df, attrs)
+
+    def _has(self, key):
+        if key in self._journal:
+            return self._journal[key] is not None
+
+        return f'/{key}' in self._savedKeys()
+
+    def _getAttrs(self, key):
+        if key in self._journal:
+            entry = self._journal[key]
+            return None if entry is None else entry.attrs
+
+        if f'/{key}' not in self._savedKeys():
+            return None
+
+        if key not in self._attrs:
+            attrs = self._open().get_storer(key).attrs
+            self._attrs[key] = {name: getattr(attrs, name) for name in ('fileName', 'contentHash') if name in attrs}
+
+        return self._attrs[key]
+
+    def _savedKeys(self):
+        if self._keys is None:
+            self._keys = set(self._open().keys()) if self._filePath.is_file() else set()
+
+        return self._keys
+
+    def _open(self):
+        if self._store is None:
+            self._store = pd.HDFStore(self._filePath, mode='r')
+
+        return self._store
+
+    def _close(self):
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+
     def _save(self, filePath):
-        if self._tmpPath.is_file():
-            shutil.copy(self._tmpPath, filePath)
+        self._close()
+
+        if self._journal:
+            with pd.HDFStore(filePath, mode='a') as store:
+                keys = set(store.keys())
+                for key, entry in self._journal.items():
+                    if f'/{key}' in keys:
+                        store.remove(key)
+
+                    if entry is not None:
+                        store.put(key, entry.df)
+                        for name, value in entry.attrs.items():
+                            setattr(store.get_storer(key).attrs, name, value)
+
+        if self._textJournal:
+            with h5py.File(filePath, 'a') as f:
+                for key, data in self._textJournal.items():
+                    if key in f.keys():
+                        del f[key]
+                    f[key] = data
 
         coredb.CoreDB().save(filePath)
         self._modifiedAfterSaved = False
@@ -35,32 +35,32 @@ def getInitializationElement(rname):
 class MaterialObserver(IMaterialObserver):
     def specieAdded(self, db, mid, mixtureID):
         for mixture in db.getElements(f'{INITIALIZATION_XPATH}/initialValues/species/mixture[mid="{mixtureID}"]'):
-            mixture.append(xml.createElement('<specie xmlns="http://www.baramcfd.org/baram">'
-                                             f' <mid>{mid}</mid><value>0</value>'
-                                             '</specie>'))
+            db.appendChild(mixture, xml.createElement('<specie xmlns="http://www.baramcfd.org/baram">'
+                                                      f' <mid>{mid}</mid><value>0</value>'
+                                                      '</specie>'))
 
         for mixture in db.getElements(
                 f'{INITIALIZATION_XPATH}/advanced/sections/section/species/mixture[mid="{mixtureID}"]'):
-            mixture.append(xml.createElement('<specie xmlns="http://www.baramcfd.org/baram">'
-                                             f' <mid>{mid}</mid><value>0</value>'
-                                             '</specie>'))
+            db.appendChild(mixture, xml.createElement('<specie xmlns="http://www.baramcfd.org/baram">'
+                                                      f' <mid>{mid}</mid><value>0</value>'
+                                                      '</specie>'))
 
     def materialRemoving(self, db, mid: int):
         for volumeFraction in db.getElements(
                 f'{INITIALIZATION_XPATH}/initialValues/volumeFractions/volumeFraction[material="{mid}"]'):
-            volumeFraction.getparent().remove(volumeFraction)
+            db.removeChild(volumeFraction)
 
         for volumeFraction in db.getElements(
                 f'{INITIALIZATION_XPATH}/advanced/sections/section/volumeFractions/volumeFraction[material="{mid}"]'):
-            volumeFraction.getparent().remove(volumeFraction)
+            db.removeChild(volumeFraction)
 
     def specieRemoving(self, db, mid, primarySpecie):
         for specie in db.getElements(f'{INITIALIZATION_XPATH}/initialValues/species/mixture/specie[mid="{mid}"]'):
-            self._removeSpecieInComposition(primarySpecie, specie)
+            self._removeSpecieInComposition(db, primarySpecie, specie)
 
         for specie in db.getElements(
                 f'{INITIALIZATION_XPATH}/advanced/sections/section/species/mixture/specie[mid="{mid}"]'):
-            self._removeSpecieInComposition(primarySpecie, specie)
+            self._removeSpecieInComposition(db, primarySpecie, specie)
 
 
 class RegionMaterialObserver(IRegionMaterialObserver):
@@ -77,17 +77,17 @@ class RegionMaterialObserver(IRegionMaterialObserver):
 
         volumeFractions = xml.getElement(initialization, 'initialValues/volumeFractions')
         # volumeFractions.clear()
-        self._addVolumeFractions(volumeFractions, secondaries)
+        self._addVolumeFractions(db, volumeFractions, secondaries)
 
         initialSpecies = xml.getElement(initialization, 'initialValues/species')
-        initialSpecies.clear()
+        db.clearChildren(initialSpecies)
         if species:
-            initialSpecies.append(xml.createElement(initialValuesSpeciesXML))
+            db.appendChild(initialSpecies, xml.createElement(initialValuesSpeciesXML))
 
         for section in xml.getElements(initialization, 'advanced/sections/section'):
             volumeFractions = xml.getElement(section, 'volumeFractions')
             # volumeFractions.clear()
-            self._addVolumeFractions(volumeFractions, secondaries)
+            self._addVolumeFractions(db, volumeFractions, secondaries)
 
             if (not xml.getElements(section, '*[@disabled="false"]')
                     and not xml.getElements(section, 'userDefinedScalars/scalar/value[@disabled="false"]')):
@@ -103,13 +103,14 @@ class RegionMaterialObserver(IRegionMaterialObserver):
                             MaterialDB.getName(oldMaterial), xml.getText(section, 'name')))
 
             speciesElement = xml.getElement(section, 'species')
-            speciesElement.clear()
+            db.clearChildren(speciesElement)
             if species:
-                speciesElement.append(xml.createElement(sectionSpeicesXML))
+                db.appendChild(speciesElement, xml.createElement(sectionSpeicesXML))
 
-    def _addVolumeFractions(self, parent, mids):
+    def _addVolumeFractions(self, db, parent, mids):
         for mid in mids:
             if xml.getElement(parent, f'volumeFraction[material="{mid}"]') is None:
-                parent.append(xml.createElement('<volumeFraction xmlns="http://www.baramcfd.org/baram">'
-                                                f'  <material>{mid}</material><fraction>0</fraction>'
-                                                '</volumeFraction>'))
+                db.appendChild(parent,
+                               xml.createElement('<volumeFraction xmlns="http://www.baramcfd.org/baram">'
+                                                 f'  <material>{mid}</material><fraction>0</fraction>'
+                                                 '</volumeFraction>'))
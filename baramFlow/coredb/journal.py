@@ -0,0 +1,176 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from collections import deque
+
+
+UNDO_MAX_DEPTH = 100
+
+
+class _TextChange:
+    def __init__(self, element):
+        self._element = element
+        self._text = element.text
+
+    def revert(self):
+        self._element.text, self._text = self._text, self._element.text
+
+
+class _AttributeChange:
+    def __init__(self, element, name):
+        self._element = element
+        self._name = name
+        self._value = element.get(name)
+
+    def revert(self):
+        value = self._element.get(self._name)
+
+        if self._value is None:
+            self._element.attrib.pop(self._name, None)
+        else:
+            self._element.set(self._name, self._value)
+
+        self._value = value
+
+
+class _PositionChange:
+    """Insertion or removal of an element
+
+    Reverting removes the element if it is in the tree, or puts it back to its position otherwise.
+    """
+    def __init__(self, element):
+        self._element = element
+        self._parent = element.getparent()
+        self._previous = element.getprevious()
+
+    def revert(self):
+        if self._element.getparent() is None:
+            if self._previous is None:
+                self._parent.insert(0, self._element)
+            else:
+                self._previous.addnext(self._element)
+        else:
+            self._parent = self._element.getparent()
+            self._previous = self._element.getprevious()
+            self._parent.remove(self._element)
+
+
+class _ContentChange:
+    """Replacement of the whole content of an element
+
+    The text, the attributes and the children themselves are kept, not their copies,
+    so that the other changes recorded on the children refer to the elements in the tree when reverted.
+    """
+    def __init__(self, element):
+        self._element = element
+        self._content = self._takeContent()
+
+    def revert(self):
+        content = self._takeContent()
+
+        text, tail, attributes, children = self._content
+        self._element.clear()   # Children are detached, and kept in content
+        self._element.text = text
+        self._element.tail = tail
+        self._element.attrib.update(attributes)
+        self._element.extend(children)
+
+        self._content = content
+
+    def _takeContent(self):
+        return self._element.text, self._element.tail, dict(self._element.attrib), list(self._element)
+
+
+class Journal:
+    """Undo journal of configuration changes
+
+    Only the changes made in a transaction are recorded, with the elements they touched.
+    A transaction can be rolled back by reverting its changes in reverse order,
+    and committed transactions can be undone and redone.
+    """
+    def __init__(self, maxDepth=UNDO_MAX_DEPTH):
+        self._changes = None
+        self._undoStack = deque(maxlen=maxDepth)
+        self._redoStack = []
+
+    def inTransaction(self):
+        return self._changes is not None
+
+    def begin(self):
+        self._changes = []
+
+    def commit(self):
+        if self._changes:
+            self._undoStack.append(self._changes)
+            self._redoStack.clear()
+
+        self._changes = None
+
+    def rollback(self):
+        for change in reversed(self._changes):
+            change.revert()
+
+        self._changes = None
+
+    def clear(self):
+        self._changes = None
+        self._undoStack.clear()
+        self._redoStack.clear()
+
+    def canUndo(self):
+        return len(self._undoStack) > 0
+
+    def canRedo(self):
+        return len(self._redoStack) > 0
+
+    def undo(self):
+        changes = self._undoStack.pop()
+        for change in reversed(changes):
+            change.revert()
+
+        self._redoStack.append(changes)
+
+    def redo(self):
+        changes = self._redoStack.pop()
+        for change in changes:
+            change.revert()
+
+        self._undoStack.append(changes)
+
+    def recordText(self, element):
+        """Records the text of the element. Should be called before the text is changed"""
+        if self._changes is not None:
+            self._changes.append(_TextChange(element))
+
+    def recordAttribute(self, element, name):
+        """Records the attribute of the element. Should be called before the attribute is changed"""
+        if self._changes is not None:
+            self._changes.append(_AttributeChange(element, name))
+
+    def recordPosition(self, element):
+        """Records the position of the element. Should be called after insertion or before removal"""
+        if self._changes is not None:
+            self._changes.append(_PositionChange(element))
+
+    def recordContent(self, element):
+        """Records the whole content of the element. Should be called before the content is changed"""
+        if self._changes is not None:
+            self._changes.append(_ContentChange(element))
+
+
+class ReadOnlyJournal(Journal):
+    """Journal of a configuration that must not be changed, refusing every change recorded"""
+    def begin(self):
+        raise PermissionError('Read-only configuration')
+
+    def recordText(self, element):
+        raise PermissionError('Read-only configuration')
+
+    def recordAttribute(self, element, name):
+        raise PermissionError('Read-only configuration')
+
+    def recordPosition(self, element):
+        raise PermissionError('Read-only configuration')
+
+    def recordContent(self, element):
+        raise PermissionError('Read-only configuration')
@@ -49,9 +49,9 @@ class IMaterialObserver(QObject):
     def specieRemoving(self, db, mid: int, primarySpecie):
         pass
 
-    def _removeSpecieInComposition(self, primarySpecie, specieElement):
+    def _removeSpecieInComposition(self, db, primarySpecie, specieElement):
         mixture = specieElement.getparent()
-        mixture.remove(specieElement)
+        db.removeChild(specieElement)
 
         allZero = True
         for specie in xml.getElements(mixture, 'specie'):
@@ -59,7 +59,7 @@ class IMaterialObserver(QObject):
 
         if allZero:
             element = xml.getElement(mixture, f'specie[mid="{primarySpecie}"]')
-            xml.setText(element, 'value', '1')
+            db.setText(xml.getElement(element, 'value'), '1')
 
 
 def _rootElement():
@@ -175,7 +175,8 @@ class MaterialDB(object):
     def addMaterial(cls, db, template: str) -> int:
         mid = _newID(db)
         name = _newName(db, template)
-        _rootElement().append(
+        db.appendChild(
+            _rootElement(),
             xml.createElement(
                 _materialTemplates.materialXML(mid, 'name', template, MaterialTemplates.DEFAULT_NONMIXTURE_SPEC)))
 
@@ -188,7 +189,8 @@ class MaterialDB(object):
         materials = _rootElement()
 
         mid = _newID(db)
-        materials.append(
+        db.appendChild(
+            materials,
             xml.createElement(
                 _materialTemplates.materialXML(
                     mid, _newName(db, name),
@@ -200,7 +202,8 @@ class MaterialDB(object):
         specieXML = _materialTemplates.specieXML(mid)
         for specie in species:
             sid = _newID(db)
-            materials.append(
+            db.appendChild(
+                materials,
                 xml.createElement(
                     _materialTemplates.materialXML(
                         sid, _newName(db, specie), specie, MaterialTemplates.Specifications('specie'), specieXML)))
@@ -216,7 +219,8 @@ class MaterialDB(object):
         name = _newName(db, template)
 
         mixture = db.getElement(MaterialDB.getXPath(mixtureID))
-        _rootElement().append(
+        db.appendChild(
+            _rootElement(),
             xml.createElement(
                 _materialTemplates.materialXML(
                     mid, 'name', template,
@@ -251,7 +255,7 @@ class MaterialDB(object):
         for observer in cls._observers:
             observer.materialRemoving(db, mid)
 
-        materials.remove(material)
+        db.removeChild(material)
 
     @classmethod
     def removeSpecie(cls, db, mid: int):
@@ -276,4 +280,4 @@ class MaterialDB(object):
         if primarySpecie is not None:
             db.setValue(MaterialDB.getXPath(mixtureMid) + 'mixture/primarySpecie', primarySpecie)
 
-        materials.remove(specie)
+        db.removeChild(specie)
@@ -265,7 +265,6 @@ class MaterialObserver(IMaterialObserver):
             return False
 
         for field in referencingFields:
-            monitor = field.getparent()
-            monitor.getparent().remove(monitor)
+            db.removeChild(field.getparent())
 
         return True
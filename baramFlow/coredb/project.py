@@ -195,6 +195,9 @@ class _Project(QObject):
     def updateBatchStatuses(self, statuses):
         self._projectSettings.setBatchStatuses(statuses)
 
+    def updateBatchStatus(self, name, status):
+        self._projectSettings.setBatchStatus(name, status)
+
     def removeBatchStatus(self, name):
         self._projectSettings.removeBatchStatus(name)
 
@@ -245,6 +248,8 @@ class _Project(QObject):
         CoreDBReader().reloadCoreDB()
 
     def _close(self):
+        if self._fileDB:
+            self._fileDB.close()
         coredb.destroy()
         self.projectClosed.emit()
         if self._projectLock:
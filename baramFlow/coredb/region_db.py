@@ -64,9 +64,10 @@ class RegionDB:
     def updateMaterials(cls, rname, primary, secondaries):
         def addSurfaceTension(parent, mid1, mid2):
             if xml.getElement(parent, f'surfaceTension[mid="{mid1}"][mid="{mid2}"]') is None:
-                parent.append(xml.createElement(f'<surfaceTension xmlns="http://www.baramcfd.org/baram">'
-                                                f'  <mid>{mid1}</mid><mid>{mid2}</mid><value>0</value>'
-                                                f'</surfaceTension>'))
+                db.appendChild(parent,
+                               xml.createElement(f'<surfaceTension xmlns="http://www.baramcfd.org/baram">'
+                                                 f'  <mid>{mid1}</mid><mid>{mid2}</mid><value>0</value>'
+                                                 f'</surfaceTension>'))
 
         db = coredb.CoreDB()
 
@@ -91,7 +92,7 @@ class RegionDB:
 
         region = getRegionElement(rname)
         surfaceTensions = xml.getElement(region, 'phaseInteractions/surfaceTensions')
-        surfaceTensions.clear()
+        db.clearChildren(surfaceTensions)
         #
         # for i in range(len(secondaries)):
         #     addSurfaceTension(surfaceTensions, primary, secondaries[i])
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import re
+from dataclasses import dataclass
+from enum import Enum, auto
+from threading import Lock
+from typing import Optional
+
+import xmlschema
+from xmlschema.names import XSD_DOUBLE, XSD_MIN_INCLUSIVE, XSD_MAX_INCLUSIVE, XSD_MIN_EXCLUSIVE, XSD_MAX_EXCLUSIVE
+
+from resources import resource
+from .libdb import nsmap
+
+
+_POSITION_PATTERN = re.compile(r'\[\d+\]')
+
+_mutex = Lock()
+_indexes = {}
+
+
+class ValueType(Enum):
+    NUMBER_LIST = auto()
+    DOUBLE      = auto()  # Derived from xs:double, with restrictions or attributes
+    DECIMAL     = auto()  # xs:decimal, xs:integer and types derived from them
+    STRING      = auto()
+
+
+@dataclass
+class SchemaType:
+    element: xmlschema.XsdElement
+    isGlobal: bool
+    hasSimpleContent: bool
+    valueType: Optional[ValueType] = None
+    batchParameter: bool = False
+    isInteger: bool = False
+    minInclusive: Optional[float] = None
+    maxInclusive: Optional[float] = None
+    minExclusive: Optional[float] = None
+    maxExclusive: Optional[float] = None
+    enumeration: Optional[list] = None
+
+
+def _facetValue(xsdType, facet):
+    return getattr(xsdType.base_type.get_facet(facet), 'value', None)
+
+
+def _resolve(element) -> SchemaType:
+    xsdType = element.type
+    schemaType = SchemaType(element, element.ref is not None or element.is_global(), xsdType.has_simple_content())
+    if not schemaType.hasSimpleContent:
+        return schemaType
+
+    schemaType.batchParameter = xsdType.is_complex() and 'batchParameter' in xsdType.attributes
+
+    if xsdType.local_name == 'inputNumberListType':
+        schemaType.valueType = ValueType.NUMBER_LIST
+    elif xsdType.is_derived(xsdType.maps.types[XSD_DOUBLE]):
+        schemaType.valueType = ValueType.DOUBLE
+        schemaType.minInclusive = _facetValue(xsdType, XSD_MIN_INCLUSIVE)
+        schemaType.maxInclusive = _facetValue(xsdType, XSD_MAX_INCLUSIVE)
+        schemaType.minExclusive = _facetValue(xsdType, XSD_MIN_EXCLUSIVE)
+        schemaType.maxExclusive = _facetValue(xsdType, XSD_MAX_EXCLUSIVE)
+    elif xsdType.is_decimal():
+        schemaType.valueType = ValueType.DECIMAL
+        if xsdType.is_simple():
+            name = xsdType.local_name.lower()
+            schemaType.minInclusive = xsdType.min_value
+            schemaType.maxInclusive = xsdType.max_value
+        else:
+            name = xsdType.content.primitive_type.local_name.lower()
+            schemaType.minInclusive = xsdType.content.min_value
+            schemaType.maxInclusive = xsdType.content.max_value
+
+        schemaType.isInteger = 'integer' in name
+    else:
+        schemaType.valueType = ValueType.STRING
+        if xsdType.is_restriction() and xsdType.enumeration is not None:
+            schemaType.enumeration = list(xsdType.enumeration)
+
+    return schemaType
+
+
+class SchemaIndex:
+    """Lookup table from configuration element paths to their schema types
+
+    Schema types are resolved from the XSD on the first lookup of a path and memoized.
+    Paths are normalized by removing positional predicates,
+    so all the boundary conditions, for example, share the entries.
+    """
+    def __init__(self, xsdPath):
+        self._schema = xmlschema.XMLSchema(resource.file(xsdPath))
+        self._types = {}
+
+    @property
+    def schema(self):
+        return self._schema
+
+    def find(self, path: str) -> Optional[SchemaType]:
+        """Returns schema type of the element path
+
+        Args:
+            path: element path in the configuration tree, with or without positional predicates
+
+        Returns:
+            Schema type of the path, or None if the path is not defined in the schema
+        """
+        key = _POSITION_PATTERN.sub('', path)
+        if key in self._types:
+            return self._types[key]
+
+        element = self._schema.find('.//' + key, namespaces=nsmap)
+        schemaType = None if element is None else _resolve(element)
+        self._types[key] = schemaType
+
+        return schemaType
+
+
+def schemaIndex(xsdPath) -> SchemaIndex:
+    """Returns schema index of the XSD file, which is loaded only once and shared"""
+    with _mutex:
+        if xsdPath not in _indexes:
+            _indexes[xsdPath] = SchemaIndex(xsdPath)
+
+        return _indexes[xsdPath]
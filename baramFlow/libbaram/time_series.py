@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pandas as pd
+
+
+class TimeSeriesStore:
+    """Append-only columnar store of time series, such as the residuals of a region, keyed by Time
+
+    Rows are kept in preallocated arrays that grow geometrically, one array per column.
+    Appending rows that start at or before the last stored time drops the stored rows from that time,
+    because the solver restarted from an earlier time overwrites them.
+    Residuals should be kept in a store PER REGION because of this dropping.
+    """
+    INITIAL_CAPACITY = 1024
+
+    def __init__(self):
+        self._columns = {}
+        self._times = np.empty(self.INITIAL_CAPACITY)
+        self._values = np.empty((0, self.INITIAL_CAPACITY))
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def columns(self) -> [str]:
+        return list(self._columns)
+
+    def times(self) -> np.ndarray:
+        return self._times[:self._size]
+
+    def values(self, column) -> np.ndarray:
+        return self._values[self._columns[column], :self._size]
+
+    def append(self, rows: pd.DataFrame) -> int:
+        """Appends rows indexed by Time
+
+        Args:
+            rows: values indexed by Time in ascending order
+
+        Returns:
+            Number of the stored rows kept, which are the rows before the first time of the appended rows
+        """
+        times = rows.index.to_numpy(dtype=np.float64)
+        if times.size == 0:
+            return self._size
+
+        self._size = int(np.searchsorted(self.times(), times[0], side='left'))
+
+        for column in rows.columns:
+            if column not in self._columns:
+                self._columns[column] = len(self._columns)
+                self._values = np.vstack([self._values, np.full(self._times.size, np.nan)])
+
+        self._reserve(self._size + times.size)
+
+        end = self._size + times.size
+        self._times[self._size:end] = times
+        self._values[:, self._size:end] = np.nan
+        self._values[[self._columns[c] for c in rows.columns], self._size:end] = rows.to_numpy(dtype=np.float64).T
+
+        kept = self._size
+        self._size = end
+
+        return kept
+
+    def frame(self, start=0) -> pd.DataFrame:
+        """Returns rows from the start as a DataFrame indexed by Time"""
+        return pd.DataFrame({column: self._values[i, start:self._size] for column, i in self._columns.items()},
+                            index=pd.Index(self._times[start:self._size], name='Time'))
+
+    def _reserve(self, size):
+        capacity = self._times.size
+        if size <= capacity:
+            return
+
+        while capacity < size:
+            capacity *= 2
+
+        times = np.empty(capacity)
+        times[:self._size] = self._times[:self._size]
+        values = np.empty((len(self._columns), capacity))
+        values[:, :self._size] = self._values[:, :self._size]
+
+        self._times = times
+        self._values = values
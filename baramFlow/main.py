@@ -5,6 +5,7 @@ import sys
 import os
 import logging
 import asyncio
+import multiprocessing
 
 import qasync
 
@@ -94,4 +95,5 @@ def main():
 
 
 if __name__ == '__main__':
+    multiprocessing.freeze_support()    # For the worker processes of a frozen application
     main()
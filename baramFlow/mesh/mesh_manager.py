@@ -4,7 +4,6 @@
 import asyncio
 import logging
 import qasync
-import shutil
 
 from enum import Enum, auto
 from pathlib import Path
@@ -12,11 +11,16 @@ from pathlib import Path
 from PySide6.QtCore import QObject, Signal
 
 from libbaram import utils
+from libbaram.file_copy import FileCopier
 from libbaram.openfoam.constants import CASE_DIRECTORY_NAME, Directory
-from libbaram.run import RunParallelUtility, RunUtility
+from libbaram.openfoam.mesh_transform import AffineTransform, transformPointsFiles
+from libbaram.process import getAvailablePhysicalCores
+from libbaram.run import RunUtility
 
+from baramFlow.app import app
+from baramFlow.coredb import coredb
 from baramFlow.coredb.project import Project
-from baramFlow.openfoam import parallel
+from baramFlow.coredb.run_calculation_db import RunCalculationDB
 from baramFlow.openfoam.constant.region_properties import RegionProperties
 from baramFlow.openfoam.file_system import FileSystem, FileLoadingError
 
@@ -45,6 +49,7 @@ OPENFOAM_MESH_CONVERTERS = {
 
 class MeshManager(QObject):
     progress = Signal(str)
+    copyProgress = Signal('qint64', 'qint64')   # Bytes copied and total bytes of the mesh files imported
 
     def __init__(self):
         super().__init__()
@@ -53,58 +58,15 @@ class MeshManager(QObject):
 
     @qasync.asyncSlot()
     async def scale(self, x, y, z):
-        caseRoot = FileSystem.caseRoot()
-        cm = RunParallelUtility('transformPoints', '-allRegions', '-scale', f'({x} {y} {z})',
-                                '-case', caseRoot, cwd=caseRoot, parallel=parallel.getEnvironment())
-        await cm.start()
-        result = await cm.wait()
-
-        if result == 0 and parallel.getNP() > 1:  # Process the mesh in constant folder too.
-            cm = RunUtility('transformPoints', '-allRegions', '-scale', f'({x} {y} {z})',
-                            '-case', caseRoot, cwd=caseRoot)
-
-            await cm.start()
-            result = await cm.wait()
-
-        return result
+        await self._transform(AffineTransform.scale(x, y, z))
 
     @qasync.asyncSlot()
     async def translate(self, x, y, z):
-        caseRoot = FileSystem.caseRoot()
-        cm = RunParallelUtility('transformPoints', '-allRegions', '-translate', f'({x} {y} {z})',
-                                '-case', caseRoot, cwd=caseRoot, parallel=parallel.getEnvironment())
-        await cm.start()
-        result = await cm.wait()
-
-        if result == 0 and parallel.getNP() > 1:  # Process the mesh in constant folder too.
-            cm = RunUtility('transformPoints', '-allRegions', '-translate', f'({x} {y} {z})',
-                            '-case', caseRoot, cwd=caseRoot)
-
-            await cm.start()
-            result = await cm.wait()
-
-        return result
+        await self._transform(AffineTransform.translate(x, y, z))
 
     @qasync.asyncSlot()
     async def rotate(self, origin, axis, angle):
-        caseRoot = FileSystem.caseRoot()
-        cm = RunParallelUtility('transformPoints', '-allRegions',
-                                '-origin', f'({" ".join(origin)})',
-                                '-rotate-angle', f'(({" ".join(axis)}) {angle})',
-                                '-case', caseRoot, cwd=caseRoot, parallel=parallel.getEnvironment())
-        await cm.start()
-        result = await cm.wait()
-
-        if result == 0 and parallel.getNP() > 1:  # Process the mesh in constant folder too.
-            cm = RunUtility('transformPoints', '-allRegions',
-                            '-origin', f'({" ".join(origin)})',
-                            '-rotate-angle', f'(({" ".join(axis)}) {angle})',
-                            '-case', caseRoot, cwd=caseRoot)
-
-            await cm.start()
-            result = await cm.wait()
-
-        return result
+        await self._transform(AffineTransform.rotate(origin, axis, angle))
 
     async def importMeshFiles(self, srcPath):
         path = self._checkAndCorrectMeshFolderSelection(srcPath)
@@ -114,16 +76,18 @@ class MeshManager(QObject):
         fluids = []
         solids = []
 
+        # Mesh files are not hardlinked, because the source mesh can be modified in place by the user
+        copier = self._fileCopier()
         for rname, path in polyMeshInfos:
-            await asyncio.to_thread(
-                shutil.copytree,
-                path, FileSystem.constantPath(rname) / Directory.POLY_MESH_DIRECTORY_NAME, copy_function=shutil.copyfile)
+            copier.addTree(path, FileSystem.constantPath(rname) / Directory.POLY_MESH_DIRECTORY_NAME)
             # if phase == Phase.SOLID:
             #     solids.append(rname)
             # else:
             #     fluids.append(rname)
             fluids.append(rname)
 
+        await asyncio.to_thread(copier.copy)
+
         RegionProperties().setRegions(fluids, solids).write()
 
     async def convertMesh(self, path, meshType):
@@ -147,10 +111,30 @@ class MeshManager(QObject):
     def convertUtility(cls, meshType):
         return OPENFOAM_MESH_CONVERTERS[meshType][0]
 
+    async def _transform(self, transform):
+        """Transforms the points of the mesh in the case and the mesh loaded for rendering
+
+        The points files of all the regions in the case root and the processor folders are transformed,
+        as "transformPoints -allRegions" would do for each of them.
+        """
+        caseRoot = FileSystem.caseRoot()
+        files = [path
+                 for polyMesh in [
+                     *caseRoot.glob(f'{Directory.CONSTANT_DIRECTORY_NAME}/**/{Directory.POLY_MESH_DIRECTORY_NAME}'),
+                     *caseRoot.glob(f'processor*/{Directory.CONSTANT_DIRECTORY_NAME}/**/'
+                                    f'{Directory.POLY_MESH_DIRECTORY_NAME}')]
+                 for path in [polyMesh / 'points', polyMesh / 'points.gz'] if path.is_file()]
+
+        precision = int(coredb.CoreDB().getValue(
+            RunCalculationDB.RUN_CALCULATION_XPATH + '/runConditions/dataWritePrecision'))
+        await asyncio.to_thread(transformPointsFiles, files, transform, precision, getAvailablePhysicalCores())
+
+        app.transformVtk(transform)
+
     async def _copyMeshFrom(self, source):
-        await asyncio.to_thread(self._copyMeshFromInternal, source)
+        await asyncio.to_thread(self._copyMeshFromInternal, source, self._fileCopier())
 
-    def _copyMeshFromInternal(self, source):
+    def _copyMeshFromInternal(self, source, copier):
         target = Project.instance().path / CASE_DIRECTORY_NAME / Directory.CONSTANT_DIRECTORY_NAME  # Constant Path for Live Case
         if target.exists():
             utils.rmtree(target)
@@ -159,16 +143,24 @@ class MeshManager(QObject):
 
         regionPropFile = source / Directory.REGION_PROPERTIES_FILE_NAME
         if regionPropFile.is_file():
-            shutil.copyfile(regionPropFile, target / Directory.REGION_PROPERTIES_FILE_NAME)
+            copier.addFile(regionPropFile, target / Directory.REGION_PROPERTIES_FILE_NAME)
             regions = RegionProperties.loadRegions(source)
             for rname in regions:
                 s = source / rname / Directory.POLY_MESH_DIRECTORY_NAME
                 t = target / rname / Directory.POLY_MESH_DIRECTORY_NAME
-                shutil.copytree(s, t, copy_function=shutil.copyfile)
+                copier.addTree(s, t)
         else:
             s = source / Directory.POLY_MESH_DIRECTORY_NAME
             t = target / Directory.POLY_MESH_DIRECTORY_NAME
-            shutil.copytree(s, t, copy_function=shutil.copyfile)
+            copier.addTree(s, t)
+
+        copier.copy()
+
+    def _fileCopier(self):
+        copier = FileCopier()
+        copier.progress.connect(self.copyProgress)
+
+        return copier
 
     def _checkAndCorrectMeshFolderSelection(self, path: Path) -> Path:
         """Check if "path" has correct polyMesh
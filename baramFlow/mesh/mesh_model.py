@@ -3,14 +3,17 @@
 import asyncio
 import re
 from io import StringIO
+from threading import Lock
 
 from PySide6.QtCore import QObject, Signal
 from vtkmodules.vtkCommonColor import vtkNamedColors
 from vtkmodules.vtkCommonCore import VTK_POLY_DATA
+from vtkmodules.vtkCommonDataModel import vtkStaticCellLocator
 from vtkmodules.vtkFiltersCore import vtkFeatureEdges
 from vtkmodules.vtkFiltersGeometry import vtkGeometryFilter
 from vtkmodules.vtkRenderingCore import vtkActor, vtkPolyDataMapper
 from vtkmodules.vtkRenderingLOD import vtkQuadricLODActor
+from vtkmodules.util.numpy_support import vtk_to_numpy
 
 from baramFlow.app import app
 from baramFlow.coredb import coredb
@@ -20,6 +23,7 @@ from baramFlow.openfoam.system.fv_schemes import FvSchemes
 from baramFlow.openfoam.system.fv_solution import FvSolution
 from baramFlow.view.dock_widgets.rendering_dock import DisplayMode
 from libbaram.exception import CanceledException
+from libbaram.openfoam.mesh_transform import AffineTransform
 from libbaram.run import RunParallelUtility
 
 
@@ -109,6 +113,8 @@ class ActorInfo:
         self._dataSet = dataSet
         self._face = None
         self._feature = None
+        self._locator = None
+        self._locatorLock = Lock()
 
         self._face = getActor(dataSet)
         if dataSet.GetDataObjectType() == VTK_POLY_DATA:
@@ -126,9 +132,49 @@ class ActorInfo:
     def dataSet(self):
         return self._dataSet
 
+    @property
+    def locator(self):
+        """Cell locator of the dataSet, built on the first use and kept until the mesh is loaded again"""
+        with self._locatorLock:
+            if self._locator is None:
+                self._locator = vtkStaticCellLocator()
+                self._locator.SetDataSet(self._dataSet)
+                self._locator.BuildLocator()
+
+        return self._locator
+
     def actor(self, featureMode):
         return self._feature if featureMode else self._face
 
+    def transform(self, transform: AffineTransform, transformed: set):
+        """Moves the points of the dataSet and of the actors in place
+
+        Args:
+            transform: transform to apply
+            transformed: addresses of the vtkPoints already transformed,
+                because the datasets of the actors and the mesh share points with each other
+        """
+        dataSets = [self._dataSet, self._face.GetMapper().GetInput()]
+        if self._feature:
+            dataSets.append(self._feature.GetMapper().GetInput())
+
+        for dataSet in dataSets:
+            points = dataSet.GetPoints()
+            if points is None:
+                continue
+
+            address = points.GetAddressAsString('vtkPoints')
+            if address not in transformed:
+                transformed.add(address)
+                array = vtk_to_numpy(points.GetData())
+                array[:] = transform.apply(array)
+                points.Modified()
+
+            dataSet.Modified()
+
+        with self._locatorLock:
+            self._locator = None
+
     @property
     def visibility(self):
         return self._visibility
@@ -202,6 +248,19 @@ class MeshModel(RenderingModel):
     def currentId(self):
         return self._currentId
 
+    def transform(self, transform: AffineTransform, actorInfos=()):
+        """Moves the actors and the other actorInfos of the same mesh, instead of loading the mesh again"""
+        transformed = set()
+        for actorInfo in [*self._actorInfos.values(), *actorInfos]:
+            actorInfo.transform(transform, transformed)
+
+        self._bounds = None
+        self._smallestCellVolume = None
+        self._largestCellVolume = None
+
+        if self._activation and self._view:
+            self._view.fitCamera()
+
     def currentActor(self):
         if self._currentId:
             actorInfo = self._actorInfos[self._currentId]
@@ -3,15 +3,18 @@
 
 from pathlib import Path
 
+import numpy as np
+
 from vtkmodules.vtkRenderingCore import vtkPolyDataMapper, vtkDataSetMapper, vtkActor, vtkFollower
 from vtkmodules.vtkIOLegacy import vtkPolyDataReader
 from vtkmodules.vtkCommonCore import vtkPoints
-from vtkmodules.vtkCommonDataModel import vtkHexahedron, vtkUnstructuredGrid, vtkStaticCellLocator
+from vtkmodules.vtkCommonDataModel import vtkHexahedron, vtkUnstructuredGrid, vtkPolyData, vtkCellLocatorStrategy
 from vtkmodules.vtkRenderingLOD import vtkQuadricLODActor
 from vtkmodules.vtkFiltersSources import vtkLineSource, vtkSphereSource
-from vtkmodules.vtkFiltersCore import vtkTubeFilter
+from vtkmodules.vtkFiltersCore import vtkTubeFilter, vtkProbeFilter
 from vtkmodules.vtkIOGeometry import vtkSTLReader
 from vtkmodules.vtkRenderingFreeType import vtkVectorText
+from vtkmodules.util.numpy_support import numpy_to_vtk, vtk_to_numpy
 
 
 def loadVtkFile(file):
@@ -143,9 +146,46 @@ def labelActor(text):
     return actor
 
 
-def isPointInDataSet(point, dataSet):
-    locator = vtkStaticCellLocator()
-    locator.SetDataSet(dataSet)
-    locator.BuildLocator()
+def locatePoints(points, internalMeshes: dict) -> list:
+    """Finds the regions containing the points
+
+    All the points not located yet are probed at once in each region,
+    with the cell locator cached in the internal mesh of the region.
+
+    Args:
+        points: coordinates of the points, array-like of shape (n, 3)
+        internalMeshes: ActorInfo of the internal mesh by region name
+
+    Returns:
+        Region names, None for the points not in any region
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 3)
+    regions = [None] * len(points)
+    remaining = np.arange(len(points))
+
+    for rname, actorInfo in internalMeshes.items():
+        if not remaining.size:
+            break
+
+        coordinates = vtkPoints()
+        coordinates.SetData(numpy_to_vtk(points[remaining], deep=1))
+        probes = vtkPolyData()
+        probes.SetPoints(coordinates)
+
+        strategy = vtkCellLocatorStrategy()
+        strategy.SetCellLocator(actorInfo.locator)
+
+        probe = vtkProbeFilter()
+        probe.SetInputData(probes)
+        probe.SetSourceData(actorInfo.dataSet)
+        probe.SetFindCellStrategy(strategy)
+        probe.Update()
+
+        found = vtk_to_numpy(
+            probe.GetOutput().GetPointData().GetArray(probe.GetValidPointMaskArrayName())).astype(bool)
+        for i in remaining[found]:
+            regions[i] = rname
+
+        remaining = remaining[~found]
 
-    return locator.FindCell(point) > -1
+    return regions
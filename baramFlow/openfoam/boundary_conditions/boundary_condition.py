@@ -5,15 +5,15 @@ from enum import Enum, auto
 from math import sqrt
 import logging
 
-from PyFoam.RunDictionary.ParsedParameterFile import ParsedParameterFile
-
 from libbaram.math import calucateDirectionsByRotation
 from libbaram.openfoam.dictionary.dictionary_file import DictionaryFile, DataClass
+from libbaram.openfoam.field_file import FieldFile, FieldValue
 
 from baramFlow.coredb.boundary_db import DirectionSpecificationMethod
 from baramFlow.coredb.coredb_reader import CoreDBReader
 from baramFlow.coredb.material_db import UNIVERSAL_GAS_CONSTANT, MaterialDB
 from baramFlow.coredb.models_db import TurbulenceModel
+from baramFlow.coredb.project import Project
 from baramFlow.openfoam.constant.boundary_data import BoundaryData
 from baramFlow.openfoam.file_system import FileSystem
 
@@ -34,49 +34,60 @@ class BoundaryCondition(DictionaryFile):
         self._region = region
         self._time = time
         self._processorNo = processorNo
-        self._fieldsData = None
         self._db = CoreDBReader()
 
+    @property
+    def processorNo(self):
+        return self._processorNo
+
     def build0(self):
         raise AssertionError  # This method should be overwritten by descendants
 
     def build(self):
+        # The existing field file is read when written, to be skipped if the content built is not changed
         self.build0()
-        if not self._data:
-            self._fieldsData = None
-            return self
-
-        path = self.fullPath(self._processorNo)
-        if path.is_file():
-            self._fieldsData = ParsedParameterFile(str(path), debug=None)
-
-            for name, builded in self._data['boundaryField'].items():
-                loaded = self._fieldsData.content['boundaryField'][name]
-                if loaded['type'] == builded['type'] == 'fixedValue' and not loaded['value'].isUniform():
-                    builded['value'] = None
-
-                loaded.update({k: v for k, v in builded.items() if v is not None})
 
         return self
 
     def fullPath(self, processorNo=None):
-        # Boundary Conditions reside in Field Data Files
-        # Field Data Files are reconstructed, updated, and decomposed in sequence
-        # so that no need to handle the data under processors folders
-        timeDirPath = FileSystem.caseRoot() / self._header['location']
+        # Boundary Conditions reside in Field Data Files,
+        # in the case root if they are reconstructed, updated, and decomposed in sequence,
+        # or in the processor folders if boundaryField is updated there directly
+        if processorNo is None:
+            processorNo = self._processorNo
+
+        processorDir = '' if processorNo is None else f'processor{processorNo}'
+        timeDirPath = FileSystem.caseRoot() / processorDir / self._header['location']
         boundaryFilePath = timeDirPath / self._header['object']
         boundaryFieldsPath = timeDirPath / 'boundaryFields' / self._header['object']
 
         return boundaryFieldsPath if boundaryFieldsPath.exists() else boundaryFilePath
 
     def write(self):
-        if self._fieldsData:
-            self._fieldsData.writeFile()
-        elif self._data:
+        if not self._data:
+            return
+
+        path = self.fullPath()
+        if path.is_file():
+            # Only boundaryField is parsed, internalField and nonuniform values are written back as they are.
+            # Patches not built, such as processor patches, are also kept.
+            fieldsData = FieldFile(path)
+
+            for name, builded in self._data['boundaryField'].items():
+                loaded = fieldsData.boundaryField[name]
+                value = loaded.get('value')
+                if (loaded['type'] == builded['type'] == 'fixedValue'
+                        and isinstance(value, FieldValue) and not value.isUniform()):
+                    builded['value'] = None
+
+                loaded.update({k: v for k, v in builded.items() if v is not None})
+
+            fieldsData.write()
+        else:
             self._write(self._processorNo)
 
     def _initialValueByTime(self):
-        path = self.fullPath(self._processorNo)
+        path = self.fullPath()
         if self._time == '0' or not path.is_file():
             return 'uniform', self._initialValue
         else:
@@ -150,8 +161,14 @@ class BoundaryCondition(DictionaryFile):
             'type': 'wedge'
         }
 
-    def _constructTimeVaryingMappedFixedValue(self, rname, bname, field, data):
-        points = BoundaryData.write(rname, bname, field, data)
+    def _constructTimeVaryingMappedFixedValue(self, rname, bname, field, key):
+        fileDB = Project.instance().fileDB()
+        contentHash = fileDB.getContentHash(key)
+
+        # Tables of millions of points are not read nor written again if not changed
+        points = BoundaryData.writtenPoints(rname, bname, field, contentHash)
+        if points is None:
+            points = BoundaryData.write(rname, bname, field, fileDB.getFileContents(key), contentHash)
 
         return {
             'type': 'timeVaryingMappedFixedValue',
@@ -2,7 +2,14 @@
 # -*- coding: utf-8 -*-
 
 import asyncio
+import contextvars
+import hashlib
 import logging
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from enum import Enum, auto
 
 from PySide6.QtCore import QCoreApplication, QObject, Signal
 
@@ -27,6 +34,7 @@ from baramFlow.openfoam.constant.transport_properties import TransportProperties
 from baramFlow.openfoam.constant.turbulence_properties import TurbulenceProperties
 from baramFlow.openfoam.boundary_conditions.alpha import Alpha
 from baramFlow.openfoam.boundary_conditions.alphat import Alphat
+from baramFlow.openfoam.boundary_conditions.boundary_condition import BoundaryCondition
 from baramFlow.openfoam.boundary_conditions.epsilon import Epsilon
 from baramFlow.openfoam.boundary_conditions.k import K
 from baramFlow.openfoam.boundary_conditions.nut import Nut
@@ -38,8 +46,9 @@ from baramFlow.openfoam.boundary_conditions.specie import Specie
 from baramFlow.openfoam.boundary_conditions.t import T
 from baramFlow.openfoam.boundary_conditions.u import U
 from baramFlow.openfoam.file_system import FileSystem
+from baramFlow.openfoam.generation_manifest import GenerationManifest
 from baramFlow.openfoam.polymesh.boundary import Boundary
-from baramFlow.openfoam.system.control_dict import ControlDict
+from baramFlow.openfoam.system.control_dict import ControlDict, locatePointMonitors
 from baramFlow.openfoam.system.fv_options import FvOptions
 from baramFlow.openfoam.system.fv_schemes import FvSchemes
 from baramFlow.openfoam.system.fv_solution import FvSolution
@@ -47,6 +56,29 @@ from baramFlow.openfoam.system.set_fields_dict import SetFieldsDict
 
 logger = logging.getLogger(__name__)
 
+GENERATOR_WORKERS = min(8, os.cpu_count() or 1)
+
+# Configurations the field files are built from.
+# Others, such as runCalculation, numericalConditions and monitors, are used only by the system dictionaries.
+FIELD_INPUT_XPATHS = [
+    './general',
+    './materials',
+    './models',
+    './regions',
+    './numericalConditions/densityBasedSolverParameters'
+]
+
+
+class FieldsUpdate(Enum):
+    NONE = auto()           # Field files are kept as they are
+    CASE_ROOT = auto()      # Field files in the case root are updated, reconstructed and decomposed if decomposed
+    PROCESSORS = auto()     # boundaryField of the field files in the processor folders are updated directly
+
+
+def _fieldsHash(inputHash):
+    """Returns the hash of the inputs of the field files, which are the configurations and the mesh"""
+    return hashlib.sha1(f'{inputHash}{FileSystem.meshStamp()}'.encode()).hexdigest()
+
 
 class CaseGenerator(QObject):
     progress = Signal(str)
@@ -58,11 +90,12 @@ class CaseGenerator(QObject):
         self._cm = None
         self._canceled: bool = False
         self._files = None
+        self._manifest = None
 
     def getErrors(self):
         return self._errors
 
-    def _gatherFiles(self):
+    def _gatherFiles(self, fieldsUpdate=FieldsUpdate.CASE_ROOT):
         if errors := self._validate():
             return errors
 
@@ -91,7 +124,11 @@ class CaseGenerator(QObject):
                 self._files.append(Boundary(rname, processorNo))
                 processorNo += 1
 
-            self._gatherBoundaryConditionsFiles(region, FileSystem.caseRoot())
+            if fieldsUpdate == FieldsUpdate.CASE_ROOT:
+                self._gatherBoundaryConditionsFiles(region, FileSystem.caseRoot())
+            elif fieldsUpdate == FieldsUpdate.PROCESSORS:
+                for no in range(processorNo):
+                    self._gatherBoundaryConditionsFiles(region, FileSystem.processorPath(no), no)
 
             self._files.append(FvSchemes(rname))
             self._files.append(FvSolution(rname))
@@ -113,10 +150,75 @@ class CaseGenerator(QObject):
         return errors
 
     def _generateFiles(self):
-        for file in self._files:
+        def generate(file):
+            # Returns seconds taken, False if the file is not changed, or None if canceled
             if self._canceled:
-                return
-            file.build().write()
+                return None
+
+            start = time.perf_counter()
+            if not file.isBuilt():
+                file.build()
+
+            path = file.fullPath()
+            contentHash = file.contentHash()
+            if self._manifest.isUpToDate(path, contentHash):
+                return False
+
+            file.write()
+            self._manifest.add(path, contentHash)
+
+            return time.perf_counter() - start
+
+        total = len(self._files)
+        count = 0
+        skipped = 0
+        elapsed = defaultdict(float)
+        generated = defaultdict(int)
+
+        # Files are independent of each other, and built from the snapshot of the context setupCase runs in.
+        # Each worker task runs in its own copy of the context, because a context cannot be entered by two threads.
+        with ThreadPoolExecutor(max_workers=GENERATOR_WORKERS) as executor:
+            futures = {executor.submit(contextvars.copy_context().run, generate, file): file for file in self._files}
+            try:
+                for future in as_completed(futures):
+                    seconds = future.result()
+                    if seconds is None:
+                        continue
+
+                    name = type(futures[future]).__name__
+                    if seconds is False:
+                        skipped += 1
+                    else:
+                        elapsed[name] += seconds
+                        generated[name] += 1
+
+                    count += 1
+                    self.progress.emit(self.tr('Generating Files... ({0}/{1})').format(count, total))
+            except Exception:
+                executor.shutdown(cancel_futures=True)
+                raise
+
+        for name, seconds in sorted(elapsed.items(), key=lambda item: item[1], reverse=True):
+            logger.info(f'{name}: {generated[name]} files in {seconds:.3f}s')
+        logger.info(f'{skipped} files not changed')
+
+    def _processorFieldsExist(self):
+        """Returns True if all the field files to be written exist in the processor folders
+
+        Field files that do not exist, of the models turned on for example,
+        cannot be created in the processor folders because they need processor patches.
+        The same fields are written in all the processor folders,
+        so only the files of the first processor are built, to be written without building again.
+        """
+        processors = range(len(FileSystem.processorFolders()))
+        for file in self._files:
+            if isinstance(file, BoundaryCondition) and file.processorNo == 0 and file.build().isBuilt():
+                for no in processors:
+                    if not (path := file.fullPath(no)).is_file():
+                        logger.info(f'{path} not found, Field Data will be reconstructed')
+                        return False
+
+        return True
 
     def _validate(self):
         errors = ''
@@ -135,32 +237,46 @@ class CaseGenerator(QObject):
 
     def _gatherBoundaryConditionsFiles(self, region, path, processorNo=None):
         times = [d.name for d in path.glob('[0-9]*')]
-        time = max(times, key=lambda x: float(x)) if times else '0'
+        latestTime = max(times, key=lambda x: float(x)) if times else '0'
 
-        self._files.append(Alphat(region, time, processorNo))
+        self._files.append(Alphat(region, latestTime, processorNo))
 
-        self._files.append(K(region, time, processorNo))
-        self._files.append(Nut(region, time, processorNo))
-        self._files.append(Epsilon(region, time, processorNo))
-        self._files.append(Omega(region, time, processorNo))
-        self._files.append(NuTilda(region, time, processorNo))
+        self._files.append(K(region, latestTime, processorNo))
+        self._files.append(Nut(region, latestTime, processorNo))
+        self._files.append(Epsilon(region, latestTime, processorNo))
+        self._files.append(Omega(region, latestTime, processorNo))
+        self._files.append(NuTilda(region, latestTime, processorNo))
 
-        self._files.append(P(region, time, processorNo, 'p_rgh'))
-        self._files.append(P(region, time, processorNo, 'p'))
-        self._files.append(U(region, time, processorNo))
-        self._files.append(T(region, time, processorNo))
+        self._files.append(P(region, latestTime, processorNo, 'p_rgh'))
+        self._files.append(P(region, latestTime, processorNo, 'p'))
+        self._files.append(U(region, latestTime, processorNo))
+        self._files.append(T(region, latestTime, processorNo))
 
         if ModelsDB.isMultiphaseModelOn():
             for mid in region.secondaryMaterials:
-                self._files.append(Alpha(region, time, processorNo, mid))
+                self._files.append(Alpha(region, latestTime, processorNo, mid))
         elif ModelsDB.isSpeciesModelOn():
             for mid, name in MaterialDB.getSpecies(region.mid).items():
-                self._files.append(Specie(region, time, processorNo, mid, name))
+                self._files.append(Specie(region, latestTime, processorNo, mid, name))
 
         for scalarID, fieldName in self._db.getUserDefinedScalarsInRegion(region.rname):
-            self._files.append(Scalar(region, time, processorNo, scalarID, fieldName))
+            self._files.append(Scalar(region, latestTime, processorNo, scalarID, fieldName))
 
     async def setupCase(self):
+        # The case is generated from a read-only copy of the configuration taken here,
+        # so that editing the configuration meanwhile does not affect the files built in worker threads.
+        # Generators created in this context, and the threads it is copied to, read the copy.
+        # Regions of point monitors are located and written to the configuration before the copy is taken.
+        locatePointMonitors()
+
+        db = self._db
+        try:
+            with db.snapshot() as self._db:
+                await self._setupCase()
+        finally:
+            self._db = db
+
+    async def _setupCase(self):
         self._canceled = False
         self.progress.emit(self.tr('Generating case'))
 
@@ -169,7 +285,23 @@ class CaseGenerator(QObject):
         processorFolders = FileSystem.processorFolders()
         nProcessorFolders = len(processorFolders)
 
-        if nProcessorFolders > 0 and len(FileSystem.times()) > 0:
+        self._manifest = GenerationManifest(caseRoot)
+        inputHash = self._db.contentHash(FIELD_INPUT_XPATHS)
+
+        # Field data in the processor folders are kept as they are if the boundary conditions are not changed,
+        # or only their boundaryField are updated without reconstructing and decomposing
+        fieldsUpdate = FieldsUpdate.CASE_ROOT
+        if nProcessorFolders > 1 and len(FileSystem.times()) > 0:
+            if self._manifest.fieldsHash == _fieldsHash(inputHash):
+                fieldsUpdate = FieldsUpdate.NONE
+            else:
+                if errors := self._gatherFiles(FieldsUpdate.PROCESSORS):
+                    raise RuntimeError(errors)
+
+                if await asyncio.to_thread(self._processorFieldsExist):
+                    fieldsUpdate = FieldsUpdate.PROCESSORS
+
+        if fieldsUpdate == FieldsUpdate.CASE_ROOT and nProcessorFolders > 0 and len(FileSystem.times()) > 0:
             self.progress.emit(self.tr(f'Reconstructing Field Data...'))
 
             if FileSystem.latestTime() == '0':
@@ -184,8 +316,9 @@ class CaseGenerator(QObject):
 
         self.progress.emit(self.tr(f'Generating Files...'))
 
-        if errors := self._gatherFiles():
-            raise RuntimeError(errors)
+        if fieldsUpdate != FieldsUpdate.PROCESSORS:
+            if errors := self._gatherFiles(fieldsUpdate):
+                raise RuntimeError(errors)
 
         errors = await asyncio.to_thread(self._generateFiles)
         if self._canceled:
@@ -193,7 +326,7 @@ class CaseGenerator(QObject):
         if errors:
             raise RuntimeError(self.tr('Case generating fail. - ') + errors)
 
-        if nProcessorFolders > 1:
+        if fieldsUpdate == FieldsUpdate.CASE_ROOT and nProcessorFolders > 1:
             self.progress.emit(self.tr('Decomposing Field Data...'))
 
             console = app.window.dockView.consoleView()
@@ -212,8 +345,12 @@ class CaseGenerator(QObject):
 
             self.progress.emit(self.tr(f'Field Data Decomposition Done'))
 
-            for time in FileSystem.times(parent=caseRoot):
-                utils.rmtree(caseRoot / time)
+            for timeName in FileSystem.times(parent=caseRoot):
+                utils.rmtree(caseRoot / timeName)
+
+        # The mesh is stamped after generation, which rewrites the boundary files of the mesh
+        self._manifest.setFieldsHash(_fieldsHash(inputHash))
+        self._manifest.save()
 
     async def initialize(self):
         self._canceled = False
@@ -1,36 +1,119 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-import os
+import hashlib
+import itertools
+from threading import Lock
+
+import pandas as pd
 
 from baramFlow.openfoam.file_system import FileSystem
 
 
+CHUNK_ROWS = 65536   # Rows formatted into a string and written at once
+
+_POINTS_PREFIX = 'points_'
+_HEADER_PREFIX = '// contentHash '
+
+# Point files are shared by the fields of a boundary, which can be written by different threads
+_lock = Lock()
+
+
+def _writeList(path, columns, vector, header=None):
+    """Writes the values in the columns as an OpenFOAM list of vectors or scalars
+
+    Rows are formatted in chunks with one string formatting, instead of one write for each row.
+    Values are formatted by repr() as before, which gives the shortest string that reads back to the same value.
+    """
+    rows = len(columns[0])
+    rowFormat = '(%r %r %r)\n' if vector else '%r\n'
+
+    with open(path, 'w') as f:
+        if header:
+            # OpenFOAM skips comments when reading the list
+            f.write(f'{header}\n')
+        f.write(f'{rows}\n(\n')
+        for start in range(0, rows, CHUNK_ROWS):
+            chunk = [column[start:start + CHUNK_ROWS] for column in columns]
+            f.write(rowFormat * len(chunk[0]) % tuple(itertools.chain.from_iterable(zip(*chunk))))
+        f.write(')')
+
+
+def _readHeader(path):
+    """Returns the content hash and the point file name written in the header of the field table"""
+    try:
+        with open(path) as f:
+            line = f.readline()
+    except FileNotFoundError:
+        return None, None
+
+    if line.startswith(_HEADER_PREFIX):
+        values = line[len(_HEADER_PREFIX):].split()
+        if len(values) == 2:
+            return values[0], values[1]
+
+    return None, None
+
+
 class BoundaryData:
     @classmethod
-    def write(cls, rname, bname, field, data):
+    def writtenPoints(cls, rname, bname, field, contentHash):
+        """Returns the point file of the field if the data of the content hash is already written
+
+        Returns:
+            Name of the point file, or None if the data should be written
+        """
+        if contentHash is None:
+            return None
+
+        pointsPath = FileSystem.constantPath(rname) / 'boundaryData' / bname
+
+        with _lock:
+            writtenHash, pointFileName = _readHeader(pointsPath / '0' / field)
+            if writtenHash == contentHash and (pointsPath / pointFileName).is_file():
+                return pointFileName
+
+        return None
+
+    @classmethod
+    def write(cls, rname, bname, field, data: pd.DataFrame, contentHash=None):
+        """Writes the point file and field table of timeVaryingMappedFixedValue
+
+        The point file is named by the hash of the points, so the fields of the same points share it.
+        Point files not used by any field of the boundary are removed.
+
+        Args:
+            rname: region name
+            bname: boundary name
+            field: field name
+            data: coordinates of the points followed by the values of the field,
+                three components for vectors or one for scalars
+            contentHash: content hash of the data, written in the field table for writtenPoints()
+
+        Returns:
+            Name of the point file
+        """
         rpath = FileSystem.makeDir(FileSystem.constantPath(rname), 'boundaryData')
         pointsPath = FileSystem.makeDir(rpath, bname)
         fieldTablePath = FileSystem.makeDir(pointsPath, '0')
 
-        pointFileName = f'points_{field}'
-        pointsFile = os.path.join(pointsPath, pointFileName)
-        fieldTableFile = os.path.join(fieldTablePath, field)
-        with open(pointsFile, 'w') as points, open(fieldTableFile, 'w') as fieldTable:
-            rows = len(data)
-            points.write(f'{rows}\n(\n')
-            fieldTable.write(f'{rows}\n(\n')
-
-            if len(data.columns) == 6:
-                for row in data.itertuples(index=False):
-                    points.write(f'({row[0]} {row[1]} {row[2]})\n')
-                    fieldTable.write(f'({row[3]} {row[4]} {row[5]})\n')
-            else:
-                for row in data.itertuples(index=False):
-                    points.write(f'({row[0]} {row[1]} {row[2]})\n')
-                    fieldTable.write(f'{row[3]}\n')
-
-            points.write(f')')
-            fieldTable.write(f')')
+        columns = [data.iloc[:, i].tolist() for i in range(len(data.columns))]
+        pointsHash = hashlib.sha1(pd.util.hash_pandas_object(data.iloc[:, :3], index=False).to_numpy()).hexdigest()
+        pointFileName = f'{_POINTS_PREFIX}{pointsHash[:16]}'
+
+        with _lock:
+            pointsFile = pointsPath / pointFileName
+            if not pointsFile.is_file():
+                _writeList(pointsFile, columns[:3], True)
+
+            # The header also tells which point file the field uses
+            _writeList(fieldTablePath / field, columns[3:], len(columns) == 6,
+                       f'{_HEADER_PREFIX}{contentHash or "-"} {pointFileName}')
+
+            used = set(_readHeader(path)[1] for path in fieldTablePath.iterdir())
+            used.add(pointFileName)
+            for path in pointsPath.glob(f'{_POINTS_PREFIX}*'):
+                if path.name not in used:
+                    path.unlink()
 
         return pointFileName
@@ -10,15 +10,26 @@ import re
 import asyncio
 
 from libbaram import utils
+from libbaram.file_copy import FileCopier
 from libbaram.openfoam.constants import Directory, CASE_DIRECTORY_NAME, FOAM_FILE_NAME
 
 from resources import resource
 
 
+# Mesh files that are replaced as a whole when the mesh changes, never modified in place,
+# so that projects can share them by hardlinks
+IMMUTABLE_MESH_FILES = ['points', 'faces', 'owner', 'neighbour',
+                        'points.gz', 'faces.gz', 'owner.gz', 'neighbour.gz']
+
+
 class FileLoadingError(Exception):
     pass
 
 
+def isImmutableMeshFile(path: Path):
+    return path.name in IMMUTABLE_MESH_FILES and path.parent.name == Directory.POLY_MESH_DIRECTORY_NAME
+
+
 def clearDirectory(directory, filesToKeep, fileToKeep=None):
     for file in directory.glob('*'):
         if file.name not in filesToKeep and file.name != fileToKeep:
@@ -231,6 +242,23 @@ class FileSystem:
     def processorFolders(cls):
         return list(cls._casePath.glob('processor[0-9]*'))
 
+    @classmethod
+    def meshStamp(cls, casePath: Optional[Path] = None):
+        """Returns the paths, modification times and sizes of the mesh files of the case
+
+        Any change of the mesh, including redistribution of a decomposed case, changes the stamp.
+        """
+        casePath = casePath or cls._casePath
+        files = []
+        for polyMesh in [*casePath.glob(f'{Directory.CONSTANT_DIRECTORY_NAME}/**/{Directory.POLY_MESH_DIRECTORY_NAME}'),
+                         *casePath.glob(f'processor*/{Directory.CONSTANT_DIRECTORY_NAME}/**/'
+                                        f'{Directory.POLY_MESH_DIRECTORY_NAME}')]:
+            for path in polyMesh.iterdir():
+                stat = path.stat()
+                files.append((str(path), stat.st_mtime_ns, stat.st_size))
+
+        return tuple(sorted(files))
+
     @classmethod
     def numberOfProcessorFolders(cls):
         return len(cls.processorFolders())
@@ -249,12 +277,25 @@ class FileSystem:
         path.unlink()
 
     @classmethod
-    def saveAs(cls, sourcePath, projectPath, regions):
+    def saveAs(cls, sourcePath, projectPath, regions, copier: Optional[FileCopier] = None):
+        """Copies the mesh and the settings of the case to another project
+
+        The mesh files are reflinked or hardlinked where the file system allows,
+        because they are not modified in place, and copied otherwise.
+
+        Args:
+            sourcePath: path of the project to copy
+            projectPath: path of the new project
+            regions: names of the regions
+            copier: FileCopier to report the progress of copying, a new one if not given
+        """
         def copyDirectory(srcPath, destPath, directory):
-            shutil.copytree(srcPath / directory, destPath / directory, copy_function=shutil.copyfile)
+            copier.addTree(srcPath / directory, destPath / directory, linkable=isImmutableMeshFile)
 
         def copyFile(srcPath, destPath, file):
-            shutil.copyfile(srcPath / file, destPath / file)
+            copier.addFile(srcPath / file, destPath / file)
+
+        copier = copier or FileCopier()
 
         sourceCaseRoot = sourcePath / CASE_DIRECTORY_NAME
         sourceConstantPath = sourceCaseRoot / Directory.CONSTANT_DIRECTORY_NAME
@@ -273,24 +314,24 @@ class FileSystem:
 
                 for rname in regions:
                     copyDirectory(sourceConstantPath, targetConstantPath, rname)
-                    copyFile(sourceSystemPath / rname, cls.makeDir(targetSystemPath, rname), 'decomposeParDict')
+                    copyFile(sourceSystemPath / rname, targetSystemPath / rname, 'decomposeParDict')
 
                     for processorPath in processorFolders:
-                        destProcessorPath = cls.makeDir(targetCaseRoot, processorPath.name)
                         copyDirectory(processorPath / Directory.CONSTANT_DIRECTORY_NAME,
-                                      cls.makeDir(destProcessorPath, Directory.CONSTANT_DIRECTORY_NAME),
+                                      targetCaseRoot / processorPath.name / Directory.CONSTANT_DIRECTORY_NAME,
                                       rname)
             else:
                 copyDirectory(sourceConstantPath, targetConstantPath, Directory.POLY_MESH_DIRECTORY_NAME)
                 for processorPath in processorFolders:
-                    destProcessorPath = cls.makeDir(targetCaseRoot, processorPath.name)
                     copyDirectory(processorPath / Directory.CONSTANT_DIRECTORY_NAME,
-                                  cls.makeDir(destProcessorPath, Directory.CONSTANT_DIRECTORY_NAME),
+                                  targetCaseRoot / processorPath.name / Directory.CONSTANT_DIRECTORY_NAME,
                                   Directory.POLY_MESH_DIRECTORY_NAME)
 
             if len(processorFolders):
                 copyFile(sourceSystemPath, targetCaseRoot / Directory.SYSTEM_DIRECTORY_NAME, 'decomposeParDict')
 
+            copier.copy()
+
             with open(targetCaseRoot / FOAM_FILE_NAME, 'a'):
                 pass
 
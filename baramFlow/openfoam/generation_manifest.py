@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import json
+import logging
+import os
+from pathlib import Path
+from threading import Lock
+
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE_NAME = '.generation.json'
+
+
+class GenerationManifest:
+    """Hashes of the files generated last time in a case
+
+    A file is written again only if the hash of its content is changed,
+    or the file is changed after generated, which is told by its size and modification time.
+    The manifest also keeps the hash of the configurations the field files are built from.
+    """
+    def __init__(self, casePath: Path):
+        self._casePath = casePath
+        self._path = casePath / MANIFEST_FILE_NAME
+        self._lock = Lock()
+
+        self._files = {}
+        self._fieldsHash = None
+
+        try:
+            with open(self._path) as f:
+                manifest = json.load(f)
+                self._files = manifest['files']
+                self._fieldsHash = manifest['fieldsHash']
+        except (OSError, ValueError, KeyError):
+            pass
+
+        self._generated = {}
+
+    @property
+    def fieldsHash(self):
+        return self._fieldsHash
+
+    def setFieldsHash(self, fieldsHash):
+        self._fieldsHash = fieldsHash
+
+    def isUpToDate(self, path: Path, contentHash) -> bool:
+        """Returns True if the file of the content hash is already written and not changed after that
+
+        The file is kept in the manifest to be saved, if it is up to date.
+        """
+        if contentHash is None:
+            return False
+
+        key = self._key(path)
+        with self._lock:
+            entry = self._files.get(key)
+            if entry is None or entry[0] != contentHash or entry[1:] != self._stat(path):
+                return False
+
+            self._generated[key] = entry
+
+        return True
+
+    def add(self, path: Path, contentHash):
+        """Records the file written"""
+        if contentHash is None:
+            return
+
+        if stat := self._stat(path):
+            with self._lock:
+                self._generated[self._key(path)] = [contentHash, *stat]
+
+    def save(self):
+        """Saves the files generated this time, with the files generated before and still up to date"""
+        with self._lock:
+            files = {key: entry for key, entry in self._files.items()
+                     if key not in self._generated and entry[1:] == self._stat(self._casePath / key)}
+            files.update(self._generated)
+
+        temp = self._path.with_suffix('.tmp')
+        try:
+            with open(temp, 'w') as f:
+                json.dump({'files': files, 'fieldsHash': self._fieldsHash}, f)
+            os.replace(temp, self._path)
+        except OSError as ex:
+            logger.info(f'Generation manifest not saved: {ex}')
+
+        self._files = files
+        self._generated = {}
+
+    def _key(self, path: Path):
+        return str(path.relative_to(self._casePath))
+
+    def _stat(self, path: Path):
+        try:
+            stat = path.stat()
+            return [stat.st_size, stat.st_mtime_ns]
+        except OSError:
+            return None
@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import hashlib
+
 from libbaram.openfoam.dictionary.dictionary_file import DictionaryFile
 
 from baramFlow.coredb.boundary_db import BoundaryType, BoundaryDB, InterfaceMode, GeometricalType
@@ -89,6 +91,12 @@ class Boundary(DictionaryFile):
 
         return self
 
+    def fullPath(self, processorNo=None):
+        return super().fullPath(self._processorNo if processorNo is None else processorNo)
+
+    def contentHash(self):
+        return hashlib.sha1(str(self._boundaryDict).encode()).hexdigest()
+
     def write(self):
         self._boundaryDict.writeFile()
 
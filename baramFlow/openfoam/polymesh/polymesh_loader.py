@@ -10,7 +10,7 @@ from PyFoam.RunDictionary.ParsedParameterFile import ParsedBoundaryDict
 from PySide6.QtCore import QObject, Signal
 from vtkmodules.vtkIOParallel import vtkPOpenFOAMReader
 from vtkmodules.vtkCommonDataModel import vtkCompositeDataSet
-from vtkmodules.vtkCommonCore import VTK_MULTIBLOCK_DATA_SET, VTK_UNSTRUCTURED_GRID, VTK_POLY_DATA, vtkCommand
+from vtkmodules.vtkCommonCore import VTK_MULTIBLOCK_DATA_SET, VTK_UNSTRUCTURED_GRID, VTK_POLY_DATA
 
 from baramFlow.coredb.general_db import GeneralDB
 from libbaram.openfoam.constants import Directory
@@ -22,6 +22,7 @@ from baramFlow.coredb.cell_zone_db import CellZoneDB
 from baramFlow.openfoam.file_system import FileSystem
 from baramFlow.openfoam.constant.region_properties import RegionProperties
 from baramFlow.mesh.mesh_model import ActorInfo, MeshModel
+from .vtk_mesh_reader import VtkMeshReader
 
 
 logger = logging.getLogger(__name__)
@@ -150,31 +151,10 @@ class PolyMeshLoader(QObject):
         def readerProgressEvent(caller: vtkPOpenFOAMReader, ev):
             self.progress.emit(self.tr('Loading Mesh : ') + f'{int(float(caller.GetProgress()) * 100)}%')
 
-        r = vtkPOpenFOAMReader()
-        r.SetCaseType(
-            vtkPOpenFOAMReader.DECOMPOSED_CASE if FileSystem.processorPath(0) else vtkPOpenFOAMReader.RECONSTRUCTED_CASE)
-        r.SetFileName(str(foamFilePath))
-        r.EnableAllCellArrays()
-        r.EnableAllPointArrays()
-        r.EnableAllPatchArrays()
-        r.EnableAllLagrangianArrays()
-        r.CreateCellToPointOn()
-        r.CacheMeshOn()
-        r.ReadZonesOn()
+        output = VtkMeshReader().read(foamFilePath, FileSystem.processorPath(0) is not None,
+                                      progressEvent=readerProgressEvent)
 
-        r.UpdateInformation()
-
-        for i in range(r.GetNumberOfPatchArrays()):
-            name = r.GetPatchArrayName(i)
-            m = re.search(r'patch/', name)
-            if m is not None:
-                r.SetPatchArrayStatus(name, 1)
-
-        r.AddObserver(vtkCommand.ProgressEvent, readerProgressEvent)
-
-        r.Update()
-
-        vtkMesh = build(r.GetOutput())
+        vtkMesh = build(output)
 
         if 'boundary' in vtkMesh:  # single region mesh
             vtkMesh = {'': vtkMesh}
@@ -234,30 +214,40 @@ class PolyMeshLoader(QObject):
                 pressurePath = f'.//regions/region[name="{rname}"]/initialization/initialValues/pressure'
                 db.setValue(pressurePath, '101325')
 
+            bcnames = list(vtkMesh[rname]['boundary'])
+            bcids = db.addBoundaryConditions(rname, [
+                (bcname,
+                 boundaries[rname][bcname]['type'],
+                 defaultBoundaryType(bcname, GeometricalType(boundaries[rname][bcname]['type'])).value)
+                for bcname in bcnames])
+            for bcname, bcid in zip(bcnames, bcids):
+                boundaries[rname][bcname]['bcid'] = str(bcid)
+
+            if 'zones' in vtkMesh[rname] and 'cellZones' in vtkMesh[rname]['zones']:
+                db.addCellZones(rname, list(vtkMesh[rname]['zones']['cellZones']))
+
+        # Coupled boundaries are set after all the boundaries are added, each pair once
+        for rname in boundaries:
             for bcname in vtkMesh[rname]['boundary']:
                 boundary = boundaries[rname][bcname]
                 geometricalType = GeometricalType(boundary['type'])
-                boundaryType = defaultBoundaryType(bcname, geometricalType)
-                boundary['bcid'] = str(db.addBoundaryCondition(rname, bcname, boundary['type'], boundaryType.value))
-
-                if boundaryType == BoundaryType.INTERFACE:
-                    coupledBoundary = None
-                    if geometricalType == GeometricalType.MAPPED_WALL and 'samplePatch' in boundary:
-                        sampleRegion, samplePatch = getSamplePatch(rname, bcname)
-                        if samplePatch and getSamplePatch(sampleRegion, samplePatch) == (rname, bcname):
-                            coupledBoundary = boundaries[sampleRegion][samplePatch]
-                    elif 'neighbourPatch' in boundary:
-                        neighbourPatch = getNeighbourPatch(rname, bcname)
-                        if neighbourPatch and getNeighbourPatch(rname, neighbourPatch) == (rname, bcname):
-                            coupledBoundary = boundaries[rname][neighbourPatch]
-
-                    if coupledBoundary and 'bcid' in coupledBoundary:
-                        db.setValue(BoundaryDB.getXPath(boundary['bcid']) + '/coupledBoundary', coupledBoundary['bcid'])
-                        db.setValue(BoundaryDB.getXPath(coupledBoundary['bcid']) + '/coupledBoundary', boundary['bcid'])
-
-            if 'zones' in vtkMesh[rname] and 'cellZones' in vtkMesh[rname]['zones']:
-                for czname in vtkMesh[rname]['zones']['cellZones']:
-                    db.addCellZone(rname, czname)
+                if defaultBoundaryType(bcname, geometricalType) != BoundaryType.INTERFACE:
+                    continue
+
+                coupledBoundary = None
+                if geometricalType == GeometricalType.MAPPED_WALL and 'samplePatch' in boundary:
+                    sampleRegion, samplePatch = getSamplePatch(rname, bcname)
+                    if samplePatch and getSamplePatch(sampleRegion, samplePatch) == (rname, bcname):
+                        coupledBoundary = boundaries[sampleRegion][samplePatch]
+                elif 'neighbourPatch' in boundary:
+                    neighbourPatch = getNeighbourPatch(rname, bcname)
+                    if neighbourPatch and getNeighbourPatch(rname, neighbourPatch) == (rname, bcname):
+                        coupledBoundary = boundaries[rname][neighbourPatch]
+
+                if (coupledBoundary and 'bcid' in coupledBoundary
+                        and int(boundary['bcid']) < int(coupledBoundary['bcid'])):
+                    db.setValue(BoundaryDB.getXPath(boundary['bcid']) + '/coupledBoundary', coupledBoundary['bcid'])
+                    db.setValue(BoundaryDB.getXPath(coupledBoundary['bcid']) + '/coupledBoundary', boundary['bcid'])
 
         return True
 
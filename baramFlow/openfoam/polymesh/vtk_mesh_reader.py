@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from pathlib import Path
+from threading import Lock
+
+from vtkmodules.vtkCommonCore import vtkCommand
+from vtkmodules.vtkCommonDataModel import vtkMultiBlockDataSet
+from vtkmodules.vtkIOParallel import vtkPOpenFOAMReader
+
+from baramFlow.openfoam.file_system import FileSystem
+
+
+_mutex = Lock()
+
+
+class VtkMeshReader:
+    """vtkPOpenFOAMReader kept across the loads of a case
+
+    The reader caches the mesh, so loads that do not change the mesh do not read it again.
+    The reader is created again when the case or the mesh files are changed.
+    """
+    def __new__(cls, *args, **kwargs):
+        with _mutex:
+            if not hasattr(cls, '_instance'):
+                cls._instance = super(VtkMeshReader, cls).__new__(cls, *args, **kwargs)
+
+        return cls._instance
+
+    def __init__(self):
+        with _mutex:
+            if hasattr(self, '_initialized'):
+                return
+            else:
+                self._initialized = True
+
+        self._lock = Lock()
+        self._reader = None
+        self._case = None
+        self._mesh = None
+
+    def read(self, foamFilePath: Path, decomposed: bool, progressEvent=None) -> vtkMultiBlockDataSet:
+        """Reads the mesh of the case
+
+        Args:
+            foamFilePath: path of the foam file of the case
+            decomposed: True to read the processor directories of the case
+            progressEvent: observer of the progress events of the reader
+
+        Returns:
+            Mesh read, which is not changed by the following reads
+        """
+        with self._lock:
+            mesh = FileSystem.meshStamp(foamFilePath.parent)
+            if self._reader is None or self._case != (foamFilePath, decomposed) or self._mesh != mesh:
+                self._open(foamFilePath, decomposed)
+                self._mesh = mesh
+
+            r = self._reader
+            observer = r.AddObserver(vtkCommand.ProgressEvent, progressEvent) if progressEvent else None
+            try:
+                r.Update()
+            finally:
+                if observer is not None:
+                    r.RemoveObserver(observer)
+
+            output = vtkMultiBlockDataSet()
+            output.ShallowCopy(r.GetOutput())
+
+            return output
+
+    def clear(self):
+        with self._lock:
+            self._reader = None
+            self._case = None
+            self._mesh = None
+
+    def _open(self, foamFilePath, decomposed):
+        r = vtkPOpenFOAMReader()
+        r.SetCaseType(vtkPOpenFOAMReader.DECOMPOSED_CASE if decomposed else vtkPOpenFOAMReader.RECONSTRUCTED_CASE)
+        r.SetFileName(str(foamFilePath))
+        r.CacheMeshOn()
+        r.ReadZonesOn()
+        r.CreateCellToPointOff()
+
+        r.UpdateInformation()
+
+        r.EnableAllPatchArrays()
+        r.DisableAllCellArrays()
+        r.DisableAllPointArrays()
+        r.DisableAllLagrangianArrays()
+
+        self._reader = r
+        self._case = (foamFilePath, decomposed)
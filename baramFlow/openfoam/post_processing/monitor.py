@@ -1,21 +1,17 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-import time
-
 import pandas as pd
-from PySide6.QtCore import QThread, QObject, QTimer, Signal, Qt
+from PySide6.QtCore import QObject, Signal
 
-from baramFlow.case_manager import CaseManager
 from baramFlow.coredb import coredb
-from baramFlow.coredb.project import Project
 from baramFlow.coredb.monitor_db import MonitorDB
 from baramFlow.coredb.general_db import GeneralDB
 from baramFlow.coredb.run_calculation_db import RunCalculationDB
 from baramFlow.coredb.monitor_db import FieldHelper, Field
 from baramFlow.coredb.boundary_db import BoundaryDB
 from baramFlow.coredb.cell_zone_db import CellZoneDB
-from baramFlow.openfoam.post_processing.post_file_reader import PostFileReader
+from baramFlow.openfoam.post_processing.monitor_service import MonitorService
 
 
 def calculateMaxX():
@@ -36,61 +32,7 @@ def calculateMaxX():
     return maxX
 
 
-class Worker(QObject):
-    dataUpdated = Signal(pd.DataFrame)
-    stopped = Signal()
-    flushed = Signal()
-
-    def __init__(self, name):
-        super().__init__()
-        self._project = Project.instance()
-        self._name = name
-        self._reader = None
-        self._timer = None
-
-    def createReader(self, rname, fileName, extension):
-        self._reader = PostFileReader(self._name, rname, fileName, extension)
-
-    def startMonitor(self):
-        changedFiles = self._reader.chagedFiles()
-        while not changedFiles and CaseManager().isRunning():
-            time.sleep(0.5)
-            changedFiles = self._reader.chagedFiles()
-
-        if changedFiles:
-            for path in changedFiles[1:]:
-                data = self._reader.readDataFrame(path)
-                self.dataUpdated.emit(data)
-
-            self._reader.openMonitor()
-            self._monitor()
-
-            self.flushed.emit()
-
-            if CaseManager().isRunning():
-                self._timer = QTimer()
-                self._timer.setInterval(500)
-                self._timer.timeout.connect(self._monitor)
-                self._timer.start()
-            else:
-                self._reader.closeMonitor()
-
-    def stopMonitor(self):
-        if self._timer:
-            self._timer.stop()
-            self._timer = None
-            self._monitor()
-            self._reader.closeMonitor()
-            self.stopped.emit()
-
-    def _monitor(self):
-        data = self._reader.readTailDataFrame()
-        if data is not None:
-            self.dataUpdated.emit(data)
-
 class Monitor(QObject):
-    startWorker = Signal()
-    stopWorker = Signal()
     stopped = Signal(str)
 
     def __init__(self, name):
@@ -98,14 +40,17 @@ class Monitor(QObject):
 
         self._name = name
         self._rname = ''
-        self._thread = None
-        self._worker = None
+        self._subscribed = False
         self._showChart = True
 
     @property
     def name(self):
         return self._name
 
+    @property
+    def rname(self):
+        return self._rname
+
     @property
     def fileName(self):
         return None
@@ -117,45 +62,29 @@ class Monitor(QObject):
     def visibility(self):
         return self._showChart
 
-    def startThread(self):
-        self._thread = QThread()
-        self._worker = Worker(self.name)
-        self._worker.moveToThread(self._thread)
-        self._worker.createReader(self._rname, self.fileName, self.extension)
-        self._worker.dataUpdated.connect(self._updateChart, type=Qt.ConnectionType.QueuedConnection)
-        self._worker.stopped.connect(self._stopped, type=Qt.ConnectionType.QueuedConnection)
-        self._worker.flushed.connect(self._fitChart, type=Qt.ConnectionType.QueuedConnection)
-
-        self._thread.started.connect(self._worker.startMonitor, type=Qt.ConnectionType.QueuedConnection)
-        self._thread.start()
-
-        self.startWorker.connect(self._worker.startMonitor, type=Qt.ConnectionType.QueuedConnection)
-        self.stopWorker.connect(self._worker.stopMonitor, type=Qt.ConnectionType.QueuedConnection)
-
     def start(self):
-        if self._worker:
-            self.startWorker.emit()
+        if self._subscribed:
+            MonitorService().start(self)
         else:
-            self.startThread()
+            MonitorService().subscribe(self)
+            self._subscribed = True
 
     def stop(self):
-        self.stopWorker.emit()
+        if self._subscribed:
+            MonitorService().stop(self)
 
     def quit(self):
         self.stop()
-        if self._thread:
-            self._thread.quit()
-            self._thread.wait()
-            self._thread = None
+        if self._subscribed:
+            MonitorService().unsubscribe(self)
+            self._subscribed = False
 
-    def _updateChart(self, data):
+    def updateChart(self, data):
         pass
 
-    def _fitChart(self):
+    def fitChart(self):
         pass
 
-    def _stopped(self):
-        self.stopped.emit(self._name)
 
 class ForceMonitor(Monitor):
     def __init__(self, name, chart1, chart2, chart3):
@@ -178,12 +107,12 @@ class ForceMonitor(Monitor):
     def fileName(self):
         return 'coefficient'
 
-    def _updateChart(self, data):
+    def updateChart(self, data):
         self._chart1.appendData(pd.DataFrame(data, columns=['Cd']))
         self._chart2.appendData(pd.DataFrame(data, columns=['Cl']))
         self._chart3.appendData(pd.DataFrame(data, columns=['CmPitch']).rename(columns={'CmPitch': 'Cm'}))
 
-    def _fitChart(self):
+    def fitChart(self):
         self._chart1.fitChart()
         self._chart2.fitChart()
         self._chart3.fitChart()
@@ -212,10 +141,10 @@ class PointMonitor(Monitor):
     def extension(self):
         return ''
 
-    def _updateChart(self, data):
+    def updateChart(self, data):
         self._chart.appendData(data)
 
-    def _fitChart(self):
+    def fitChart(self):
         self._chart.fitChart()
 
 
@@ -236,10 +165,10 @@ class SurfaceMonitor(Monitor):
     def fileName(self):
         return 'surfaceFieldValue'
 
-    def _updateChart(self, data):
+    def updateChart(self, data):
         self._chart.appendData(data)
 
-    def _fitChart(self):
+    def fitChart(self):
         self._chart.fitChart()
 
 
@@ -260,9 +189,9 @@ class VolumeMonitor(Monitor):
     def fileName(self):
         return 'volFieldValue'
 
-    def _updateChart(self, data):
+    def updateChart(self, data):
         self._chart.appendData(data)
 
-    def _fitChart(self):
+    def fitChart(self):
         self._chart.fitChart()
 
@@ -0,0 +1,256 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from threading import Lock
+
+import pandas as pd
+from PySide6.QtCore import QThread, QObject, QTimer, QFileSystemWatcher, Signal, Qt
+
+from baramFlow.case_manager import CaseManager
+from baramFlow.openfoam.post_processing.post_file_reader import PostFileReader
+
+
+READ_INTERVAL = 500     # Changes of monitor files in this interval are read at once
+SCAN_INTERVAL = 500     # Interval to look for the files of monitors not written yet
+
+_mutex = Lock()
+
+
+class _Subscription:
+    def __init__(self, reader):
+        self.reader = reader
+        self.path = None
+        self.watched = False
+
+
+class Worker(QObject):
+    dataUpdated = Signal(str, pd.DataFrame)
+    flushed = Signal(str)
+    stopped = Signal(str)
+
+    def __init__(self):
+        super().__init__()
+
+        self._subscriptions = {}
+        self._files = {}
+        self._changed = set()
+        self._pending = set()
+
+        self._watcher = None
+        self._readTimer = None
+        self._scanTimer = None
+
+    def add(self, name, rname, fileName, extension):
+        if self._watcher is None:
+            self._watcher = QFileSystemWatcher()
+            self._watcher.fileChanged.connect(self._fileChanged)
+
+            self._readTimer = QTimer()
+            self._readTimer.setSingleShot(True)
+            self._readTimer.setInterval(READ_INTERVAL)
+            self._readTimer.timeout.connect(self._readChanged)
+
+            self._scanTimer = QTimer()
+            self._scanTimer.setInterval(SCAN_INTERVAL)
+            self._scanTimer.timeout.connect(self._scanPending)
+
+        self._remove(name)
+        self._subscriptions[name] = _Subscription(PostFileReader(name, rname, fileName, extension))
+        self.start(name)
+
+    def start(self, name):
+        if name not in self._subscriptions:
+            return
+
+        if not self._scan(name) and CaseManager().isRunning():
+            self._pending.add(name)
+            if not self._scanTimer.isActive():
+                self._scanTimer.start()
+
+    def stop(self, name):
+        self._pending.discard(name)
+        if subscription := self._subscriptions.get(name):
+            if subscription.watched:
+                self._unwatch(name)
+                self._emitTail(name)
+                subscription.reader.closeMonitor()
+                self.stopped.emit(name)
+
+    def remove(self, name):
+        self._remove(name)
+
+        if not self._subscriptions and self._watcher is not None:
+            self._readTimer.stop()
+            self._scanTimer.stop()
+
+    def _remove(self, name):
+        self._pending.discard(name)
+        self._changed.discard(name)
+        if subscription := self._subscriptions.pop(name, None):
+            if subscription.watched:
+                self._unwatch(name, subscription)
+                subscription.reader.closeMonitor()
+
+    def _scan(self, name):
+        subscription = self._subscriptions[name]
+        reader = subscription.reader
+        changedFiles = reader.chagedFiles()
+        if not changedFiles:
+            return False
+
+        for path in changedFiles[1:]:
+            self.dataUpdated.emit(name, reader.readDataFrame(path))
+
+        reader.openMonitor()
+        self._emitTail(name)
+
+        self.flushed.emit(name)
+
+        if CaseManager().isRunning():
+            self._watch(name, subscription)
+        else:
+            reader.closeMonitor()
+
+        return True
+
+    def _scanPending(self):
+        for name in list(self._pending):
+            if self._scan(name) or not CaseManager().isRunning():
+                self._pending.discard(name)
+
+        if not self._pending:
+            self._scanTimer.stop()
+
+    def _watch(self, name, subscription):
+        path = str(subscription.reader.currentFilePath)
+        subscription.path = path
+        subscription.watched = True
+        self._files.setdefault(path, set()).add(name)
+        if not self._watcher.addPath(path):
+            # Watching fails when the system runs out of watches, then the file is read at every interval
+            self._changed.add(name)
+
+        if not self._readTimer.isActive():
+            self._readTimer.start()
+
+    def _unwatch(self, name, subscription=None):
+        subscription = subscription or self._subscriptions[name]
+        names = self._files.get(subscription.path, set())
+        names.discard(name)
+        if not names:
+            self._files.pop(subscription.path, None)
+            if subscription.path in self._watcher.files():
+                self._watcher.removePath(subscription.path)
+
+        subscription.path = None
+        subscription.watched = False
+        self._changed.discard(name)
+
+    def _fileChanged(self, path):
+        self._changed.update(self._files.get(path, ()))
+        if not self._readTimer.isActive():
+            self._readTimer.start()
+
+    def _readChanged(self):
+        unwatched = set()
+        for name in self._changed:
+            self._emitTail(name)
+            if self._subscriptions[name].path not in self._watcher.files():
+                unwatched.add(name)
+
+        self._changed = unwatched
+        if self._changed:
+            self._readTimer.start()
+
+    def _emitTail(self, name):
+        data = self._subscriptions[name].reader.readTailDataFrame()
+        if data is not None:
+            self.dataUpdated.emit(name, data)
+
+
+class MonitorService(QObject):
+    """Reads the files of all monitors in a thread
+
+    The files being written by the solver are watched by a QFileSystemWatcher,
+    which uses the notification of the system such as inotify or polls the files if it is not available.
+    Changes in an interval are read together, and the rows appended are dispatched to the subscribed monitors.
+    """
+    _add = Signal(str, str, str, str)
+    _start = Signal(str)
+    _stop = Signal(str)
+    _remove = Signal(str)
+
+    def __new__(cls, *args, **kwargs):
+        with _mutex:
+            if not hasattr(cls, '_instance'):
+                cls._instance = super(MonitorService, cls).__new__(cls, *args, **kwargs)
+
+        return cls._instance
+
+    def __init__(self):
+        with _mutex:
+            if hasattr(self, '_initialized'):
+                return
+            else:
+                self._initialized = True
+
+        super().__init__()
+
+        self._monitors = {}
+        self._thread = None
+        self._worker = None
+
+    def subscribe(self, monitor):
+        if self._thread is None:
+            self._startThread()
+
+        self._monitors[monitor.name] = monitor
+        self._add.emit(monitor.name, monitor.rname, monitor.fileName, monitor.extension)
+
+    def start(self, monitor):
+        self._start.emit(monitor.name)
+
+    def stop(self, monitor):
+        self._stop.emit(monitor.name)
+
+    def unsubscribe(self, monitor):
+        if self._monitors.get(monitor.name) is not monitor:
+            return
+
+        del self._monitors[monitor.name]
+        self._remove.emit(monitor.name)
+
+        if not self._monitors:
+            self._thread.quit()
+            self._thread.wait()
+            self._thread = None
+            self._worker = None
+
+    def _startThread(self):
+        self._thread = QThread()
+        self._worker = Worker()
+        self._worker.moveToThread(self._thread)
+
+        self._worker.dataUpdated.connect(self._dataUpdated, type=Qt.ConnectionType.QueuedConnection)
+        self._worker.flushed.connect(self._flushed, type=Qt.ConnectionType.QueuedConnection)
+        self._worker.stopped.connect(self._stopped, type=Qt.ConnectionType.QueuedConnection)
+
+        self._add.connect(self._worker.add, type=Qt.ConnectionType.QueuedConnection)
+        self._start.connect(self._worker.start, type=Qt.ConnectionType.QueuedConnection)
+        self._stop.connect(self._worker.stop, type=Qt.ConnectionType.QueuedConnection)
+        # Blocked until removed, for the thread not to quit before
+        self._remove.connect(self._worker.remove, type=Qt.ConnectionType.BlockingQueuedConnection)
+
+        self._thread.start()
+
+    def _dataUpdated(self, name, data):
+        if monitor := self._monitors.get(name):
+            monitor.updateChart(data)
+
+    def _flushed(self, name):
+        if monitor := self._monitors.get(name):
+            monitor.fitChart()
+
+    def _stopped(self, name):
+        if monitor := self._monitors.get(name):
+            monitor.stopped.emit(name)
@@ -1,11 +1,10 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from io import StringIO
-
-import pandas as pd
 from PySide6.QtCore import QObject
 
+from libbaram.openfoam.dat_file import DatFile
+
 from baramFlow.openfoam.file_system import FileSystem
 
 
@@ -20,9 +19,10 @@ class PostFileReader(QObject):
         self._files = {}
         self._currentFilePath = None
         self._currentFile = None
-        self._header = None
-        self._newLine = ''
-        self._cols = None
+
+    @property
+    def currentFilePath(self):
+        return self._currentFilePath
 
     def chagedFiles(self):
         self._currentFilePath = None
@@ -45,44 +45,17 @@ class PostFileReader(QObject):
         return changedFiles
 
     def readDataFrame(self, path):
-        with path.open(mode='r') as f:
-            header = None
-            line = f.readline()
-            while line[0] == '#':
-                p = f.tell()
-                header = line
-                line = f.readline()
-
-            names = header[1:].split()  # read header
-            if names[0] != 'Time':
-                raise RuntimeError
-            if len(names) == 1:
-                names.append(self._currentFilePath.stem)
-
-            f.seek(p)
-            df = pd.read_csv(f, sep=r'\s+', names=names, skiprows=0)
-            df.set_index('Time', inplace=True)
-
-            return df
+        return self._readDataFrame(DatFile(path), final=True)
 
     def readTailDataFrame(self):
-        if tail := self._readUpdatedLines():
-            stream = StringIO(tail)
-            df = pd.read_csv(stream, sep=r'\s+', names=self._header)
-            stream.close()
-            df.set_index('Time', inplace=True)
-
-            return df
-
-        return None
+        return self._readDataFrame(self._currentFile)
 
     def openMonitor(self):
         if self._currentFilePath:
-            self._currentFile = open(self._currentFilePath, 'r')
+            self._currentFile = DatFile(self._currentFilePath)
 
     def closeMonitor(self):
         if self._currentFile:
-            self._currentFile.close()
             self._currentFile = None
             self._files[self._currentFilePath] = self._currentFilePath.stat().st_size
             self._currentFilePath = None
@@ -95,22 +68,17 @@ class PostFileReader(QObject):
 
         return False
 
-    def _readUpdatedLines(self):
-        lines = self._newLine
-
-        line = self._currentFile.readline()
-        if line and line.endswith('\n'):     # complete at least one line including comments
-            while line.endswith('\n'):
-                lines += line
-                if lines[0] == '#':
-                    self._header = lines[1:].split()
-                    if len(self._header) == 1:
-                        self._header.append(self._currentFilePath.stem)
-                    lines = ''
-                line = self._currentFile.readline()
-
-            self._newLine = line    # Incomplete line is replaced by the new line
-            return lines
-
-        self._newLine += line       # New line is still incomplete.
-        return ''
+    def _readDataFrame(self, datFile, final=False):
+        if not datFile.readHeader():
+            return None
+
+        names = datFile.comments[-1].split() if datFile.comments else []
+        if not names or names[0] != 'Time':
+            raise RuntimeError
+        if len(names) == 1:
+            names.append(self._currentFilePath.stem)
+
+        if (df := datFile.read(names, final=final)) is not None:
+            df.set_index('Time', inplace=True)
+
+        return df
@@ -121,6 +121,9 @@ class RedistributionTask(QObject):
             logger.info(ex, exc_info=True)
             raise
 
-    def _reportTimeProgress(self, msg):
-        if msg.startswith('Time = '):
+    def _reportTimeProgress(self, output):
+        # Lines are emitted in batches, and only the last time of them is reported
+        times = [line for line in output.splitlines() if line.startswith('Time = ')]
+        if times:
+            msg = times[-1]
             self.progress.emit(self.tr(f'Reconstructing the case. {self._caseName} ({msg.strip()}/{self._latestTime})'))
@@ -3,8 +3,7 @@
 
 import glob
 import re
-from typing import TextIO, Optional
-from io import StringIO
+from typing import Optional
 from pathlib import Path
 from dataclasses import dataclass
 import logging
@@ -13,7 +12,10 @@ import numpy as np
 import pandas as pd
 from PySide6.QtCore import Qt, QTimer, QObject, QThread, Signal
 
+from libbaram.openfoam.dat_file import DatFile
+
 from baramFlow.case_manager import CaseManager
+from baramFlow.libbaram.time_series import TimeSeriesStore
 
 
 # "solverInfo.dat" sample
@@ -42,78 +44,14 @@ class _SolverInfo:
     dup: str
     size: int
     path: Path
-    f: Optional[TextIO]
-
-
-def readCompleteLineOnly(f):
-    line = f.readline()
-    if line.endswith('\n'):
-        if hasattr(f, 'incompleteLine'):
-            line = f.incompleteLine + line
-            f.incompleteLine = ''
-        return line
-    else:
-        if hasattr(f, 'incompleteLine'):
-            f.incompleteLine += line
-        else:
-            f.incompleteLine = line
-        return ''
-
-
-def readOutFile(f: TextIO):
-    lines = ''
-
-    while line := readCompleteLineOnly(f):
-        if not hasattr(f, 'residualHeader'):  # Initial State
-            if not line.startswith('# Solver information'):
-                raise RuntimeError
-            f.residualHeader = None
-        elif not f.residualHeader:  # Waiting residual header
-            names = line.split()
-            names.pop(0)  # remove '#' from the list
-            if names[0] != 'Time':
-                raise RuntimeError
-            f.residualHeader = names
-        else:  # Parse residuals
-            lines += line
-
-    if hasattr(f, 'residualHeader'):
-        return lines, f.residualHeader
-    else:
-        return lines, None
-
-
-def mergeDataFrames(data: [pd.DataFrame]):
-    merged = None
-    for df in data:
-        if merged is None:
-            merged = df
-        else:
-            left_on = {'Time', *(merged.columns.values.tolist())}
-            right_on = {'Time', *(df.columns.values.tolist())}
-            on = list(left_on.intersection(right_on))
-            merged = pd.merge(merged, df, how='outer', on=on)
-
-    return merged
-
-
-def updateData(target, source):
-    if target is None:
-        return source
-    else:
-        # Drop obsoleted rows.
-        # Dataframes should be kept PER REGION because of this dropping.
-        # If dataframes of regions are merged, updated data in other regions can be lost.
-        time = source.first_valid_index()
-        filtered = target[target.index < time]
-        return mergeDataFrames([filtered, source])
+    datFile: Optional[DatFile]
 
 
 class Worker(QObject):
     start = Signal()
     stop = Signal()
     updateResiduals = Signal()
-    residualsUpdated = Signal(pd.DataFrame)
+    residualsUpdated = Signal(str, pd.DataFrame)  # Region name, New rows
     flushed = Signal()
 
     def __init__(self, casePath: Path, regions: [str]):
@@ -146,7 +84,7 @@ class Worker(QObject):
         self.collectionReady = False
 
         self.changingFiles = {r: None for r in self.regions}
-        self.data = {r: None for r in self.regions}
+        self.data = {r: TimeSeriesStore() for r in self.regions}
 
         if self.running:
             # Get current snapshot of info files
@@ -168,9 +106,6 @@ class Worker(QObject):
 
         self.process()
 
-        for s in self.changingFiles.values():
-            if s is not None:  # "s" could remain "None" if the solver stops by error as soon as it starts
-                s.f.close()
         QThread.currentThread().quit()
         self.running = False
 
@@ -191,35 +126,26 @@ class Worker(QObject):
                 return
             else:  # Now, Ready to collect
                 self.collectionReady = True
-                hasUpdate = False
                 for s in self.infoFiles.values():
                     if s not in self.changingFiles.values():  # not-changing files
                         df = self._getDataFrame(s.rname, s.path)
                         if df is not None:
-                            self.data[s.rname] = updateData(self.data[s.rname], df)
+                            self.data[s.rname].append(df)
 
                 for s in self.changingFiles.values():
-                    s.f = open(s.path, 'r')
-                    updated, df = self._updateDataFromFile(self.data[s.rname], s.rname, s.f)
-                    if updated:
-                        self.data[s.rname] = updateData(self.data[s.rname], df)
-                        hasUpdate = True
+                    s.datFile = DatFile(s.path)
+                    if (df := self._readDataFrame(s.rname, s.datFile)) is not None:
+                        self.data[s.rname].append(df)
 
-                if hasUpdate:
-                    self.residualsUpdated.emit(mergeDataFrames(self.data.values()))
+                self.update()
 
                 return
 
         # regular update routine
-        hasUpdate = False
         for s in updatedFiles.values():
-            updated, df = self._updateDataFromFile(self.data[s.rname], s.rname, self.infoFiles[s.path].f)
-            if updated:
-                self.data[s.rname] = df
-                hasUpdate = True
-
-        if hasUpdate:
-            self.residualsUpdated.emit(mergeDataFrames(self.data.values()))
+            if (df := self._readDataFrame(s.rname, self.infoFiles[s.path].datFile)) is not None:
+                self.data[s.rname].append(df)
+                self.residualsUpdated.emit(s.rname, df)
 
     def getUpdatedFiles(self, current: {Path: _SolverInfo}) -> {Path: _SolverInfo}:
         infoFiles = self.getInfoFiles()
@@ -265,39 +191,33 @@ class Worker(QObject):
         return infoFiles
 
     def update(self):
-        self.residualsUpdated.emit(mergeDataFrames(self.data.values()))
+        for rname, store in self.data.items():
+            if len(store) > 0:
+                self.residualsUpdated.emit(rname, store.frame())
 
-    def _updateDataFromFile(self, target: pd.DataFrame, rname: str, f: TextIO) -> (bool, pd.DataFrame):
-        lines, names = readOutFile(f)
-        if not lines:
-            return False, target
+    def _readDataFrame(self, rname: str, datFile: DatFile, final=False) -> Optional[pd.DataFrame]:
+        if not datFile.readHeader():
+            return None
 
-        names, columns = self._getResidualHeader(names, rname)
+        if not datFile.comments or datFile.comments[0] != 'Solver information' or len(datFile.comments) < 2:
+            raise RuntimeError
+
+        names = datFile.comments[1].split()
+        if names[0] != 'Time':
+            raise RuntimeError
 
-        stream = StringIO(lines)
-        df = pd.read_csv(stream, sep=r'\s+', names=names, dtype={'Time': np.float64})[columns]
-        stream.close()
+        # Only the columns to show are converted, not the names of linear solvers and convergence flags
+        names, columns = self._getResidualHeader(names, rname)
+        df = datFile.read(names, usecols=columns, dtype=np.float64, final=final)
+        if df is None:
+            return None
 
         df.set_index('Time', inplace=True)
 
-        return True, updateData(target, df)
+        return df[columns[1:]]
 
     def _getDataFrame(self, rname, path) -> Optional[pd.DataFrame]:
-        with path.open(mode='r') as f:
-            f.readline()  # skip '# Solver information' comment
-            names = f.readline().split()  # read header
-            if len(names) == 0:
-                return None
-
-            names.pop(0)  # remove '#' from the list
-            if names[0] != 'Time':
-                raise RuntimeError
-
-            names, columns = self._getResidualHeader(names, rname)
-
-            df = pd.read_csv(f, sep=r'\s+', names=names, dtype={'Time': np.float64}, skiprows=0)[columns]
-            df.set_index('Time', inplace=True)
-            return df
+        return self._readDataFrame(rname, DatFile(path), final=True)
 
     def _getResidualHeader(self, names: [str], rname: str):
         header = names.copy()
@@ -315,7 +235,7 @@ class Worker(QObject):
 
 
 class SolverInfoManager(QObject):
-    residualsUpdated = Signal(pd.DataFrame)
+    residualsUpdated = Signal(str, pd.DataFrame)  # Region name, New rows
     flushed = Signal()
 
     def __init__(self):
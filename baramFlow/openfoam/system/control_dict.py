@@ -23,7 +23,7 @@ from baramFlow.coredb.numerical_db import NumericalDB
 from baramFlow.coredb.reference_values_db import ReferenceValuesDB
 from baramFlow.coredb.region_db import RegionDB
 from baramFlow.coredb.run_calculation_db import RunCalculationDB, TimeSteppingMethod
-from baramFlow.mesh.vtk_loader import isPointInDataSet
+from baramFlow.mesh.vtk_loader import locatePoints
 from baramFlow.openfoam.file_system import FileSystem
 from baramFlow.openfoam.solver import findSolver, getSolverCapability
 from .fv_options import generateSourceTermField, generateFixedValueField
@@ -156,6 +156,30 @@ def getRegionNumbers() -> dict:
     return regionNum
 
 
+def locatePointMonitors():
+    """Sets the regions of the point monitors not set, by locating all the points at once
+
+    The regions are written to the configuration, so this is called before generating the case from its copy.
+    """
+    db = CoreDBReader()
+    regions = db.getRegions()
+    if len(regions) < 2:
+        return
+
+    xpaths = []
+    for name in db.getPointMonitors():
+        xpath = MonitorDB.getPointMonitorXPath(name)
+        if db.getValue(xpath + '/snapOntoBoundary') != 'true' and not db.getValue(xpath + '/region'):
+            xpaths.append(xpath)
+
+    if xpaths:
+        located = locatePoints([db.getVector(xpath + '/coordinate') for xpath in xpaths],
+                               {rname: app.internalMeshActor(rname) for rname in regions})
+        for xpath, rname in zip(xpaths, located):
+            if rname is not None:
+                coredb.CoreDB().setValue(xpath + '/region', rname)
+
+
 class ControlDict(DictionaryFile):
     def __init__(self):
         super().__init__(FileSystem.caseRoot(), self.systemLocation(), 'controlDict')
@@ -419,15 +443,6 @@ class ControlDict(DictionaryFile):
                 'log': 'false',
             }
         else:
-            if not region:
-                regions = self._db.getRegions()
-                if len(regions) > 1:
-                    for rname in regions:
-                        if isPointInDataSet(coordinate, app.internalMeshActor(rname).dataSet):
-                            self._db.setValue(xpath + '/region', rname)
-                            region = rname
-                            break
-
             field = self._getMonitorField(xpath, region)
             if not field:
                 return None
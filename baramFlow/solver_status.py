@@ -36,6 +36,9 @@ class SolverProcess:
     def isRunning(self):
         return process.isRunning(self._pid, self._startTime)
 
+    async def wait(self):
+        await process.waitProcess(self._pid, self._startTime)
+
     def kill(self):
         if not self.isRunning():
             return
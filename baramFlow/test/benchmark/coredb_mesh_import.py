@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Benchmark for adding the boundaries and cell zones of a mesh to CoreDB
+
+Compares adding the elements one by one with the bulk APIs used by PolyMeshLoader.
+
+Usage: python -m baramFlow.test.benchmark.coredb_mesh_import [--patches N [N ...]] [--zones N]
+"""
+
+import argparse
+import time
+
+from baramFlow.coredb import coredb
+from baramFlow.coredb.material_db import MaterialDB
+
+
+def createDB():
+    db = coredb.createDB()
+    MaterialDB.addMaterial(db, 'air')
+    db.addRegion('region')
+
+    return db
+
+
+def addOneByOne(db, numPatches, numZones):
+    for i in range(numPatches):
+        db.addBoundaryCondition('region', f'patch{i}', 'patch', 'wall')
+
+    for i in range(numZones):
+        db.addCellZone('region', f'zone{i}')
+
+
+def addInBulk(db, numPatches, numZones):
+    db.addBoundaryConditions('region', [(f'patch{i}', 'patch', 'wall') for i in range(numPatches)])
+    db.addCellZones('region', [f'zone{i}' for i in range(numZones)])
+
+
+def measure(function, numPatches, numZones):
+    db = createDB()
+
+    start = time.perf_counter()
+    with db:
+        function(db, numPatches, numZones)
+    elapsed = time.perf_counter() - start
+
+    coredb.destroy()
+
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark adding the boundaries and cell zones of a mesh to CoreDB')
+    parser.add_argument('--patches', type=int, nargs='+', default=[5000, 20000, 50000],
+                        help='numbers of patches of the meshes')
+    parser.add_argument('--zones', type=int, default=100, help='number of cell zones of the meshes')
+    args = parser.parse_args()
+
+    for numPatches in args.patches:
+        oneByOne = measure(addOneByOne, numPatches, args.zones)
+        bulk = measure(addInBulk, numPatches, args.zones)
+        print(f'{numPatches} patches, {args.zones} zones: '
+              f'one by one {oneByOne:.3f} s, bulk {bulk:.3f} s ({oneByOne / bulk:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
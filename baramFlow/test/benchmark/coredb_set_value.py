@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Benchmark for CoreDB.setValue on a large configuration
+
+Usage: python -m baramFlow.test.benchmark.coredb_set_value [--boundaries N] [--calls N]
+"""
+
+import argparse
+import time
+
+from baramFlow.coredb import coredb
+from baramFlow.coredb.boundary_db import BoundaryDB
+from baramFlow.coredb.material_db import MaterialDB
+
+
+def buildConfiguration(db, numBoundaries):
+    MaterialDB.addMaterial(db, 'air')
+    db.addRegion('region')
+    for i in range(numBoundaries):
+        db.addBoundaryCondition('region', f'patch{i}', 'patch', 'wall')
+
+    for i in range(10):
+        db.addForceMonitor()
+        db.addPointMonitor()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark CoreDB.setValue on a large configuration')
+    parser.add_argument('--boundaries', type=int, default=2000, help='number of boundary conditions')
+    parser.add_argument('--calls', type=int, default=10000, help='number of setValue calls')
+    args = parser.parse_args()
+
+    db = coredb.createDB()
+
+    start = time.perf_counter()
+    buildConfiguration(db, args.boundaries)
+    print(f'Build {args.boundaries} boundaries: {time.perf_counter() - start:.3f} s')
+
+    start = time.perf_counter()
+    for i in range(args.calls):
+        bcid = i % args.boundaries + 1
+        db.setValue(BoundaryDB.getXPath(bcid) + '/temperature/constant', str(300 + i % 50))
+    elapsed = time.perf_counter() - start
+    print(f'{args.calls} setValue calls: {elapsed:.3f} s ({elapsed / args.calls * 1e6:.1f} us/call)')
+
+    start = time.perf_counter()
+    db.validateAll()
+    print(f'Full-tree validation: {time.perf_counter() - start:.3f} s')
+
+    coredb.destroy()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Benchmark for reading solverInfo.dat
+
+Compares reading the lines into a string parsed by pandas through StringIO, as SolverInfoManager did,
+with DatFile reading the bytes in chunks and converting only the columns to show.
+
+Usage: python -m baramFlow.test.benchmark.dat_file_parsing [--size MB] [--path FILE]
+"""
+
+import argparse
+import tempfile
+import time
+from io import StringIO
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from libbaram.openfoam.dat_file import DatFile
+
+
+FIELDS = ['Ux', 'Uy', 'Uz', 'p_rgh', 'k', 'omega', 'T']
+ROW_BLOCK = 10000
+
+
+def names():
+    header = ['Time', 'U_solver']
+    for field in FIELDS[:3]:
+        header.extend([f'{field}_initial', f'{field}_final', f'{field}_iters'])
+    header.append('U_converged')
+    for field in FIELDS[3:]:
+        header.extend([f'{field}_solver', f'{field}_initial', f'{field}_final', f'{field}_iters', f'{field}_converged'])
+
+    return header
+
+
+def writeSolverInfo(path: Path, size):
+    rng = np.random.default_rng(0)
+    with path.open('w') as f:
+        f.write('# Solver information\n')
+        f.write('# ' + '\t'.join(f'{name:<16}' for name in names()) + '\n')
+
+        time_ = 0
+        while f.tell() < size:
+            rows = []
+            for values in rng.random((ROW_BLOCK, len(FIELDS) * 2)):
+                time_ += 1
+                row = [f'{time_ * 1e-3:<16g}', 'DILUPBiCGStab']
+                for i in range(3):
+                    row.extend([f'{values[i * 2]:.8e}', f'{values[i * 2 + 1]:.8e}', '1'])
+                row.append('false')
+                for i in range(3, len(FIELDS)):
+                    row.extend(['GAMG', f'{values[i * 2]:.8e}', f'{values[i * 2 + 1]:.8e}', '3', 'false'])
+                rows.append('\t'.join(row) + '\n')
+            f.write(''.join(rows))
+
+
+def columns():
+    return ['Time'] + [name for name in names() if name.endswith('_initial')]
+
+
+def readAsBefore(path):
+    lines = ''
+    with path.open() as f:
+        f.readline()
+        f.readline()
+        while (line := f.readline()).endswith('\n'):
+            lines += line
+
+    stream = StringIO(lines)
+    df = pd.read_csv(stream, sep=r'\s+', names=names(), dtype={'Time': np.float64})[columns()]
+    stream.close()
+    df.set_index('Time', inplace=True)
+
+    return df
+
+
+def readByDatFile(path):
+    datFile = DatFile(path)
+    datFile.readHeader()
+    df = datFile.read(datFile.comments[1].split(), usecols=columns(), dtype=np.float64)
+    df.set_index('Time', inplace=True)
+
+    return df
+
+
+def measure(function, path):
+    start = time.perf_counter()
+    df = function(path)
+
+    return time.perf_counter() - start, df
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark reading solverInfo.dat')
+    parser.add_argument('--size', type=int, default=1024, help='size of the file generated in MB')
+    parser.add_argument('--path', type=Path, help='solverInfo.dat to read instead of generating one')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = args.path
+        if path is None:
+            path = Path(directory) / 'solverInfo.dat'
+            writeSolverInfo(path, args.size * 1024 * 1024)
+
+        print(f'{path}: {path.stat().st_size / 1024 / 1024:.0f} MB')
+
+        datFile, new = measure(readByDatFile, path)
+        print(f'DatFile {datFile:.3f} s, {len(new)} rows')
+
+        before, old = measure(readAsBefore, path)
+        print(f'StringIO {before:.3f} s ({before / datFile:.1f}x)')
+
+        pd.testing.assert_frame_equal(old[new.columns], new)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+import unittest
+
+from lxml import etree
+
+from baramFlow.coredb.element_index import ElementIndex
+from baramFlow.coredb.libdb import ns
+
+
+def _element(parent, tag, text=None, **attributes):
+    element = etree.SubElement(parent, f'{{{ns}}}{tag}', **attributes)
+    if text is not None:
+        element.text = text
+
+    return element
+
+
+class TestElementIndex(unittest.TestCase):
+    def setUp(self):
+        root = etree.Element(f'{{{ns}}}configuration')
+        regions = _element(root, 'regions')
+        self.region = _element(regions, 'region')
+        _element(self.region, 'name', 'fluid')
+        self.cellZones = _element(self.region, 'cellZones')
+        self.boundaries = _element(self.region, 'boundaryConditions')
+
+        self.cellZone = self._addCellZone('1', 'All')
+        self.inlet = self._addBoundaryCondition('1', 'inlet')
+        self.outlet = self._addBoundaryCondition('2', 'outlet')
+
+        self.index = ElementIndex(etree.ElementTree(root), 100, 100)
+
+    def _addBoundaryCondition(self, bcid, name):
+        element = _element(self.boundaries, 'boundaryCondition', bcid=bcid)
+        _element(element, 'name', name)
+        _element(element, 'physicalType', 'wall')
+
+        return element
+
+    def _addCellZone(self, czid, name):
+        element = _element(self.cellZones, 'cellZone', czid=czid)
+        _element(element, 'name', name)
+
+        return element
+
+    def testLookup(self):
+        self.assertIs(self.region, self.index.region('fluid'))
+        self.assertIs(self.outlet, self.index.boundaryCondition(2))
+        self.assertIs(self.inlet, self.index.boundaryConditionByName('fluid', 'inlet'))
+        self.assertIs(self.cellZone, self.index.cellZone('1'))
+        self.assertIs(self.cellZone, self.index.cellZoneByName('fluid', 'All'))
+        self.assertIsNone(self.index.boundaryCondition(3))
+
+    def testFind(self):
+        self.assertEqual('wall', self.index.find(
+            '/regions/region/boundaryConditions/boundaryCondition[@bcid="2"]/physicalType').text)
+        self.assertIs(self.inlet, self.index.find(
+            '/regions/region[name="fluid"]/boundaryConditions/boundaryCondition[name="inlet"]'))
+        self.assertIsNone(self.index.find('/regions/region[name="solid"]'))
+        with self.assertRaises(KeyError):
+            self.index.find('.//boundaryCondition[@bcid="1"]')
+
+    def testAddedAndRemoved(self):
+        self.index.region('fluid')
+
+        wall = self._addBoundaryCondition('3', 'wall')
+        self.index.added(wall)
+        self.assertIs(wall, self.index.boundaryCondition(3))
+
+        self.boundaries.remove(self.inlet)
+        self.index.removed(self.inlet, self.boundaries)
+        self.assertIsNone(self.index.boundaryCondition(1))
+        self.assertIsNone(self.index.boundaryConditionByName('fluid', 'inlet'))
+
+    def testStaleEntries(self):
+        self.index.region('fluid')
+
+        # Changed without notifying the index
+        self.boundaries.remove(self.inlet)
+        self.inlet.set('bcid', '3')
+        self.boundaries.append(self.inlet)
+        self.outlet.find(f'{{{ns}}}name').text = 'exit'
+
+        self.assertIsNone(self.index.boundaryCondition(1))
+        self.assertIs(self.inlet, self.index.boundaryCondition(3))
+        self.assertIsNone(self.index.boundaryConditionByName('fluid', 'outlet'))
+        self.assertIs(self.outlet, self.index.boundaryConditionByName('fluid', 'exit'))
+
+    def testAvailableIds(self):
+        self.assertEqual(3, self.index.availableBcid())
+        self.assertEqual(2, self.index.availableCzid())
+
+        self.boundaries.remove(self.inlet)
+        self.index.removed(self.inlet, self.boundaries)
+        self.assertEqual(1, self.index.availableBcid())
+
+    def testInvalidate(self):
+        self.index.region('fluid')
+
+        self.index.invalidate()
+        wall = self._addBoundaryCondition('3', 'wall')
+        self.assertIs(wall, self.index.boundaryConditionByName('fluid', 'wall'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+import unittest
+import shutil
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+from baramFlow.coredb import coredb
+from baramFlow.coredb.filedb import FileDB, BcFileRole
+
+
+class TestFileDB(unittest.TestCase):
+    def setUp(self):
+        self._path = Path(tempfile.mkdtemp())
+        self._csvFile = self._path / 'temperature.csv'
+        self._csvFile.write_text('0,0,0,300\n1,0,0,310\n')
+
+        coredb.createDB()
+        self._fileDB = FileDB(self._path)
+        self._fileDB.saveCoreDB()
+
+    def tearDown(self) -> None:
+        self._fileDB.close()
+        coredb.destroy()
+        shutil.rmtree(self._path)
+
+    def _reopen(self):
+        self._fileDB.close()
+        self._fileDB = FileDB(self._path)
+
+    def testBcFile(self):
+        key = self._fileDB.putBcFile('1', BcFileRole.BC_TEMPERATURE, self._csvFile)
+        self.assertEqual('bc1Temperature', key)
+        self.assertEqual(key + '_1', self._fileDB.putBcFile('1', BcFileRole.BC_TEMPERATURE, self._csvFile))
+
+        contentHash = self._fileDB.getContentHash(key)
+        self.assertEqual([300, 310], self._fileDB.getFileContents(key)[3].tolist())
+        self.assertEqual('temperature.csv', self._fileDB.getUserFileName(key))
+        self.assertTrue(self._fileDB.isModified)
+
+        self._fileDB.save()
+        self.assertFalse(self._fileDB.isModified)
+
+        self._reopen()
+        self.assertEqual([300, 310], self._fileDB.getFileContents(key)[3].tolist())
+        self.assertEqual('temperature.csv', self._fileDB.getUserFileName(key))
+        self.assertEqual(contentHash, self._fileDB.getContentHash(key))
+
+    def testUnsavedChangesDiscarded(self):
+        self._fileDB.putDataFrame('saved', pd.DataFrame({'a': [1]}))
+        self._fileDB.save()
+
+        self._fileDB.putDataFrame('unsaved', pd.DataFrame({'a': [2]}))
+        self._fileDB.delete('saved')
+        self.assertIsNone(self._fileDB.getDataFrame('saved'))
+
+        self._reopen()
+        self.assertEqual([1], self._fileDB.getDataFrame('saved')['a'].tolist())
+        self.assertIsNone(self._fileDB.getDataFrame('unsaved'))
+
+    def testDelete(self):
+        self._fileDB.putDataFrame('df', pd.DataFrame({'a': [1]}))
+        self._fileDB.save()
+
+        self._fileDB.delete('df')
+        self._fileDB.save()
+
+        self._reopen()
+        self.assertIsNone(self._fileDB.getDataFrame('df'))
+
+    def testCache(self):
+        import baramFlow.coredb.filedb as filedb
+
+        for i in range(filedb.CACHE_SIZE + 2):
+            self._fileDB.putDataFrame(f'df{i}', pd.DataFrame({'a': [i]}))
+        self._fileDB.save()
+
+        self._reopen()
+        for i in range(filedb.CACHE_SIZE + 2):
+            self.assertEqual([i], self._fileDB.getDataFrame(f'df{i}')['a'].tolist())
+
+        self.assertIs(self._fileDB.getDataFrame(f'df{filedb.CACHE_SIZE}'),
+                      self._fileDB.getDataFrame(f'df{filedb.CACHE_SIZE}'))
+        self.assertEqual(filedb.CACHE_SIZE, len(self._fileDB._cache))
+
+    def testSaveAs(self):
+        self._fileDB.putDataFrame('saved', pd.DataFrame({'a': [1]}))
+        self._fileDB.save()
+        self._fileDB.putDataFrame('unsaved', pd.DataFrame({'a': [2]}))
+
+        directory = self._path / 'copy'
+        directory.mkdir()
+        self._fileDB.saveAs(directory)
+
+        fileDB = FileDB(directory)
+        self.assertEqual([1], fileDB.getDataFrame('saved')['a'].tolist())
+        self.assertEqual([2], fileDB.getDataFrame('unsaved')['a'].tolist())
+        fileDB.close()
+
+    def testText(self):
+        self._fileDB.putText('text', 'content')
+        self.assertEqual('content', self._fileDB.getText('text'))
+        self._fileDB.save()
+
+        self._reopen()
+        self.assertEqual(b'content', self._fileDB.getText('text'))
+        self.assertIsNone(self._fileDB.getText('none'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import unittest
+
+from lxml import etree
+
+from baramFlow.coredb import coredb
+from baramFlow.coredb.material_db import MaterialDB
+
+
+class TestJournal(unittest.TestCase):
+    def setUp(self):
+        self.db = coredb.createDB()
+        MaterialDB.addMaterial(self.db, 'air')
+        self.db.addRegion('testRegion_1')
+        self.path = './/runConditions/numberOfIterations'
+        self.direction = './/operatingConditions/gravity/direction'
+
+    def tearDown(self) -> None:
+        coredb.destroy()
+
+    def testRollbackKeepsTree(self):
+        tree = self.db._xmlTree
+        with self.db:
+            self.db.setValue(self.path, '20')
+            raise coredb.Cancel
+
+        self.assertIs(tree, self.db._xmlTree)
+
+    def testRollbackStructuralChanges(self):
+        self.db.setValue(self.path, '10')
+        with self.db:
+            self.db.setValue(self.path, '20')
+            self.db.addBoundaryCondition('testRegion_1', 'wall', 'patch', 'wall')
+            self.db.addForceMonitor()
+            self.db.setBulk('.//operatingConditions/gravity/direction', {'x': '1', 'y': '2', 'z': '3'})
+            raise coredb.Cancel
+
+        self.assertEqual('10', self.db.getValue(self.path))
+        self.assertEqual([], self.db.getBoundaryConditions('testRegion_1'))
+        self.assertEqual([], self.db.getForceMonitors())
+        self.assertEqual([0, 0, 0], self.db.getVector('.//operatingConditions/gravity/direction'))
+        self.db.validateAll()
+
+    def testRollbackRemoval(self):
+        name = self.db.addPointMonitor()
+        second = self.db.addPointMonitor()
+        with self.db:
+            self.db.removePointMonitor(name)
+            self.db.removePointMonitor(second)
+            raise coredb.Cancel
+
+        self.assertEqual([name, second], self.db.getPointMonitors())
+
+    def testUndoRedo(self):
+        self.db.setValue(self.path, '10')
+        with self.db:
+            self.db.setValue(self.path, '20')
+        with self.db:
+            self.db.setValue(self.path, '30')
+            self.db.addVolumeMonitor()
+
+        self.db.undo()
+        self.assertEqual('20', self.db.getValue(self.path))
+        self.assertEqual([], self.db.getVolumeMonitors())
+
+        self.db.undo()
+        self.assertEqual('10', self.db.getValue(self.path))
+        self.assertFalse(self.db.canUndo())
+
+        self.db.redo()
+        self.db.redo()
+        self.assertEqual('30', self.db.getValue(self.path))
+        self.assertEqual(1, len(self.db.getVolumeMonitors()))
+        self.assertFalse(self.db.canRedo())
+
+    def testRollbackChangesInReplacedContent(self):
+        tree = etree.tostring(self.db._xmlTree)
+        with self.db:
+            self.db.setValue(self.direction + '/x', '5')
+            self.db.setBulk(self.direction, {'x': '1', 'y': '2', 'z': '3'})
+            self.db.setValue(self.direction + '/y', '6')
+            self.db.clearElement(self.direction)
+            raise coredb.Cancel
+
+        self.assertEqual([0, 0, 0], self.db.getVector(self.direction))
+        self.assertEqual(tree, etree.tostring(self.db._xmlTree))
+
+    def testUndoRedoChangesInReplacedContent(self):
+        with self.db:
+            self.db.setValue(self.direction + '/x', '5')
+        with self.db:
+            self.db.setBulk(self.direction, {'x': '1', 'y': '2', 'z': '3'})
+            self.db.setValue(self.direction + '/y', '6')
+        with self.db:
+            self.db.clearElement(self.direction)
+
+        self.db.undo()
+        self.assertEqual([1, 6, 3], self.db.getVector(self.direction))
+        self.db.undo()
+        self.assertEqual([5, 0, 0], self.db.getVector(self.direction))
+        self.db.undo()
+        self.assertEqual([0, 0, 0], self.db.getVector(self.direction))
+
+        self.db.redo()
+        self.db.redo()
+        self.assertEqual([1, 6, 3], self.db.getVector(self.direction))
+        self.db.undo()
+        self.db.undo()
+        self.assertEqual([0, 0, 0], self.db.getVector(self.direction))
+
+        self.db.redo()
+        self.db.redo()
+        self.db.redo()
+        self.assertIsNone(self.db.getElement(self.direction).find('*'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+
+from baramFlow.coredb import coredb
+from baramFlow.coredb.coredb import _CoreDB
+from baramFlow.coredb.material_db import MaterialDB
+from baramFlow.coredb.schema_index import ValueType, schemaIndex
+
+
+class TestSchemaIndex(unittest.TestCase):
+    def setUp(self):
+        self.db = coredb.createDB()
+        self.index = schemaIndex(_CoreDB.XSD_PATH)
+
+    def tearDown(self) -> None:
+        coredb.destroy()
+
+    def testSharedIndex(self):
+        self.assertIs(self.index, schemaIndex(_CoreDB.XSD_PATH))
+
+    def testPositionalPredicates(self):
+        ns = '{http://www.baramcfd.org/baram}'
+        first = self.index.find(f'{ns}regions/{ns}region/{ns}name')
+        second = self.index.find(f'{ns}regions/{ns}region[2]/{ns}name')
+        self.assertIs(first, second)
+
+    def testUndefinedPath(self):
+        self.assertIsNone(self.index.find('{http://www.baramcfd.org/baram}undefined'))
+
+    def testFacets(self):
+        MaterialDB.addMaterial(self.db, 'air')
+        self.db.addRegion('testRegion_1')
+        element = self.db.getElement('.//initialValues/turbulentIntensity')
+        schema = self.index.find(self.db._xmlTree.getelementpath(element))
+        self.assertTrue(schema.hasSimpleContent)
+        self.assertEqual(ValueType.DOUBLE, schema.valueType)
+        self.assertEqual(0, schema.minInclusive)
+        self.assertEqual(100, schema.maxInclusive)
+
+
+if __name__ == '__main__':
+    unittest.main()
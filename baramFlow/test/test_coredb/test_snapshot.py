@@ -0,0 +1,70 @@
+import unittest
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+
+from baramFlow.coredb import coredb
+from baramFlow.coredb.coredb_reader import CoreDBReader
+from baramFlow.coredb.material_db import MaterialDB
+from baramFlow.coredb.region_db import RegionDB
+
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.db = coredb.createDB()
+        MaterialDB.addMaterial(self.db, 'air')
+        self.db.addRegion('region')
+        CoreDBReader().reloadCoreDB()
+        self.path = './/runConditions/numberOfIterations'
+        self.db.setValue(self.path, '10')
+
+    def tearDown(self) -> None:
+        coredb.destroy()
+
+    def testIsolation(self):
+        reader = CoreDBReader()
+        with reader.snapshot() as snapshot:
+            self.assertIsNot(reader, snapshot)
+            self.assertIs(snapshot, CoreDBReader())
+            self.assertIsNot(self.db, coredb.CoreDB())
+
+            # Edited in another context, such as the GUI
+            contextvars.Context().run(self.db.setValue, self.path, '20')
+            contextvars.Context().run(self.db.setValue, RegionDB.getXPath('region') + '/material', '2')
+
+            self.assertEqual('10', snapshot.getValue(self.path))
+            self.assertEqual('20', reader.getValue(self.path))
+            self.assertEqual('1', RegionDB.getMaterial('region'))
+
+        self.assertIs(reader, CoreDBReader())
+        self.assertIs(self.db, coredb.CoreDB())
+        self.assertEqual('20', CoreDBReader().getValue(self.path))
+        self.assertEqual('2', RegionDB.getMaterial('region'))
+
+    def testWorkerThreads(self):
+        with CoreDBReader().snapshot() as snapshot:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                inContext = executor.submit(contextvars.copy_context().run, CoreDBReader).result()
+                notInContext = executor.submit(CoreDBReader).result()
+
+        self.assertIs(snapshot, inContext)
+        self.assertIsNot(snapshot, notInContext)
+
+    def testReadOnly(self):
+        with CoreDBReader().snapshot():
+            with self.assertRaises(PermissionError):
+                coredb.CoreDB().setValue(self.path, '20')
+
+        self.assertEqual('10', self.db.getValue(self.path))
+
+    def testParameters(self):
+        CoreDBReader().setParameters({'p': '1'})
+        with CoreDBReader().snapshot() as snapshot:
+            contextvars.Context().run(lambda: CoreDBReader().setParameters({'p': '2'}))
+            self.assertEqual('1', snapshot._arguments['p'])
+            self.assertEqual('2', contextvars.Context().run(CoreDBReader)._arguments['p'])
+
+        CoreDBReader().setParameters()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+
+from lxml.etree import DocumentInvalid
+
+from baramFlow.coredb import coredb
+from baramFlow.coredb.material_db import MaterialDB
+
+
+class TestValidation(unittest.TestCase):
+    def setUp(self):
+        self.db = coredb.createDB()
+        MaterialDB.addMaterial(self.db, 'air')
+        self.db.addRegion('testRegion_1')
+
+    def tearDown(self) -> None:
+        coredb.destroy()
+
+    def testAddValidElement(self):
+        self.db.addElementFromString(
+            './/monitors/points',
+            '<pointMonitor xmlns="http://www.baramcfd.org/baram">'
+            '   <name>point</name><showChart>true</showChart><writeInterval>1</writeInterval>'
+            '   <field><field>pressure</field><fieldID>1</fieldID></field><interval>1</interval>'
+            '   <coordinate><x>0</x><y>0</y><z>0</z></coordinate>'
+            '   <snapOntoBoundary>false</snapOntoBoundary><boundary>0</boundary><region/>'
+            '</pointMonitor>')
+        self.assertIn('point', self.db.getPointMonitors())
+
+    def testAddInvalidElement(self):
+        with self.assertRaises(DocumentInvalid):
+            self.db.addElementFromString(
+                './/monitors/points',
+                '<pointMonitor xmlns="http://www.baramcfd.org/baram"><name>point</name></pointMonitor>')
+
+    def testSetBulkInvalid(self):
+        xpath = './/operatingConditions/gravity/direction'
+        with self.assertRaises(DocumentInvalid):
+            with coredb.CoreDB() as db:
+                db.setBulk(xpath, {'x': '0', 'y': 'invalid', 'z': '0'})
+
+    def testValidateAll(self):
+        self.db.addBoundaryCondition('testRegion_1', 'wall', 'patch', 'wall')
+        self.db.addForceMonitor()
+        self.db.validateAll()
+
+
+if __name__ == '__main__':
+    unittest.main()
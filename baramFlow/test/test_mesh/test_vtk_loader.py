@@ -0,0 +1,41 @@
+import unittest
+
+from vtkmodules.vtkCommonDataModel import vtkImageData, vtkStaticCellLocator
+from vtkmodules.vtkFiltersCore import vtkAppendFilter
+
+from baramFlow.mesh.vtk_loader import locatePoints
+
+
+class InternalMesh:
+    """Stand-in for ActorInfo with a 2x2x2 block of hexahedra from (x, 0, 0)"""
+    def __init__(self, x):
+        image = vtkImageData()
+        image.SetDimensions(3, 3, 3)
+        image.SetOrigin(x, 0, 0)
+
+        append = vtkAppendFilter()
+        append.AddInputData(image)
+        append.Update()
+
+        self.dataSet = append.GetOutput()
+        self.locator = vtkStaticCellLocator()
+        self.locator.SetDataSet(self.dataSet)
+        self.locator.BuildLocator()
+
+
+class TestVtkLoader(unittest.TestCase):
+    def setUp(self):
+        self._meshes = {'left': InternalMesh(0), 'right': InternalMesh(3)}
+
+    def testLocatePoints(self):
+        points = [[1, 1, 1], [4, 1, 1], [2.5, 1, 1], [0.5, 1.5, 0.5], [4.5, 0.5, 1.5], [1, 1, 3]]
+
+        self.assertEqual(['left', 'right', None, 'left', 'right', None], locatePoints(points, self._meshes))
+
+    def testLocateNoPoints(self):
+        self.assertEqual([], locatePoints([], self._meshes))
+        self.assertEqual([None], locatePoints([[1, 1, 1]], {}))
+
+
+if __name__ == '__main__':
+    unittest.main()
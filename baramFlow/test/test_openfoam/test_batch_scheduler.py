@@ -0,0 +1,74 @@
+import unittest
+import shutil
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from libbaram.mpi import ParallelEnvironment, ParallelType
+
+from baramFlow.batch_scheduler import batchConcurrency, countCells, MEMORY_PER_CELL
+
+
+OWNER_HEADER = '''FoamFile
+{{
+    version     2.0;
+    format      binary;
+    class       labelList;
+    note        "nPoints:  {0}  nCells:  {1}  nFaces:  {2}  nInternalFaces:  {3}";
+    location    "constant/polyMesh";
+    object      owner;
+}}
+'''
+
+
+class TestBatchScheduler(unittest.TestCase):
+    def setUp(self):
+        self._casePath = Path('testBatchScheduler')
+        self._casePath.mkdir(exist_ok=True)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self._casePath)
+
+    def _writeOwner(self, path, nCells):
+        path.mkdir(parents=True, exist_ok=True)
+        (path / 'owner').write_text(OWNER_HEADER.format(nCells * 2, nCells, nCells * 6, nCells * 3))
+
+    def testCountCells(self):
+        self.assertEqual(0, countCells(self._casePath))
+
+        self._writeOwner(self._casePath / 'constant' / 'polyMesh', 1000)
+        self.assertEqual(1000, countCells(self._casePath))
+
+    def testCountCellsMultiRegion(self):
+        self._writeOwner(self._casePath / 'constant' / 'fluid' / 'polyMesh', 1000)
+        self._writeOwner(self._casePath / 'constant' / 'solid' / 'polyMesh', 234)
+        self.assertEqual(1234, countCells(self._casePath))
+
+    def testCountCellsDecomposed(self):
+        self._writeOwner(self._casePath / 'processor0' / 'constant' / 'polyMesh', 500)
+        self._writeOwner(self._casePath / 'processor1' / 'constant' / 'polyMesh', 501)
+        self.assertEqual(1001, countCells(self._casePath))
+
+    @patch('baramFlow.batch_scheduler.psutil.virtual_memory')
+    @patch('baramFlow.batch_scheduler.getAvailablePhysicalCores')
+    def testBatchConcurrency(self, mockCores, mockVirtualMemory):
+        mockCores.return_value = 16
+        memory = MagicMock()
+        memory.available = 1000 * 1000 * MEMORY_PER_CELL
+        mockVirtualMemory.return_value = memory
+
+        # Cores
+        self.assertEqual(4, batchConcurrency(ParallelEnvironment(4, ParallelType.LOCAL_MACHINE, ''), 0))
+        self.assertEqual(5, batchConcurrency(ParallelEnvironment(3, ParallelType.LOCAL_MACHINE, ''), 1000))
+        self.assertEqual(1, batchConcurrency(ParallelEnvironment(32, ParallelType.LOCAL_MACHINE, ''), 1000))
+
+        # Memory
+        self.assertEqual(2, batchConcurrency(ParallelEnvironment(1, ParallelType.LOCAL_MACHINE, ''), 400 * 1000))
+        self.assertEqual(1, batchConcurrency(ParallelEnvironment(1, ParallelType.LOCAL_MACHINE, ''), 2000 * 1000))
+
+        # Clusters
+        self.assertEqual(1, batchConcurrency(ParallelEnvironment(1, ParallelType.CLUSTER, ''), 1000))
+        self.assertEqual(1, batchConcurrency(ParallelEnvironment(1, ParallelType.SLURM, ''), 1000))
+
+
+if __name__ == '__main__':
+    unittest.main()
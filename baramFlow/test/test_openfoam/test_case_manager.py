@@ -0,0 +1,98 @@
+import unittest
+import asyncio
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import psutil
+
+from baramFlow.case_manager import CaseManager
+from baramFlow.solver_status import SolverStatus, SolverProcess
+
+
+CASES = [('case1', {'p': '1'}), ('case2', {'p': '2'}), ('case3', {'p': '3'})]
+
+
+class TestCaseManager(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self._manager = CaseManager()
+        self._manager._project = MagicMock()
+        self._manager._caseName = None
+        self._manager._status = None
+
+        self._solved = []
+
+        for target, value in [('parallel.getEnvironment', MagicMock()),
+                              ('batchConcurrency', MagicMock(return_value=2)),
+                              ('countCells', MagicMock(return_value=1000)),
+                              ('findSolver', MagicMock(return_value='simpleFoam')),
+                              ('FileSystem.caseRoot', MagicMock(return_value=Path('case')))]:
+            patcher = patch(f'baramFlow.case_manager.{target}', value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        for name, value in [('_livePath', MagicMock(return_value=Path('live'))),
+                            ('loadBatchCase', MagicMock()),
+                            ('_solveBatchCase', self._solveBatchCase)]:
+            patcher = patch.object(self._manager, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self) -> None:
+        self._manager._stopMonitor()
+        self._manager._status = None
+        self._manager._project = None
+
+    async def _solveBatchCase(self, name, caseRoot, solver, environment, slots):
+        await asyncio.sleep(0.01)
+        slots.release()
+        self._solved.append(name)
+
+    def _batchStatuses(self):
+        return [(c.args[0], c.args[1]) for c in self._manager._project.updateBatchStatus.call_args_list]
+
+    async def testBatchRun(self):
+        with patch.object(self._manager, '_initializeCase', AsyncMock()):
+            await self._manager.batchRun(CASES)
+
+        self.assertEqual(['case1', 'case2', 'case3'], self._solved)
+        self.assertNotIn(SolverStatus.NONE, [status for _, status in self._batchStatuses()])
+        self.assertFalse(self._manager._batchRunning)
+        self._manager._project.updateSolverStatus.assert_called_once_with(None, SolverStatus.ENDED, None)
+
+    async def testBatchRunInitializationFailure(self):
+        with patch.object(self._manager, '_initializeCase', AsyncMock(side_effect=[None, RuntimeError, None])):
+            with self.assertRaises(RuntimeError):
+                await self._manager.batchRun(CASES)
+
+        # The solver started before the failure has been awaited
+        self.assertEqual(['case1'], self._solved)
+        self.assertEqual([('case2', SolverStatus.NONE), ('case3', SolverStatus.NONE)],
+                         [(name, status) for name, status in self._batchStatuses() if status != SolverStatus.WAITING])
+        self.assertFalse(self._manager._batchRunning)
+        self._manager._project.updateSolverStatus.assert_called_once_with(None, SolverStatus.ENDED, None)
+
+    async def testMonitorProcess(self):
+        child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(0.3)'])
+        process = SolverProcess(child.pid, psutil.Process(child.pid).create_time())
+        # Reaped as the solver daemon is reaped by init, not to be left as a zombie
+        threading.Thread(target=child.wait, daemon=True).start()
+
+        self._manager._setLiveProcess(process)
+        self.assertEqual(SolverStatus.RUNNING, self._manager._status)
+        self.assertIsNotNone(self._manager._monitor)
+
+        async def ended():
+            while self._manager._status != SolverStatus.ENDED:
+                await asyncio.sleep(0.05)
+
+        await asyncio.wait_for(ended(), 5)
+
+        self.assertIsNone(self._manager._monitor)
+        self._manager._project.updateSolverStatus.assert_called_with(None, SolverStatus.ENDED, process)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import unittest
+import shutil
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from libbaram.log_file import LogFile
+
+from baramFlow.view.dock_widgets import console_dock
+from baramFlow.view.dock_widgets.console_dock import ConsoleLines
+
+
+class TestConsoleLines(unittest.TestCase):
+    def setUp(self):
+        self._path = Path(tempfile.mkdtemp()) / 'log.stdout'
+        self._path.write_bytes(b'')
+        self._log = LogFile(self._path)
+        self._lines = ConsoleLines()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self._path.parent)
+
+    def _write(self, text):
+        with self._path.open('a') as f:
+            f.write(text)
+
+    def _all(self):
+        return self._lines.lines(0, self._lines.lineCount())
+
+    def testOrder(self):
+        self._lines.appendText('Generating case')
+        self._write('Time = 1\nTime = 2\n')
+        self.assertTrue(self._lines.updateLog(self._log))
+        self._lines.appendText('Solving')
+        self._write('Time = 3\n')
+        self._lines.updateLog(self._log)
+
+        self.assertEqual(['Generating case', 'Time = 1', 'Time = 2', 'Solving', 'Time = 3'], self._all())
+        self.assertEqual(['Time = 2', 'Solving'], self._lines.lines(2, 4))
+
+    def testPartialLine(self):
+        self._write('Time = 1\nExecution')
+        self._lines.updateLog(self._log)
+        self.assertEqual(['Time = 1'], self._all())
+
+        self._write('Time = 2')
+        self.assertFalse(self._lines.updateLog(self._log))
+
+        # Shown when the log is not written anymore
+        self.assertTrue(self._lines.updateLog(self._log, final=True))
+        self.assertEqual(['Time = 1', 'ExecutionTime = 2'], self._all())
+
+    def testLastEmptyLine(self):
+        self._lines.appendText('Decomposing\n')
+        self._lines.appendText('Done')
+        self.assertEqual(['Decomposing', '', 'Done'], self._all())
+
+        self._write('Time = 1\n\n')
+        self._lines.updateLog(self._log, final=True)
+        self.assertEqual(['Decomposing', '', 'Done', 'Time = 1', ''], self._all())
+
+    def testLogRewritten(self):
+        self._write('Time = 1\nTime = 2\n')
+        self._lines.updateLog(self._log)
+        self._lines.appendText('Restarted')
+
+        self._path.write_text('Time = 3\n')
+        self.assertTrue(self._lines.updateLog(self._log))
+        self.assertEqual(['Restarted', 'Time = 3'], self._all())
+
+    def testWrapAround(self):
+        with patch.object(console_dock, 'MAX_TEXT_LINES', 2):
+            self._lines.appendText('text 1\ntext 2')
+            self._write('Time = 1\n')
+            self._lines.updateLog(self._log)
+            self._lines.appendText('text 3\ntext 4')
+
+            # Lines dropped in batches from the first
+            self._lines.appendText('text 5')
+            self.assertEqual(['Time = 1', 'text 4', 'text 5'], self._all())
+            self.assertEqual(3, self._lines.lineCount())
+
+            self._lines.appendText('text 6\ntext 7')
+            self.assertEqual(['Time = 1', 'text 4', 'text 5', 'text 6', 'text 7'], self._all())
+
+            self._lines.appendText('text 8')
+            self.assertEqual(['Time = 1', 'text 7', 'text 8'], self._all())
+            self.assertEqual(['text 7'], self._lines.lines(1, 2))
+
+    def testFind(self):
+        self._lines.appendText('Generating case')
+        self._write('Time = 1\nsmoothSolver: Solving for Ux\n')
+        self._lines.updateLog(self._log)
+        self._lines.appendText('GAMG: Solving for p')
+        self._write('Time = 2\nSmoothSolver: Solving for Ux\n')
+        self._lines.updateLog(self._log)
+
+        self.assertEqual(2, self._lines.find('smoothsolver', 0))
+        self.assertEqual(2, self._lines.find('smoothsolver', 2))
+        self.assertEqual(5, self._lines.find('smoothsolver', 3))
+        self.assertEqual(3, self._lines.find('gamg', 1))
+        self.assertEqual(4, self._lines.find('Time = 2', 4))
+        self.assertIsNone(self._lines.find('Time = 1', 2))
+        self.assertIsNone(self._lines.find('PIMPLE', 0))
+
+    def testFindAfterWrapAround(self):
+        with patch.object(console_dock, 'MAX_TEXT_LINES', 2):
+            self._lines.appendText('first\nsecond')
+            self._lines.appendText('third\nfourth\nfifth')
+
+            self.assertEqual(['fourth', 'fifth'], self._all())
+            self.assertEqual(1, self._lines.find('fifth', 0))
+            self.assertEqual(1, self._lines.find('f', 1))
+            self.assertIsNone(self._lines.find('first', 0))
+
+if __name__ == '__main__':
+    unittest.main()
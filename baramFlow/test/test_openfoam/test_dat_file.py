@@ -0,0 +1,82 @@
+import unittest
+import shutil
+from pathlib import Path
+
+import numpy as np
+
+from libbaram.openfoam.dat_file import DatFile
+
+testDir = Path('testDatFile')
+
+
+class TestDatFile(unittest.TestCase):
+    def setUp(self):
+        testDir.mkdir(exist_ok=True)
+        self._path = testDir / 'solverInfo.dat'
+
+    def tearDown(self) -> None:
+        shutil.rmtree(testDir)
+
+    def _append(self, text):
+        with self._path.open('a') as f:
+            f.write(text)
+
+    def testIncompleteLines(self):
+        self._append('# Solver information\n# Time')
+        datFile = DatFile(self._path)
+        self.assertFalse(datFile.readHeader())
+
+        self._append('          \tU_solver        \tUx_initial      \tU_converged     \n0.1\tsmoothSolver\t1.5')
+        self.assertFalse(datFile.readHeader())
+        self.assertIsNone(datFile.read(['Time', 'U_solver', 'Ux_initial', 'U_converged']))
+
+        self._append('e-01\tfalse\n0.2\tsmoothSolver\tN/A\ttrue\n0.3\tsmooth')
+        self.assertTrue(datFile.readHeader())
+        self.assertEqual(['Solver information', 'Time          \tU_solver        \tUx_initial      \tU_converged'],
+                         datFile.comments)
+
+        names = datFile.comments[1].split()
+        df = datFile.read(names, usecols=['Time', 'Ux_initial'], dtype=np.float64)
+        self.assertEqual(['Time', 'Ux_initial'], list(df.columns))
+        np.testing.assert_array_equal([0.1, 0.2], df['Time'])
+        self.assertEqual(0.15, df['Ux_initial'][0])
+        self.assertTrue(np.isnan(df['Ux_initial'][1]))
+
+        self.assertIsNone(datFile.read(names))
+
+        self._append('Solver\t0.5\tfalse\n0.4\tsmoothSolver\t0.25\tfalse')
+        np.testing.assert_array_equal([0.3], datFile.read(names)['Time'])
+        np.testing.assert_array_equal([0.4], datFile.read(names, final=True)['Time'])
+
+    def testVectors(self):
+        self._append('# Time  areaAverage(U)  areaAverage(p)  min(T)\n'
+                     '0.1  (1 2 3)  4  (5 6)\n'
+                     '0.2  (1.5 2.5 -3e-2)  N/A  (7 8)\n')
+
+        datFile = DatFile(self._path)
+        self.assertTrue(datFile.readHeader())
+
+        df = datFile.read(datFile.comments[-1].split())
+        self.assertEqual(['Time', 'areaAverage(U)_x', 'areaAverage(U)_y', 'areaAverage(U)_z', 'areaAverage(p)',
+                          'min(T)_0', 'min(T)_1'], list(df.columns))
+        np.testing.assert_array_equal([1.5, 2.5, -0.03], df.iloc[1, 1:4])
+        self.assertTrue(np.isnan(df['areaAverage(p)'][1]))
+        np.testing.assert_array_equal([7, 8], df.iloc[1, 5:])
+
+    def testChunks(self):
+        import libbaram.openfoam.dat_file as datFileModule
+
+        chunkSize = datFileModule.CHUNK_SIZE
+        datFileModule.CHUNK_SIZE = 10
+        try:
+            self._append('# Time value\n' + ''.join(f'{i} {i * 2}\n' for i in range(100)))
+            df = DatFile(self._path).read(['Time', 'value'])
+        finally:
+            datFileModule.CHUNK_SIZE = chunkSize
+
+        np.testing.assert_array_equal(np.arange(100), df['Time'])
+        np.testing.assert_array_equal(np.arange(100) * 2, df['value'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+import shutil
+from pathlib import Path
+
+import numpy as np
+
+from libbaram.openfoam.field_file import FieldFile, FieldValue
+
+testDir = Path('testFieldFile')
+header = '''FoamFile
+{{
+    version     2.0;
+    format      {0};
+    arch        "LSB;label=32;scalar=64";
+    class       volVectorField;
+    location    "0.5";
+    object      U;
+}}
+
+dimensions      [0 1 -1 0 0 0 0];
+
+'''
+
+
+class TestFieldFile(unittest.TestCase):
+    def setUp(self):
+        testDir.mkdir(exist_ok=True)
+        self._path = testDir / 'U'
+
+    def tearDown(self) -> None:
+        shutil.rmtree(testDir)
+
+    def testAscii(self):
+        content = (header.format('ascii')
+                   + 'internalField   nonuniform List<vector>\n3\n(\n(0 0 1)\n(1 0 1)\n(2 0 1)\n)\n;\n\n'
+                   + 'boundaryField\n{\n'
+                   + '    #includeEtc "caseDicts/setConstraintTypes"\n'
+                   + '    inlet\n    {\n        type fixedValue;\n'
+                   + '        value nonuniform List<vector> 2((1 2 3) (4 5 6));\n    }\n'
+                   + '    wall\n    {\n        type noSlip; // comment\n        coeffs { a 1; }\n    }\n'
+                   + '}\n')
+        self._path.write_text(content)
+
+        fieldFile = FieldFile(self._path)
+        self.assertFalse(fieldFile.isBinary())
+        self.assertEqual('volVectorField', fieldFile.header['class'])
+        self.assertEqual((3, 3), fieldFile.internalField.array().shape)
+
+        inlet = fieldFile.boundaryField['inlet']
+        self.assertEqual('fixedValue', inlet['type'])
+        self.assertIsInstance(inlet['value'], FieldValue)
+        self.assertFalse(inlet['value'].isUniform())
+
+        fieldFile.boundaryField['wall']['value'] = ('uniform', [0, 0, 0])
+        fieldFile.write()
+
+        fieldFile = FieldFile(self._path)
+        self.assertIn('#includeEtc "caseDicts/setConstraintTypes"', fieldFile.boundaryField)
+        self.assertTrue(fieldFile.boundaryField['wall']['value'].isUniform())
+        self.assertEqual('noSlip', fieldFile.boundaryField['wall']['type'])
+        self.assertTrue(fieldFile.boundaryField['wall']['coeffs'].isDict())
+        np.testing.assert_array_equal([[1, 2, 3], [4, 5, 6]], fieldFile.boundaryField['inlet']['value'].array())
+        self.assertIn('(0 0 1)\n(1 0 1)\n(2 0 1)\n)\n;', self._path.read_text())
+
+    def testBinary(self):
+        internal = np.arange(12, dtype='<f8')
+        patch = np.array([1.5, 2.5], dtype='<f8')
+        content = (header.format('binary').encode()
+                   + b'internalField   nonuniform List<vector> 4\n(' + internal.tobytes() + b')\n;\n\n'
+                   + b'boundaryField\n{\n'
+                   + b'    outlet\n    {\n        type fixedValue;\n'
+                   + b'        value nonuniform List<scalar> 2(' + patch.tobytes() + b');\n    }\n'
+                   + b'}\n')
+        self._path.write_bytes(content)
+
+        fieldFile = FieldFile(self._path)
+        self.assertTrue(fieldFile.isBinary())
+        np.testing.assert_array_equal(patch, fieldFile.boundaryField['outlet']['value'].array())
+
+        fieldFile.boundaryField['outlet']['type'] = 'zeroGradient'
+        fieldFile.write()
+
+        fieldFile = FieldFile(self._path)
+        self.assertEqual('zeroGradient', fieldFile.boundaryField['outlet']['type'])
+        np.testing.assert_array_equal(internal.reshape(4, 3), fieldFile.internalField.array())
+        np.testing.assert_array_equal(patch, fieldFile.boundaryField['outlet']['value'].array())
+
+
+if __name__ == '__main__':
+    unittest.main()
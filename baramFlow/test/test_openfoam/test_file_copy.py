@@ -0,0 +1,87 @@
+import unittest
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from libbaram.file_copy import FileCopier
+from libbaram.openfoam.constants import CASE_DIRECTORY_NAME
+
+from baramFlow.openfoam.file_system import FileSystem
+
+
+class TestFileCopy(unittest.TestCase):
+    def setUp(self):
+        self._path = Path(tempfile.mkdtemp())
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self._path)
+
+    def _write(self, path, content):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+
+    def testTree(self):
+        source = self._path / 'source'
+        self._write(source / 'a', b'a' * 1000)
+        self._write(source / 'sub' / 'b', b'b')
+        self._write(source / 'empty', b'')
+
+        progress = []
+        copier = FileCopier()
+        copier.progress.connect(lambda copied, total: progress.append((copied, total)))
+        copier.addTree(source, self._path / 'target', linkable=lambda path: path.name == 'a')
+        self.assertEqual(1001, copier.totalSize())
+        copier.copy()
+
+        self.assertEqual(b'a' * 1000, (self._path / 'target' / 'a').read_bytes())
+        self.assertEqual(b'b', (self._path / 'target' / 'sub' / 'b').read_bytes())
+        self.assertEqual(b'', (self._path / 'target' / 'empty').read_bytes())
+        self.assertEqual((1001, 1001), progress[-1])
+
+        # A file not linkable is a separate file
+        (self._path / 'target' / 'sub' / 'b').write_bytes(b'changed')
+        self.assertEqual(b'b', (source / 'sub' / 'b').read_bytes())
+
+    def testChunks(self):
+        import libbaram.file_copy as fileCopy
+
+        content = os.urandom(1000)
+        self._write(self._path / 'source', content)
+
+        chunkSize = fileCopy.CHUNK_SIZE
+        fileCopy.CHUNK_SIZE = 64
+        try:
+            copier = FileCopier(workers=4)
+            copier.addFile(self._path / 'source', self._path / 'target')
+            copier.copy()
+        finally:
+            fileCopy.CHUNK_SIZE = chunkSize
+
+        self.assertEqual(content, (self._path / 'target').read_bytes())
+
+    def testSaveAs(self):
+        source = self._path / 'source'
+        caseRoot = source / CASE_DIRECTORY_NAME
+        for parent in [caseRoot, caseRoot / 'processor0']:
+            self._write(parent / 'constant' / 'polyMesh' / 'points', b'points')
+            self._write(parent / 'constant' / 'polyMesh' / 'boundary', b'boundary')
+        self._write(caseRoot / 'system' / 'decomposeParDict', b'decomposeParDict')
+
+        FileSystem.setCaseRoot(caseRoot)
+        FileSystem.saveAs(source, self._path / 'target', [''])
+
+        targetCaseRoot = self._path / 'target' / CASE_DIRECTORY_NAME
+        for parent in ['', 'processor0']:
+            polyMesh = targetCaseRoot / parent / 'constant' / 'polyMesh'
+            self.assertEqual(b'points', (polyMesh / 'points').read_bytes())
+            self.assertEqual(b'boundary', (polyMesh / 'boundary').read_bytes())
+
+            # Files modified in place are not shared by hardlinks
+            self.assertEqual(1, (polyMesh / 'boundary').stat().st_nlink)
+
+        self.assertEqual(b'decomposeParDict', (targetCaseRoot / 'system' / 'decomposeParDict').read_bytes())
+
+
+if __name__ == '__main__':
+    unittest.main()
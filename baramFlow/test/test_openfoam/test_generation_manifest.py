@@ -0,0 +1,100 @@
+import hashlib
+import unittest
+import shutil
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from libbaram.openfoam.dictionary import dictionary_file
+from libbaram.openfoam.dictionary.dictionary_file import DictionaryFile
+
+from baramFlow.openfoam.generation_manifest import GenerationManifest
+
+
+class SampleDict(DictionaryFile):
+    def __init__(self, casePath):
+        super().__init__(casePath, self.systemLocation(), 'sampleDict')
+
+    def build(self, value):
+        self._data = {'value': value}
+
+        return self
+
+
+class TestGenerationManifest(unittest.TestCase):
+    def setUp(self):
+        self._casePath = Path(tempfile.mkdtemp())
+        self._path = self._casePath / 'system' / 'controlDict'
+        self._path.parent.mkdir()
+        self._path.write_text('content')
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self._casePath)
+
+    def _save(self, contentHash):
+        manifest = GenerationManifest(self._casePath)
+        manifest.add(self._path, contentHash)
+        manifest.save()
+
+    def testUpToDate(self):
+        self._save('hash')
+
+        manifest = GenerationManifest(self._casePath)
+        self.assertTrue(manifest.isUpToDate(self._path, 'hash'))
+        self.assertFalse(manifest.isUpToDate(self._path, 'changed'))
+        self.assertFalse(manifest.isUpToDate(self._path, None))
+
+    def testFileChanged(self):
+        self._save('hash')
+        self._path.write_text('changed by solver')
+
+        self.assertFalse(GenerationManifest(self._casePath).isUpToDate(self._path, 'hash'))
+
+    def testFileDeleted(self):
+        self._save('hash')
+        self._path.unlink()
+
+        self.assertFalse(GenerationManifest(self._casePath).isUpToDate(self._path, 'hash'))
+
+    def testFilesKept(self):
+        self._save('hash')
+
+        # Files not generated this time are kept while not changed
+        manifest = GenerationManifest(self._casePath)
+        manifest.save()
+        self.assertTrue(GenerationManifest(self._casePath).isUpToDate(self._path, 'hash'))
+
+    def testFieldsHash(self):
+        manifest = GenerationManifest(self._casePath)
+        self.assertIsNone(manifest.fieldsHash)
+
+        manifest.setFieldsHash('fields')
+        manifest.save()
+        self.assertEqual('fields', GenerationManifest(self._casePath).fieldsHash)
+
+    def testContentHash(self):
+        sample = SampleDict(self._casePath).build(1)
+
+        with patch.object(dictionary_file, 'FoamFileGenerator', wraps=dictionary_file.FoamFileGenerator) as generator:
+            contentHash = sample.contentHash()
+            sample.write()
+            self.assertEqual(1, generator.call_count)
+
+        # The hash is of the text written
+        self.assertEqual(hashlib.sha1(sample.fullPath().read_bytes()).hexdigest(), contentHash)
+
+        sample.asDict()['value'] = 2
+        self.assertNotEqual(contentHash, changed := sample.contentHash())
+        self.assertNotEqual(changed, sample.build(3).contentHash())
+        self.assertEqual(contentHash, sample.build(1).contentHash())
+
+    def testBrokenManifest(self):
+        (self._casePath / '.generation.json').write_text('{')
+
+        manifest = GenerationManifest(self._casePath)
+        self.assertIsNone(manifest.fieldsHash)
+        self.assertFalse(manifest.isUpToDate(self._path, 'hash'))
+
+
+if __name__ == '__main__':
+    unittest.main()
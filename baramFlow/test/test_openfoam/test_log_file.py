@@ -0,0 +1,118 @@
+import unittest
+import shutil
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from libbaram import log_file
+from libbaram.log_file import LogFile
+
+
+class TestLogFile(unittest.TestCase):
+    def setUp(self):
+        self._path = Path(tempfile.mkdtemp()) / 'log.stdout'
+        self._path.write_bytes(b'')
+        self._log = LogFile(self._path)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self._path.parent)
+
+    def _append(self, text):
+        with self._path.open('ab') as f:
+            f.write(text.encode('UTF-8'))
+
+    def testPartialLine(self):
+        self._append('Time = 1\nCourant Number')
+        self.assertFalse(self._log.update())
+        self.assertEqual(1, self._log.lineCount())
+        self.assertEqual(['Time = 1'], self._log.lines(0, 1))
+
+        # Indexed when the newline is written
+        self._append(' mean: 0.1\n')
+        self._log.update()
+        self.assertEqual(['Time = 1', 'Courant Number mean: 0.1'], self._log.lines(0, 2))
+
+    def testFinalPartialLine(self):
+        self._append('Time = 1\nEnd')
+        self._log.update(final=True)
+        self.assertEqual(['Time = 1', 'End'], self._log.lines(0, self._log.lineCount()))
+
+        # Nothing more to index
+        self._log.update(final=True)
+        self.assertEqual(2, self._log.lineCount())
+
+    def testEmptyLines(self):
+        self._append('Time = 1\n\r\n\n')
+        self._log.update(final=True)
+        self.assertEqual(['Time = 1', '', ''], self._log.lines(0, self._log.lineCount()))
+        self.assertEqual([''], self._log.lines(2, 3))
+        self.assertEqual([], self._log.lines(3, 3))
+
+    def testScanLimit(self):
+        self._append(''.join(f'line {i}\n' for i in range(10)))     # 7 bytes a line
+
+        # Indexed to the last newline in the limit, and scanned again from there
+        with patch.object(log_file, 'SCAN_LIMIT', 20):
+            self.assertTrue(self._log.update())
+            self.assertEqual(2, self._log.lineCount())
+            for _ in range(3):
+                self.assertTrue(self._log.update())
+            self.assertFalse(self._log.update())
+
+        self.assertEqual(10, self._log.lineCount())
+        self.assertEqual(['line 8', 'line 9'], self._log.lines(8, 10))
+
+    def testChunks(self):
+        self._append(''.join(f'line {i}\n' for i in range(10)))
+
+        with patch.object(log_file, '_CHUNK_SIZE', 5):
+            self._log.update()
+            self.assertEqual(10, self._log.lineCount())
+            self.assertEqual(['line 3', 'line 4'], self._log.lines(3, 5))
+
+            # Found across the chunks
+            self.assertEqual(7, self._log.find('e 7\nl', 0, 10))
+
+    def testTruncated(self):
+        self._append('Time = 1\nTime = 2\n')
+        self._log.update()
+
+        self._path.write_bytes(b'Time = 3\n')
+        with self.assertRaises(EOFError):
+            self._log.update()
+        self.assertEqual(0, self._log.lineCount())
+
+        self._log.update()
+        self.assertEqual(['Time = 3'], self._log.lines(0, 1))
+
+    def testRemoved(self):
+        self._append('Time = 1\n')
+        self._log.update()
+
+        self._path.unlink()
+        with self.assertRaises(EOFError):
+            self._log.update()
+        self.assertFalse(self._log.update())
+        self.assertEqual(0, self._log.lineCount())
+
+    def testFind(self):
+        self._append('Time = 1\nsmoothSolver: Solving for Ux\nTime = 2\nSMOOTHSOLVER: Solving for Uy\n')
+        self._log.update()
+
+        self.assertEqual(1, self._log.find('smoothsolver', 0, 4))
+        self.assertEqual(3, self._log.find('smoothsolver', 2, 4))
+        self.assertIsNone(self._log.find('smoothsolver', 2, 3))
+        self.assertIsNone(self._log.find('Uz', 0, 4))
+        self.assertIsNone(self._log.find('', 0, 4))
+
+    def testUtf8(self):
+        self._append('압력 = 1\n\xff\n')
+        self._path.write_bytes(self._path.read_bytes().replace('\xff'.encode('UTF-8'), b'\xff'))
+        self._log.update()
+
+        self.assertEqual(['압력 = 1', '�'], self._log.lines(0, 2))
+        self.assertEqual(0, self._log.find('압력', 0, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+import unittest
+import gzip
+import shutil
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from libbaram.openfoam.mesh_transform import AffineTransform, MeshTransformError
+from libbaram.openfoam.mesh_transform import transformPointsFile, transformPointsFiles
+
+HEADER = '''/*--------------------------------*- C++ -*----------------------------------*\\
+| =========                 |                                                 |
+\\*---------------------------------------------------------------------------*/
+FoamFile
+{
+    version     2.0;
+    format      %s;
+    arch        "LSB;label=32;scalar=64";
+    class       vectorField;
+    location    "constant/polyMesh";
+    object      points;
+}
+// * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * //
+
+'''
+FOOTER = '\n\n// ************************************************************************* //\n'
+
+POINTS = np.array([[0, 0, 0], [1, 0, 0], [1, 2, 0], [0.5, -1.25, 3e-3]])
+
+
+def asciiPoints(points):
+    return (HEADER % 'ascii' + f'{len(points)}\n(\n'
+            + ''.join(f'({x:.12g} {y:.12g} {z:.12g})\n' for x, y, z in points) + ')\n' + FOOTER).encode()
+
+
+def binaryPoints(points):
+    return (HEADER % 'binary' + f'{len(points)}\n(').encode() + points.astype('<f8').tobytes() + (')' + FOOTER).encode()
+
+
+def readPoints(path):
+    content = path.read_bytes()
+    if b'binary' in content:
+        start = content.index(b'(', content.index(b'// * *')) + 1
+        return np.frombuffer(content, '<f8', count=len(POINTS) * 3, offset=start).reshape(-1, 3)
+
+    body = content[content.index(b'(', content.index(b'// * *')) + 1:content.rindex(b')')]
+    return np.fromstring(body.replace(b'(', b' ').replace(b')', b' '), sep=' ').reshape(-1, 3)
+
+
+class TestMeshTransform(unittest.TestCase):
+    def setUp(self):
+        self._path = Path(tempfile.mkdtemp())
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self._path)
+
+    def testTransforms(self):
+        p = np.array([[1, 2, 3]])
+
+        np.testing.assert_allclose([[2, 1, 6]], AffineTransform.scale('2', '0.5', '2').apply(p))
+        np.testing.assert_allclose([[0, 2, 4]], AffineTransform.translate(-1, 0, '1').apply(p))
+        np.testing.assert_allclose([[-2, 1, 3]],
+                                   AffineTransform.rotate(('0', '0', '0'), ('0', '0', '1'), '90').apply(p), atol=1e-12)
+        np.testing.assert_allclose([[1, 0, 3]], AffineTransform.rotate((1, 1, 0), (0, 0, 1), 180).apply(p),
+                                   atol=1e-12)
+
+    def testAscii(self):
+        path = self._path / 'points'
+        path.write_bytes(asciiPoints(POINTS))
+
+        transform = AffineTransform.rotate((1, 0, 0), (1, 1, 1), 30)
+        transformPointsFile(path, transform)
+
+        content = path.read_bytes()
+        self.assertTrue(content.startswith((HEADER % 'ascii').encode() + b'4\n(\n('))
+        self.assertTrue(content.endswith(b')\n)\n' + FOOTER.encode()))
+        np.testing.assert_allclose(transform.apply(POINTS), readPoints(path), atol=1e-11)
+        self.assertFalse(path.with_name('points.tmp').exists())
+
+    def testBinary(self):
+        path = self._path / 'points'
+        path.write_bytes(binaryPoints(POINTS))
+
+        transformPointsFile(path, AffineTransform.translate(1, 2, 3))
+
+        content = path.read_bytes()
+        self.assertEqual(len(binaryPoints(POINTS)), len(content))
+        np.testing.assert_array_equal(POINTS + [1, 2, 3], readPoints(path))
+
+    def testCompressed(self):
+        path = self._path / 'points.gz'
+        path.write_bytes(gzip.compress(asciiPoints(POINTS)))
+
+        transformPointsFile(path, AffineTransform.scale(2, 2, 2))
+
+        (self._path / 'points').write_bytes(gzip.decompress(path.read_bytes()))
+        np.testing.assert_allclose(POINTS * 2, readPoints(self._path / 'points'))
+
+    def testChunks(self):
+        import libbaram.openfoam.mesh_transform as meshTransform
+
+        points = np.random.default_rng(0).random((100, 3))
+        asciiPath = self._path / 'ascii'
+        asciiPath.write_bytes(asciiPoints(points))
+        binaryPath = self._path / 'binary'
+        binaryPath.write_bytes(binaryPoints(points))
+
+        chunkPoints = meshTransform.CHUNK_POINTS
+        meshTransform.CHUNK_POINTS = 7
+        try:
+            transformPointsFile(asciiPath, AffineTransform.translate(1, 0, 0))
+            transformPointsFile(binaryPath, AffineTransform.translate(1, 0, 0))
+        finally:
+            meshTransform.CHUNK_POINTS = chunkPoints
+
+        np.testing.assert_allclose(points + [1, 0, 0], readPoints(asciiPath).reshape(-1, 3))
+        content = binaryPath.read_bytes()
+        start = content.index(b'(', content.index(b'// * *')) + 1
+        np.testing.assert_array_equal(points + [1, 0, 0],
+                                      np.frombuffer(content, '<f8', count=300, offset=start).reshape(-1, 3))
+
+    def testFiles(self):
+        files = []
+        for i in range(3):
+            path = self._path / f'processor{i}' / 'points'
+            path.parent.mkdir()
+            path.write_bytes(binaryPoints(POINTS * i))
+            files.append(path)
+
+        transformPointsFiles(files, AffineTransform.scale(1, 1, -1), workers=2)
+
+        for i, path in enumerate(files):
+            np.testing.assert_array_equal(POINTS * i * [1, 1, -1], readPoints(path))
+
+    def testInvalidFile(self):
+        path = self._path / 'points'
+        content = binaryPoints(POINTS)[:-len(FOOTER) - 10]
+        path.write_bytes(content)
+
+        with self.assertRaises(MeshTransformError):
+            transformPointsFile(path, AffineTransform.translate(1, 0, 0))
+
+        self.assertEqual(content, path.read_bytes())
+        self.assertFalse(path.with_name('points.tmp').exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+import unittest
+import shutil
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from PySide6.QtCore import QCoreApplication, QDeadlineTimer, QFileSystemWatcher
+
+from baramFlow.openfoam.file_system import FileSystem
+from baramFlow.openfoam.post_processing.monitor_service import Worker
+
+testDir = Path('testMonitorService')
+
+MONITOR_NAME = 'surface-mon-1'
+FILE_NAME = 'surfaceFieldValue'
+
+
+class TestMonitorService(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._app = QCoreApplication.instance() or QCoreApplication([])
+
+    def setUp(self):
+        FileSystem.setCaseRoot(testDir)
+        self._path = FileSystem.postProcessingPath() / MONITOR_NAME / '0' / f'{FILE_NAME}.dat'
+        self._path.parent.mkdir(parents=True)
+        self._path.write_text('# Surface field value\n# Time\tareaAverage(p)\n0.1\t1.0\n0.2\t2.0\n')
+
+        self._caseManager = MagicMock()
+        self._caseManager.isRunning.return_value = True
+        patcher = patch('baramFlow.openfoam.post_processing.monitor_service.CaseManager',
+                        return_value=self._caseManager)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self._worker = Worker()
+        self._updates = []
+        self._flushed = []
+        self._stopped = []
+        self._worker.dataUpdated.connect(lambda name, data: self._updates.append(list(data.index)))
+        self._worker.flushed.connect(self._flushed.append)
+        self._worker.stopped.connect(self._stopped.append)
+
+    def tearDown(self) -> None:
+        self._worker.remove(MONITOR_NAME)
+        shutil.rmtree(testDir)
+
+    def _append(self, text):
+        with self._path.open('a') as f:
+            f.write(text)
+
+    def _subscribe(self):
+        self._worker.add(MONITOR_NAME, '', FILE_NAME, '.dat')
+
+    def _watchedFiles(self):
+        return self._worker._watcher.files()
+
+    def testSubscribe(self):
+        self._subscribe()
+
+        self.assertEqual([[0.1, 0.2]], self._updates)
+        self.assertEqual([MONITOR_NAME], self._flushed)
+        self.assertEqual([str(self._path)], self._watchedFiles())
+
+    def testSubscribeBeforeWritten(self):
+        self._path.unlink()
+        self._subscribe()
+
+        self.assertEqual([], self._updates)
+        self.assertTrue(self._worker._scanTimer.isActive())
+
+        self._path.write_text('# Time\tareaAverage(p)\n0.1\t1.0\n')
+        self._worker._scanPending()
+
+        self.assertEqual([[0.1]], self._updates)
+        self.assertFalse(self._worker._scanTimer.isActive())
+        self.assertEqual([str(self._path)], self._watchedFiles())
+
+    def testFileChanged(self):
+        self._subscribe()
+
+        self._append('0.3\t3.0\n0.4\t4.0\n')
+        self._worker._fileChanged(str(self._path))
+        self.assertTrue(self._worker._readTimer.isActive())
+
+        self._worker._readChanged()
+        self.assertEqual([[0.1, 0.2], [0.3, 0.4]], self._updates)
+        self.assertFalse(self._worker._changed)
+
+    def testFileChangedNotified(self):
+        self._subscribe()
+
+        self._append('0.3\t3.0\n')
+        deadline = QDeadlineTimer(5000)
+        while len(self._updates) < 2 and not deadline.hasExpired():
+            QCoreApplication.processEvents()
+
+        self.assertEqual([[0.1, 0.2], [0.3]], self._updates)
+
+    def testPollingFallback(self):
+        with patch.object(QFileSystemWatcher, 'addPath', return_value=False):
+            self._subscribe()
+
+        self.assertEqual([], self._watchedFiles())
+        self.assertEqual({MONITOR_NAME}, self._worker._changed)
+
+        self._append('0.3\t3.0\n')
+        self._worker._readChanged()
+        self.assertEqual([[0.1, 0.2], [0.3]], self._updates)
+
+        # Read again at the next interval, without notifications
+        self.assertEqual({MONITOR_NAME}, self._worker._changed)
+        self.assertTrue(self._worker._readTimer.isActive())
+
+        self._append('0.4\t4.0\n')
+        self._worker._readChanged()
+        self.assertEqual([[0.1, 0.2], [0.3], [0.4]], self._updates)
+
+    def testStop(self):
+        self._subscribe()
+
+        self._append('0.3\t3.0\n')
+        self._worker.stop(MONITOR_NAME)
+
+        self.assertEqual([[0.1, 0.2], [0.3]], self._updates)
+        self.assertEqual([MONITOR_NAME], self._stopped)
+        self.assertEqual([], self._watchedFiles())
+        self.assertFalse(self._worker._files)
+
+        # Changes notified before stopped are not read
+        self._append('0.4\t4.0\n')
+        self._worker._fileChanged(str(self._path))
+        self._worker._readChanged()
+        self.assertEqual([[0.1, 0.2], [0.3]], self._updates)
+
+    def testRemove(self):
+        self._subscribe()
+        self._worker._fileChanged(str(self._path))
+
+        self._worker.remove(MONITOR_NAME)
+
+        self.assertEqual([], self._stopped)
+        self.assertEqual([], self._watchedFiles())
+        self.assertFalse(self._worker._files)
+        self.assertFalse(self._worker._changed)
+        self.assertFalse(self._worker._readTimer.isActive())
+
+
+if __name__ == '__main__':
+    unittest.main()
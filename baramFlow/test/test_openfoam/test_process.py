@@ -0,0 +1,75 @@
+import unittest
+import asyncio
+import os
+import subprocess
+import sys
+import threading
+from unittest.mock import patch
+
+import psutil
+
+from libbaram.process import isRunning, waitProcess
+
+
+SLEEP = 0.3     # Seconds the child process runs
+
+
+class TestProcess(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self._child = subprocess.Popen([sys.executable, '-c', f'import time; time.sleep({SLEEP})'])
+        self._startTime = psutil.Process(self._child.pid).create_time()
+
+    def tearDown(self) -> None:
+        self._child.kill()
+        self._child.wait()
+
+    async def _wait(self):
+        await asyncio.wait_for(waitProcess(self._child.pid, self._startTime), SLEEP + 5)
+
+        # Raises TimeoutExpired if still running
+        self._child.wait(timeout=0)
+
+    @unittest.skipUnless(hasattr(os, 'pidfd_open'), 'pidfd is not available')
+    async def testWaitPidfd(self):
+        self.assertTrue(isRunning(self._child.pid, self._startTime))
+
+        with patch.object(threading, 'Thread', wraps=threading.Thread) as thread:
+            await self._wait()
+
+        thread.assert_not_called()
+
+    async def testWaitThread(self):
+        with patch.object(os, 'pidfd_open', create=True):
+            del os.pidfd_open
+            with patch.object(threading, 'Thread', wraps=threading.Thread) as thread:
+                await self._wait()
+
+        thread.assert_called_once()
+
+    @unittest.skipUnless(hasattr(os, 'pidfd_open'), 'pidfd is not available')
+    async def testWaitThreadWithoutPidfdSupport(self):
+        with patch.object(os, 'pidfd_open', side_effect=OSError):
+            with patch.object(threading, 'Thread', wraps=threading.Thread) as thread:
+                await self._wait()
+
+        thread.assert_called_once()
+
+    async def testWaitExited(self):
+        self._child.wait()
+
+        with patch.object(threading, 'Thread', wraps=threading.Thread) as thread:
+            await asyncio.wait_for(waitProcess(self._child.pid, self._startTime), 1)
+
+        thread.assert_not_called()
+
+    async def testWaitAnotherProcess(self):
+        # A process of the same pid started at another time is not waited
+        with patch.object(threading, 'Thread', wraps=threading.Thread) as thread:
+            await asyncio.wait_for(waitProcess(self._child.pid, self._startTime - 10), 1)
+
+        thread.assert_not_called()
+        self.assertIsNone(self._child.poll())
+
+
+if __name__ == '__main__':
+    unittest.main()
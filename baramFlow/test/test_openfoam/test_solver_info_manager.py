@@ -1,9 +1,16 @@
 import unittest
+import shutil
 from unittest.mock import MagicMock, patch
 
 from pathlib import Path
 
-from baramFlow.openfoam.solver_info_manager import readCompleteLineOnly, readOutFile, Worker
+import numpy as np
+import pandas as pd
+
+from baramFlow.libbaram.time_series import TimeSeriesStore
+from libbaram.openfoam.dat_file import DatFile
+
+from baramFlow.openfoam.solver_info_manager import Worker
 
 
 class TestSolverInfoManager(unittest.TestCase):
@@ -13,38 +20,37 @@ class TestSolverInfoManager(unittest.TestCase):
     def tearDown(self) -> None:
         ...
 
-    def testReadCompleteLineOnly(self):
-        f = MagicMock()
-        f.incompleteLine = ''  # This is necessary because python unittest Mock() always returns True for hasattr()
-        f.readline.side_effect = [
-            'Line 1 incomplete ',
-            'Line 1 middle ',
-            'Line 1 ending\n',
-            'Line2 incomplete ',
-            'Line 2 remaining\n'
-        ]
-        self.assertEqual('', readCompleteLineOnly(f))
-        self.assertEqual('', readCompleteLineOnly(f))
-        self.assertEqual('Line 1 incomplete Line 1 middle Line 1 ending\n', readCompleteLineOnly(f))
-        self.assertEqual('', readCompleteLineOnly(f))
-        self.assertEqual('Line2 incomplete Line 2 remaining\n', readCompleteLineOnly(f))
-
-    @patch('openfoam.solver_info_manager.readCompleteLineOnly')
-    def testReadOutFile(self, mockReadCompleteLineOnly):
-        f = MagicMock()
-        del f.residualHeader  # make hasattr(f, 'residualHeader) return False
+    def testReadDataFrame(self):
+        testDir = Path('testSolverInfo')
+        testDir.mkdir(exist_ok=True)
+        path = testDir / 'solverInfo.dat'
         fileContents = [
             '# Solver information\n',
             '# Time          	U_solver        	Ux_initial      	Ux_final        	Ux_iters        	Uy_initial      	Uy_final        	Uy_iters        	Uz_initial      	Uz_final        	Uz_iters        	U_converged     \n',
             '0.0120482       	DILUPBiCGStab	1.00000000e+00	8.58724200e-08	1	1.00000000e+00	5.78842110e-14	1	1.00000000e+00	6.57355850e-14	1	false\n',
             '0.0265769       	DILUPBiCGStab	3.66757700e-01	2.17151110e-13	1	9.06273050e-01	3.18900850e-13	1	3.76387760e-01	3.48509970e-13	1	false\n',
             '0.0439595       	DILUPBiCGStab	2.31957720e-02	2.67950170e-08	1	5.38653860e-01	3.35496420e-13	1	3.79282860e-02	5.53125350e-08	1	false\n',
-            ''
         ]
-        mockReadCompleteLineOnly.side_effect = fileContents
-        lines, names = readOutFile(f)
-        self.assertEqual(''.join(fileContents[2:]), lines)
-        self.assertEqual(fileContents[1].split()[1:], names)
+
+        try:
+            path.write_text(''.join(fileContents[:3]) + fileContents[3][:20])  # The last line is incomplete
+            w = Worker(testDir, ['bottomWater'])
+            datFile = DatFile(path)
+
+            df = w._readDataFrame('bottomWater', datFile)
+            self.assertEqual(['bottomWater:Ux', 'bottomWater:Uy', 'bottomWater:Uz'], list(df.columns))
+            np.testing.assert_array_equal([0.0120482], df.index)
+            np.testing.assert_array_equal([1, 1, 1], df.iloc[0])
+
+            with path.open('a') as f:
+                f.write(fileContents[3][20:] + fileContents[4])
+
+            df = w._readDataFrame('bottomWater', datFile)
+            np.testing.assert_array_equal([0.0265769, 0.0439595], df.index)
+            np.testing.assert_array_equal([2.31957720e-02, 5.38653860e-01, 3.79282860e-02], df.iloc[1])
+            self.assertIsNone(w._readDataFrame('bottomWater', datFile))
+        finally:
+            shutil.rmtree(testDir)
 
     @patch('glob.glob')
     @patch.object(Path, 'stat')
@@ -111,6 +117,24 @@ class TestSolverInfoManager(unittest.TestCase):
         solverInfo = infoFiles[Path(files[2])]
         self.assertIsNotNone(solverInfo.dup)
 
+    def testTimeSeriesStore(self):
+        def rows(times, **columns):
+            return pd.DataFrame(columns, index=pd.Index(times, name='Time', dtype=np.float64))
+
+        store = TimeSeriesStore()
+        self.assertEqual(0, store.append(rows(np.arange(1, 2001), Ux=np.full(2000, 0.1))))
+        self.assertEqual(2000, store.append(rows([2001, 2002], Ux=[0.2, 0.2], p=[0.3, 0.3])))
+        self.assertEqual(['Ux', 'p'], store.columns)
+        self.assertEqual(2002, len(store))
+        self.assertTrue(np.isnan(store.values('p')[0]))
+
+        # Restarted from 1000
+        self.assertEqual(999, store.append(rows([1000, 1001], Ux=[0.5, 0.5], p=[0.6, 0.6])))
+        self.assertEqual(1001, len(store))
+        np.testing.assert_array_equal([999, 1000, 1001], store.times()[-3:])
+        np.testing.assert_array_equal([0.1, 0.5, 0.5], store.values('Ux')[-3:])
+        self.assertEqual((2, 2), store.frame(999).shape)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from baramFlow.libbaram.time_series import TimeSeriesStore
+
+
+def rows(times, **columns):
+    return pd.DataFrame(columns, index=pd.Index(times, name='Time', dtype=np.float64))
+
+
+class TestTimeSeriesStore(unittest.TestCase):
+    def testEmpty(self):
+        store = TimeSeriesStore()
+        self.assertEqual(0, store.append(rows([])))
+        self.assertEqual(0, len(store))
+        self.assertEqual(0, store.frame().shape[0])
+
+    def testGrowth(self):
+        store = TimeSeriesStore()
+        for start in range(0, 5000, 700):
+            times = np.arange(start, min(start + 700, 5000))
+            store.append(rows(times, p=times * 2.0))
+
+        self.assertEqual(5000, len(store))
+        np.testing.assert_array_equal(np.arange(5000), store.times())
+        np.testing.assert_array_equal(np.arange(5000) * 2.0, store.values('p'))
+
+    def testMissingColumns(self):
+        store = TimeSeriesStore()
+        store.append(rows([1, 2], Ux=[0.1, 0.2]))
+        store.append(rows([3], p=[0.3]))
+
+        np.testing.assert_array_equal([0.1, 0.2, np.nan], store.values('Ux'))
+        np.testing.assert_array_equal([np.nan, np.nan, 0.3], store.values('p'))
+
+    def testRestart(self):
+        store = TimeSeriesStore()
+        store.append(rows([1, 2, 3, 4], Ux=[1, 2, 3, 4]))
+
+        # Restarted from the time between the stored
+        self.assertEqual(2, store.append(rows([2.5, 3.5], Ux=[5, 6])))
+        np.testing.assert_array_equal([1, 2, 2.5, 3.5], store.times())
+        np.testing.assert_array_equal([1, 2, 5, 6], store.values('Ux'))
+
+        frame = store.frame(2)
+        np.testing.assert_array_equal([2.5, 3.5], frame.index)
+        self.assertEqual('Time', frame.index.name)
+
+
+if __name__ == '__main__':
+    unittest.main()
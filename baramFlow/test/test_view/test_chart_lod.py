@@ -0,0 +1,106 @@
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from baramFlow.view.widgets.chart_lod import MinMaxPyramid, ChartRenderer
+
+
+class TestMinMaxPyramid(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self._x = np.cumsum(rng.random(100000) + 0.5)
+        self._y = rng.standard_normal(100000)
+
+        # Appended in chunks as the residuals are
+        self._pyramid = MinMaxPyramid()
+        for end in range(1000, 100001, 33000):
+            self._pyramid.update(self._x[:end], self._y[:end], end - 1000)
+        self._pyramid.update(self._x, self._y, 100000 - 1000)
+
+    def testOrdering(self):
+        for left, right in [(0, self._x[-1]), (1000.3, 20000.7), (self._x[12345], self._x[67890])]:
+            x, y = self._pyramid.decimate(left, right, 300)
+            self.assertTrue(np.all(np.diff(x) > 0))
+
+    def testVisibleRange(self):
+        left, right = self._x[12345] + 0.1, self._x[67890] - 0.1
+        x, y = self._pyramid.decimate(left, right, 300)
+
+        # One point on each side of the range for the line to reach the ends
+        self.assertEqual(self._x[12345], x[0])
+        self.assertEqual(self._x[67890], x[-1])
+        self.assertLess(x.size, 4 * 300)
+
+    def testFewPoints(self):
+        x, y = self._pyramid.decimate(self._x[10] - 0.1, self._x[20] + 0.1, 300)
+        np.testing.assert_array_equal(self._x[9:22], x)
+        np.testing.assert_array_equal(self._y[9:22], y)
+
+    def testPeaksPerPixel(self):
+        x = np.arange(100000, dtype=np.float64)
+        y = np.zeros(100000)
+        width = 100
+
+        # A peak in the middle of every pixel, up and down by turns
+        peaks = np.arange(500, 100000, 1000)
+        y[peaks] = np.where(np.arange(peaks.size) % 2, -1, 1) * np.arange(1, peaks.size + 1)
+
+        pyramid = MinMaxPyramid()
+        pyramid.update(x, y)
+        dx, dy = pyramid.decimate(0, 99999, width)
+
+        for peak in peaks:
+            self.assertIn(peak, dx)
+            self.assertEqual(y[peak], dy[np.searchsorted(dx, peak)])
+
+    def testRestart(self):
+        y = self._y.copy()
+        y[50000:] = 10
+        self._pyramid.update(self._x, y, 50000)
+
+        x, y = self._pyramid.decimate(0, self._x[-1], 100)
+        self.assertEqual(10, y.max())
+        self.assertEqual(self._y[:50000].min(), y.min())
+
+
+class TestChartRenderer(unittest.TestCase):
+    def setUp(self):
+        figure = Figure()
+        self._canvas = FigureCanvasAgg(figure)
+        self._axes = figure.add_subplot()
+        self._renderer = ChartRenderer(self._canvas, self._axes)
+
+        line, = self._axes.plot([0, 1], [0, 1])
+        self._renderer.addLine(line)
+
+    def testBlit(self):
+        with patch.object(self._canvas, 'draw', wraps=self._canvas.draw) as draw, \
+                patch.object(self._canvas, 'blit') as blit:
+            self._renderer.redraw()
+            self.assertEqual(1, draw.call_count)
+            blit.assert_not_called()
+
+            self._renderer.redraw()
+            self.assertEqual(1, draw.call_count)
+            blit.assert_called_once()
+
+    def testAxesChanged(self):
+        self._renderer.redraw()
+
+        with patch.object(self._canvas, 'draw', wraps=self._canvas.draw) as draw, \
+                patch.object(self._canvas, 'blit') as blit:
+            self._axes.set_xlim(0, 2)
+            self._renderer.redraw()
+            self.assertEqual(1, draw.call_count)
+
+            self._renderer.invalidate()
+            self._renderer.redraw()
+            self.assertEqual(2, draw.call_count)
+            blit.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
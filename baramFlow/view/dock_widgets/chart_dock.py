@@ -22,8 +22,10 @@ from baramFlow.coredb import coredb
 from baramFlow.coredb.general_db import GeneralDB
 from baramFlow.coredb.project import Project, SolverStatus
 from baramFlow.coredb.run_calculation_db import RunCalculationDB, TimeSteppingMethod
+from baramFlow.libbaram.time_series import TimeSeriesStore
 from baramFlow.openfoam.file_system import FileSystem
 from baramFlow.openfoam.solver_info_manager import SolverInfoManager
+from baramFlow.view.widgets.chart_lod import MinMaxPyramid, ChartRenderer
 
 SIDE_MARGIN = 0.05  # 5% margin on left and right
 
@@ -34,9 +36,10 @@ class ChartView(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
 
-        self._data = None
+        self._data: typing.Dict[str, TimeSeriesStore] = {}
 
         self._lines: typing.Dict[str, Line2D] = {}
+        self._pyramids: typing.Dict[str, MinMaxPyramid] = {}
 
         layout = QtWidgets.QVBoxLayout(self)
         layout.setContentsMargins(QMargins(0, 0, 0, 0))
@@ -47,6 +50,7 @@ class ChartView(QWidget):
         layout.addWidget(self._canvas)
 
         self._axes = self._canvas.figure.subplots()
+        self._renderer = ChartRenderer(self._canvas, self._axes)
 
         self._clear()
 
@@ -88,11 +92,10 @@ class ChartView(QWidget):
             self.stopDrawing()
 
     def fitChart(self):
-        if self._data is None:
+        if not self._data:
             return
 
-        minX = float(self._data.first_valid_index())
-        maxX = float(self._data.last_valid_index())
+        minX, maxX = self._timeRange()
 
         if maxX <= minX:
             maxX = minX + 1
@@ -101,25 +104,42 @@ class ChartView(QWidget):
         margin = dataWidth * SIDE_MARGIN / (1 - 2 * SIDE_MARGIN)
 
         self._axes.set_xlim([minX-margin, maxX+margin])
+        self._updateLines()
         self._adjustYRange(minX, maxX)
 
-        self._canvas.draw()
+        self._renderer.redraw()
+
+    def updated(self, rname: str, rows: pd.DataFrame):
+        """Appends new rows of a region
+
+        Rows starting at or before the last time of the region replace the stored rows from that time.
+        """
+        if rows.empty:
+            return
 
-    def updated(self, data: pd.DataFrame):
-        self._data = data
+        if rname not in self._data:
+            self._data[rname] = TimeSeriesStore()
 
-        d = data.reset_index()  # "Time" is back to a column to serve as X value in numpy transpose below
+        store = self._data[rname]
+        kept = store.append(rows)
 
-        for c in data.columns.values.tolist():
+        times = store.times()
+        newLines = False
+        for c in store.columns:
             if c not in self._lines:
-                self._lines[c], = self._axes.plot('Time', c, '', label=c, data=d)
+                self._lines[c], = self._axes.plot([], [], '', label=c)
                 self._lines[c].set_linewidth(0.8)
-            else:
-                self._lines[c].set_data(d[['Time', c]].to_numpy().transpose())
+                self._renderer.addLine(self._lines[c])
+                self._pyramids[c] = MinMaxPyramid()
+                newLines = True
+
+            self._pyramids[c].update(times, store.values(c), kept)
 
-        legend = self._axes.legend()
-        for h in legend.legendHandles:
-            h.set_linewidth(1.6)
+        if newLines:
+            legend = self._axes.legend()
+            for h in legend.legendHandles:
+                h.set_linewidth(1.6)
+            self._renderer.invalidate()
 
         self._updateChart(1.0)
 
@@ -128,11 +148,10 @@ class ChartView(QWidget):
         self._updateChart(scale)
 
     def _updateChart(self, scale: float):
-        if self._data is None:
+        if not self._data:
             return
 
-        timeMin = float(self._data.first_valid_index())
-        timeMax = float(self._data.last_valid_index())
+        timeMin, timeMax = self._timeRange()
 
         dataWidth = timeMax - timeMin
 
@@ -153,17 +172,37 @@ class ChartView(QWidget):
 
         self._axes.set_xlim([minX-margin, maxX+margin])
 
+        self._updateLines()
         self._adjustYRange(minX, maxX)
 
-        self._canvas.draw()  # force re-draw the next time the GUI refreshes
-        # self._canvas.draw_idle()
+        self._renderer.redraw()
 
-    def _adjustYRange(self, minX: float, maxX: float):
-        data = self._data
+    def _timeRange(self):
+        stores = [store for store in self._data.values() if len(store) > 0]
+
+        return (float(min(store.times()[0] for store in stores)),
+                float(max(store.times()[-1] for store in stores)))
+
+    def _updateLines(self):
+        # Lines are drawn with points decimated for the visible range, which keep the peaks of the residuals
+        left, right = self._axes.get_xlim()
+        width = max(int(self._axes.bbox.width), 1)
+        for c, line in self._lines.items():
+            line.set_data(*self._pyramids[c].decimate(left, right, width))
 
-        d = data[(data.index >= minX) & (data.index <= maxX)]
-        minY = d[d > 0].min().min()  # Residual value of "0" has been shown once
-        maxY = d.max().max()
+    def _adjustYRange(self, minX: float, maxX: float):
+        minY = np.inf
+        maxY = -np.inf
+        for line in self._lines.values():
+            x, y = line.get_data()
+            values = y[(x >= minX) & (x <= maxX)]
+            positive = values[values > 0]  # Residual value of "0" has been shown once
+            if positive.size > 0:
+                minY = min(minY, positive.min())
+                maxY = max(maxY, positive.max())
+
+        if not np.isfinite(minY):
+            return
 
         minY = minY / 10  # margin in log scale
         maxY = maxY * 10  # margin in log scale
@@ -173,8 +212,10 @@ class ChartView(QWidget):
     def _clear(self):
         self._axes.cla()
 
-        self._data = None
+        self._data = {}
         self._lines = {}
+        self._pyramids = {}
+        self._renderer.invalidate()
 
         self._axes.grid(alpha=0.6, linestyle='--')
         self._axes.xaxis.set_major_formatter(ticker.FuncFormatter(lambda num, _: '{:g}'.format(num)))
@@ -1,50 +1,206 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+from bisect import bisect_right
 from typing import Optional
 import asyncio
 import qasync
 
-from PySide6.QtWidgets import QVBoxLayout, QWidget, QPlainTextEdit, QCheckBox
+from PySide6.QtWidgets import QVBoxLayout, QHBoxLayout, QWidget, QPlainTextEdit, QCheckBox, QScrollBar, QLineEdit
 from PySide6.QtCore import Qt, QMargins, QEvent, QCoreApplication
-from PySide6.QtGui import QFontDatabase
+from PySide6.QtGui import QFontDatabase, QTextCursor
 from PySide6QtAds import CDockWidget
 
+from libbaram.log_file import LogFile
+from libbaram.run import STDOUT_FILE_NAME, STDERR_FILE_NAME
+
 from baramFlow.case_manager import CaseManager
 from baramFlow.coredb.project import Project, SolverStatus
 from baramFlow.openfoam.file_system import FileSystem
 
 
+MAX_TEXT_LINES = 100000     # Lines appended to the console kept in memory, lines of the logs are read from the files
+WHEEL_LINES = 3             # Lines scrolled by a step of mouse wheel
+
+
+class _TextLines:
+    """Ring buffer of the lines appended to the console
+
+    Lines are numbered from the first line appended, including the lines dropped.
+    """
+    def __init__(self):
+        self._lines = []
+        self._first = 0
+
+    def first(self):
+        return self._first
+
+    def lineCount(self):
+        return self._first + len(self._lines)
+
+    def append(self, lines):
+        self._lines.extend(lines)
+
+        # Dropped in batches not to move the lines every time
+        if len(self._lines) > 2 * MAX_TEXT_LINES:
+            dropped = len(self._lines) - MAX_TEXT_LINES
+            del self._lines[:dropped]
+            self._first += dropped
+
+    def lines(self, start, end):
+        return self._lines[start - self._first:end - self._first]
+
+    def find(self, text, start, end):
+        text = text.lower()
+        for no in range(start, end):
+            if text in self._lines[no - self._first].lower():
+                return no
+
+        return None
+
+
+class ConsoleLines:
+    """Lines shown in the console
+
+    Lines are kept as ranges of the lines of their sources, the log files of the solver or the lines appended,
+    in the order they are read.
+    """
+    def __init__(self):
+        self._text = _TextLines()
+        self._ranges = []   # [source, start, end]
+        self._rows = []     # Row of the first line of each range
+        self._count = 0
+
+    def lineCount(self):
+        return self._count
+
+    def lines(self, start, end):
+        lines = []
+        i = bisect_right(self._rows, start) - 1
+        while start < end and i < len(self._ranges):
+            source, first, last = self._ranges[i]
+            offset = first - self._rows[i]
+            lines.extend(source.lines(start + offset, min(end + offset, last)))
+            start = self._rows[i] + last - first
+            i += 1
+
+        return lines
+
+    def find(self, text, start):
+        """Returns the first row from start containing the text, or None if not found"""
+        i = bisect_right(self._rows, start) - 1
+        for i in range(max(i, 0), len(self._ranges)):
+            source, first, last = self._ranges[i]
+            offset = first - self._rows[i]
+            if (found := source.find(text, max(start + offset, first), last)) is not None:
+                return found - offset
+
+        return None
+
+    def appendText(self, text):
+        start = self._text.lineCount()
+        self._text.append(text.split('\n'))
+        self._addRange(self._text, start, self._text.lineCount())
+
+        # Ranges of the lines dropped from the ring buffer
+        first = self._text.first()
+        if any(r[0] is self._text and r[1] < first for r in self._ranges):
+            self._ranges = [[source, max(begin, first) if source is self._text else begin, end]
+                            for source, begin, end in self._ranges if source is not self._text or end > first]
+            self._updateRows()
+
+    def updateLog(self, log: LogFile, final=False):
+        """Adds the lines written to the log since the last update
+
+        Returns:
+            True if lines are added or there are more lines to read
+        """
+        start = log.lineCount()
+        try:
+            more = log.update(final)
+        except EOFError:
+            # The log is written again from the beginning
+            self._ranges = [r for r in self._ranges if r[0] is not log]
+            self._updateRows()
+            start = 0
+            more = log.update(final)
+
+        self._addRange(log, start, log.lineCount())
+
+        return more or log.lineCount() > start
+
+    def _addRange(self, source, start, end):
+        if start >= end:
+            return
+
+        if self._ranges and self._ranges[-1][0] is source and self._ranges[-1][2] == start:
+            self._ranges[-1][2] = end
+        else:
+            self._ranges.append([source, start, end])
+            self._rows.append(self._count)
+
+        self._count += end - start
+
+    def _updateRows(self):
+        self._rows = []
+        self._count = 0
+        for _, start, end in self._ranges:
+            self._rows.append(self._count)
+            self._count += end - start
+
+
 class ConsoleView(QWidget):
+    """Console showing a window of the lines
+
+    Only the lines in the view are put into the text view, and the scroll bar moves the window over all the lines.
+    """
     def __init__(self):
         super().__init__()
 
         self.stopReading = False
         self.readTask: Optional[asyncio.Task] = None
 
+        self._lines = ConsoleLines()
+        self._logs = None
+        self._window = None
+        self._found = None
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(QMargins(0, 0, 0, 0))
 
         self._textView = QPlainTextEdit()
         self._textView.setReadOnly(True)
-        # small case may print 2,000 lines per second
-        self._textView.setMaximumBlockCount(100000)
-        self._textView.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOn)
+        self._textView.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self._textView.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         self._textView.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
-        self._textView.verticalScrollBar().setTracking(True)
         charFormat = self._textView.currentCharFormat()
         fixedFont = QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont)
         charFormat.setFont(fixedFont)
         self._textView.setCurrentCharFormat(charFormat)
+        self._textView.setFont(fixedFont)
+        self._textView.viewport().installEventFilter(self)
+
+        self._scrollBar = QScrollBar(Qt.Orientation.Vertical)
+        self._scrollBar.valueChanged.connect(self._showWindow)
 
-        layout.addWidget(self._textView)
+        viewLayout = QHBoxLayout()
+        viewLayout.setSpacing(0)
+        viewLayout.addWidget(self._textView)
+        viewLayout.addWidget(self._scrollBar)
+        layout.addLayout(viewLayout)
 
         self._lineWrap = QCheckBox()
         self._lineWrap.setChecked(False)
         self._lineWrap.stateChanged.connect(self._lineWrapStateChanged)
 
-        layout.addWidget(self._lineWrap)
+        self._findText = QLineEdit()
+        self._findText.returnPressed.connect(self._findNext)
+
+        toolLayout = QHBoxLayout()
+        toolLayout.addWidget(self._lineWrap)
+        toolLayout.addStretch()
+        toolLayout.addWidget(self._findText)
+        layout.addLayout(toolLayout)
 
         self._project = Project.instance()
         self._project.projectClosed.connect(self._projectClosed)
@@ -64,6 +220,17 @@ class ConsoleView(QWidget):
 
     def translate(self):
         self._lineWrap.setText(self.tr('Line-Wrap'))
+        self._findText.setPlaceholderText(self.tr('Find'))
+
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Type.Wheel and event.angleDelta().y():
+            self._scrollBar.setValue(self._scrollBar.value() - event.angleDelta().y() // 120 * WHEEL_LINES)
+            return True
+
+        if event.type() == QEvent.Type.Resize:
+            self._updateScrollBar()
+
+        return super().eventFilter(watched, event)
 
     def _lineWrapStateChanged(self):
         if self._lineWrap.isChecked():
@@ -72,25 +239,16 @@ class ConsoleView(QWidget):
             self._textView.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
 
     async def readLogForever(self):
-        root = FileSystem.caseRoot()
-
-        stdout = None
-        stderr = None
+        logs = self._openLogs()
 
         try:
-            stdout = open(root/'stdout.log', 'r')
-            stderr = open(root/'stderr.log', 'r')
-
             idleCount = 0
             while True:
                 hasOutput = False
-                while lines := stdout.readlines():
-                    self._textView.appendPlainText(''.join(lines).rstrip())
-                    hasOutput = True
-                while lines := stderr.readlines():
-                    self._textView.appendPlainText(''.join(lines).rstrip())
-                    hasOutput = True
+                for log in logs:
+                    hasOutput = self._lines.updateLog(log) or hasOutput
                 if hasOutput:
+                    self._updateScrollBar()
                     await asyncio.sleep(0.1)
                     idleCount = 0
                     continue
@@ -99,25 +257,84 @@ class ConsoleView(QWidget):
                     idleCount += 1
                     # Last message from the solver can be flushed late
                     if idleCount > 2 and self.stopReading:
+                        for log in logs:
+                            self._lines.updateLog(log, final=True)
+                        self._updateScrollBar()
                         break
 
         except asyncio.CancelledError:
             print('cancel console reading')
         finally:
-            if stdout:
-                stdout.close()
-            if stderr:
-                stderr.close()
             self.readTask = None
 
     def append(self, text):
-        self._textView.appendPlainText(text)
+        self._lines.appendText(text)
+        self._updateScrollBar()
+
+    def _openLogs(self):
+        if self._logs is None:
+            root = FileSystem.caseRoot()
+            self._logs = [LogFile(root / STDOUT_FILE_NAME), LogFile(root / STDERR_FILE_NAME)]
+
+        return self._logs
+
+    def _clear(self):
+        self._lines = ConsoleLines()
+        self._logs = None
+        self._found = None
+        self._updateScrollBar()
+
+    def _windowSize(self):
+        return max(1, self._textView.viewport().height() // self._textView.fontMetrics().lineSpacing())
+
+    def _updateScrollBar(self):
+        # The window follows the last line if it is at the end
+        following = self._scrollBar.value() >= self._scrollBar.maximum()
+
+        windowSize = self._windowSize()
+        self._scrollBar.setPageStep(windowSize)
+        self._scrollBar.setMaximum(max(0, self._lines.lineCount() - windowSize))
+        if following:
+            self._scrollBar.setValue(self._scrollBar.maximum())
+
+        self._showWindow()
+
+    def _showWindow(self):
+        start = self._scrollBar.value()
+        end = min(start + self._windowSize(), self._lines.lineCount())
+        if (start, end) == self._window:
+            return
+
+        self._window = (start, end)
+        horizontal = self._textView.horizontalScrollBar().value()
+        self._textView.setPlainText('\n'.join(self._lines.lines(start, end)))
+        self._textView.horizontalScrollBar().setValue(horizontal)
+
+        if self._found is not None and start <= self._found < end:
+            cursor = QTextCursor(self._textView.document().findBlockByNumber(self._found - start))
+            cursor.select(QTextCursor.SelectionType.LineUnderCursor)
+            self._textView.setTextCursor(cursor)
+
+    def _findNext(self):
+        if not (text := self._findText.text()):
+            return
+
+        start = self._scrollBar.value() if self._found is None else self._found + 1
+        found = self._lines.find(text, start)
+        if found is None and start > 0:
+            found = self._lines.find(text, 0)
+
+        self._found = found
+        if found is not None:
+            self._window = None
+            self._scrollBar.setValue(min(max(0, found - self._windowSize() // 2), self._scrollBar.maximum()))
+            self._showWindow()
 
     @qasync.asyncSlot()
     async def _caseLoaded(self):
         if self.readTask is not None:
             self.readTask.cancel()
-        self._textView.clear()
+        self._clear()
 
         if CaseManager().isRunning():
             self.startCollecting()
@@ -128,7 +345,7 @@ class ConsoleView(QWidget):
     async def _caseCleared(self):
         if self.readTask is not None:
             self.readTask.cancel()
-        self._textView.clear()
+        self._clear()
 
     def _projectClosed(self):
         if self.readTask is not None:
@@ -137,22 +354,20 @@ class ConsoleView(QWidget):
     @qasync.asyncSlot()
     async def _solverStatusChanged(self, status):
         if status == SolverStatus.NONE:
-            self._textView.clear()
+            self._clear()
         elif status == SolverStatus.RUNNING:
             self.startCollecting()
         else:
             self.stopCollecting()
 
     async def _readAllLog(self):
-        async def _readLog(path):
-            if path.is_file():
-                with path.open() as file:
-                    self._textView.appendPlainText(file.read())
-                    self._textView.verticalScrollBar().setValue(self._textView.verticalScrollBar().maximum())
-
-        root = FileSystem.caseRoot()
-        await _readLog(root / 'stdout.log')
-        await _readLog(root / 'stderr.log')
+        logs = self._openLogs()
+        for log in logs:
+            while self._logs is logs and self._lines.updateLog(log, final=True):
+                # Large logs are read in parts not to block the UI
+                await asyncio.sleep(0)
+
+        self._updateScrollBar()
 
 
 class ConsoleDock(CDockWidget):
@@ -15,6 +15,7 @@ import asyncio
 from PySide6.QtWidgets import QMainWindow, QFileDialog, QMessageBox
 from PySide6.QtCore import Qt, QEvent, QTimer, Signal
 
+from libbaram.file_copy import FileCopier
 from libbaram.run import hasUtility
 from libbaram.utils import getFit
 from widgets.async_message_box import AsyncMessageBox
@@ -368,18 +369,7 @@ class MainWindow(QMainWindow):
 
         try:
             progressDialog.setLabelText(self.tr('Scaling the mesh.'))
-            if await MeshManager().scale(*self._dialog.data()):
-                progressDialog.finish(self.tr('Mesh scaling failed.'))
-                return
-
-            # Workaround to give some time for QT to set up timer or event loop.
-            # This workaround is not necessary on Windows because BARAM for Windows
-            #     uses custom-built VTK that is compiled with VTK_ALLOWTHREADS
-            await asyncio.sleep(0.1)
-
-            loader = PolyMeshLoader()
-            loader.progress.connect(progressDialog.setLabelText)
-            await loader.loadVtk()
+            await MeshManager().scale(*self._dialog.data())
 
             progressDialog.finish(self.tr('Mesh scaling is complete'))
         except Exception as ex:
@@ -403,18 +393,7 @@ class MainWindow(QMainWindow):
 
         try:
             progressDialog.setLabelText(self.tr('Translating the mesh.'))
-            if await MeshManager().translate(*self._dialog.data()):
-                progressDialog.finish(self.tr('Mesh translation failed.'))
-                return
-
-            # Workaround to give some time for QT to set up timer or event loop.
-            # This workaround is not necessary on Windows because BARAM for Windows
-            #     uses custom-built VTK that is compiled with VTK_ALLOWTHREADS
-            await asyncio.sleep(0.1)
-
-            loader = PolyMeshLoader()
-            loader.progress.connect(progressDialog.setLabelText)
-            await loader.loadVtk()
+            await MeshManager().translate(*self._dialog.data())
 
             progressDialog.finish(self.tr('Mesh translation is complete'))
         except Exception as ex:
@@ -438,18 +417,7 @@ class MainWindow(QMainWindow):
 
         try:
             progressDialog.setLabelText(self.tr('Rotating the mesh.'))
-            if await MeshManager().rotate(*self._dialog.data()):
-                progressDialog.finish(self.tr('Mesh rotation failed.'))
-                return
-
-            # Workaround to give some time for QT to set up timer or event loop.
-            # This workaround is not necessary on Windows because BARAM for Windows
-            #     uses custom-built VTK that is compiled with VTK_ALLOWTHREADS
-            await asyncio.sleep(0.1)
-
-            loader = PolyMeshLoader()
-            loader.progress.connect(progressDialog.setLabelText)
-            await loader.loadVtk()
+            await MeshManager().rotate(*self._dialog.data())
 
             progressDialog.finish(self.tr('Mesh rotation is complete'))
         except Exception as ex:
@@ -657,7 +625,10 @@ class MainWindow(QMainWindow):
 
                 progressDialog.setLabelText(self.tr('Saving case'))
 
-                await asyncio.to_thread(FileSystem.saveAs, self._project.path, path, coredb.CoreDB().getRegions())
+                copier = FileCopier()
+                copier.progress.connect(progressDialog.setProgress)
+                await asyncio.to_thread(FileSystem.saveAs, self._project.path, path, coredb.CoreDB().getRegions(),
+                                        copier)
                 self._project.saveAs(path)
                 progressDialog.close()
 
@@ -687,6 +658,7 @@ class MainWindow(QMainWindow):
             progressDialog.open()
 
             progressDialog.setLabelText(self.tr('Copying files.'))
+            meshManager.copyProgress.connect(progressDialog.setProgress)
             await meshManager.importMeshFiles(path)
 
             progressDialog.close()
@@ -707,7 +679,9 @@ class MainWindow(QMainWindow):
             progressDialog.open()
 
             progressDialog.setLabelText(self.tr('Copying files.'))
-            await MeshManager().importPolyMeshes(self._dialog.data())
+            meshManager = MeshManager()
+            meshManager.copyProgress.connect(progressDialog.setProgress)
+            await meshManager.importPolyMeshes(self._dialog.data())
 
             progressDialog.close()
 
@@ -15,7 +15,7 @@ from baramFlow.coredb.coredb_writer import CoreDBWriter
 from baramFlow.coredb.boundary_db import BoundaryDB
 from baramFlow.coredb.scalar_model_db import UserDefinedScalarsDB
 from baramFlow.coredb.monitor_db import MonitorDB, FieldHelper, Field
-from baramFlow.mesh.vtk_loader import isPointInDataSet
+from baramFlow.mesh.vtk_loader import locatePoints
 from .point_dialog_ui import Ui_PointDialog
 
 
@@ -117,10 +117,8 @@ class PointDialog(QDialog):
                           float(self._ui.coordinateY.text()),
                           float(self._ui.coordinateZ.text()))
 
-            for rname in regions:
-                if isPointInDataSet(coordinate, app.internalMeshActor(rname).dataSet):
-                    region = rname
-                    break
+            located = locatePoints([coordinate], {rname: app.internalMeshActor(rname) for rname in regions})
+            region = located[0] or ''
 
         field = self._ui.field.currentData()
         if field.field == Field.SCALAR and region != UserDefinedScalarsDB.getRegion(field.id):
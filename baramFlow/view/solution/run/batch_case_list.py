@@ -229,6 +229,7 @@ class BatchCaseList(QObject):
         self._menu.cancelScheduleActionTriggered.connect(self._cancelSchedule)
         self._menu.deleteActionTriggered.connect(self._delete)
         CaseManager().batchCleared.connect(self._clearStatuses)
+        CaseManager().batchStatusChanged.connect(self._batchStatusChanged)
 
     def _adjustSize(self):
         if self._cases:
@@ -308,6 +309,10 @@ class BatchCaseList(QObject):
 
         self._listChanged()
 
+    def _batchStatusChanged(self, name, status):
+        if name in self._items:
+            self.updateStatus(status, name)
+
     def _clearStatuses(self):
         for name, item in self._items.items():
             item.setStatus(SolverStatus.NONE)
@@ -137,7 +137,7 @@ class ProcessInformationPage(ContentPage):
         controlDict.writeAtomic()
 
         if self._runningMode == RunningMode.BATCH_RUNNING_MODE:
-            self._caseManager.stopBatchRun()
+            self._caseManager.stopBatchRun('noWriteNow')
 
         self._waitingStop()
 
@@ -147,7 +147,7 @@ class ProcessInformationPage(ContentPage):
         controlDict.writeAtomic()
 
         if self._runningMode == RunningMode.BATCH_RUNNING_MODE:
-            self._caseManager.stopBatchRun()
+            self._caseManager.stopBatchRun('writeNow')
 
         self._waitingStop()
 
@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+
+LOD_FACTOR = 4    # Number of blocks of a level merged into a block of the next level
+
+
+class _Level:
+    def __init__(self):
+        self.minIndex = np.empty(0, dtype=np.int64)
+        self.maxIndex = np.empty(0, dtype=np.int64)
+        self.count = 0
+
+    def truncate(self, count):
+        self.count = min(self.count, count)
+
+    def append(self, minIndex, maxIndex):
+        end = self.count + minIndex.size
+        if end > self.minIndex.size:
+            capacity = max(end, self.minIndex.size * 2, 256)
+            self.minIndex = np.resize(self.minIndex, capacity)
+            self.maxIndex = np.resize(self.maxIndex, capacity)
+
+        self.minIndex[self.count:end] = minIndex
+        self.maxIndex[self.count:end] = maxIndex
+        self.count = end
+
+
+class MinMaxPyramid:
+    """Multi-resolution min/max summary of a series for drawing
+
+    Blocks of the first level cover LOD_FACTOR points, and a block of each next level covers LOD_FACTOR blocks below.
+    A block keeps the indexes of the minimum and the maximum of the points it covers.
+    Only complete blocks are kept, so appending points updates the blocks at the end only.
+    A series is decimated to the minimums and maximums of the blocks in the range to draw,
+    which keeps the shape of the series including its peaks.
+    """
+    def __init__(self):
+        self._x = np.empty(0)
+        self._y = np.empty(0)
+        self._levels = []
+
+    def update(self, x: np.ndarray, y: np.ndarray, start=0):
+        """Updates the summary with the series of which the points from the start were changed or appended
+
+        Args:
+            x: x values of the series in ascending order
+            y: y values of the series
+            start: index of the first point changed
+        """
+        self._x = x
+        self._y = y
+
+        size = x.size
+        level = 0
+        blockSize = LOD_FACTOR
+        while (count := size // blockSize) > 0:
+            if level == len(self._levels):
+                self._levels.append(_Level())
+
+            current = self._levels[level]
+            current.truncate(start // blockSize)
+            if current.count < count:
+                begin = current.count * LOD_FACTOR
+                end = count * LOD_FACTOR
+                if level == 0:
+                    minCandidates = maxCandidates = np.arange(begin, end).reshape(-1, LOD_FACTOR)
+                else:
+                    lower = self._levels[level - 1]
+                    minCandidates = lower.minIndex[begin:end].reshape(-1, LOD_FACTOR)
+                    maxCandidates = lower.maxIndex[begin:end].reshape(-1, LOD_FACTOR)
+
+                # Missing values are never chosen unless all the values in the block are missing
+                lows = np.nan_to_num(y[minCandidates], nan=np.inf).argmin(axis=1)
+                highs = np.nan_to_num(y[maxCandidates], nan=-np.inf).argmax(axis=1)
+                current.append(np.take_along_axis(minCandidates, lows[:, None], axis=1).ravel(),
+                               np.take_along_axis(maxCandidates, highs[:, None], axis=1).ravel())
+
+            level += 1
+            blockSize *= LOD_FACTOR
+
+        del self._levels[level:]
+
+    def decimate(self, left: float, right: float, width: int) -> (np.ndarray, np.ndarray):
+        """Returns points to draw the series in the range of x
+
+        Args:
+            left: the minimum x of the range
+            right: the maximum x of the range
+            width: number of pixels for the range
+
+        Returns:
+            x and y values of at most about twice as many points as the width
+        """
+        start = max(int(np.searchsorted(self._x, left, side='left')) - 1, 0)
+        end = min(int(np.searchsorted(self._x, right, side='right')) + 1, self._x.size)
+        if end - start <= 2 * width:
+            return self._x[start:end], self._y[start:end]
+
+        level = 0
+        while level < len(self._levels) - 1 and (end - start) / LOD_FACTOR ** (level + 1) > width:
+            level += 1
+
+        # The end points are included for the line to reach the ends of the range
+        indexes = np.unique(np.concatenate([[start, end - 1], *self._cover(start, end, level)]))
+
+        return self._x[indexes], self._y[indexes]
+
+    def _cover(self, start, end, level):
+        """Returns the indexes of the minimums and maximums of the blocks covering the points from start to end
+
+        The points are covered by the blocks of the level inside the range,
+        and the points before and after them by the blocks of lower levels or by the points themselves.
+        """
+        if level < 0:
+            return [np.arange(start, end)]
+
+        blockSize = LOD_FACTOR ** (level + 1)
+        current = self._levels[level]
+        first = -(-start // blockSize)
+        last = min(end // blockSize, current.count)
+        if last <= first:
+            return self._cover(start, end, level - 1)
+
+        pairs = np.stack([current.minIndex[first:last], current.maxIndex[first:last]], axis=1)
+
+        return [*self._cover(start, first * blockSize, level - 1),
+                np.sort(pairs, axis=1).ravel(),
+                *self._cover(last * blockSize, end, level - 1)]
+
+
+class ChartRenderer:
+    """Redraws lines of a chart
+
+    Lines are animated artists drawn over the cached background of the figure,
+    so the figure is redrawn only if the axes have changed, and the redraws are coalesced by draw_idle().
+    """
+    def __init__(self, canvas, axes):
+        self._canvas = canvas
+        self._axes = axes
+        self._background = None
+        self._state = None
+
+        self._canvas.mpl_connect('draw_event', self._onDraw)
+
+    def addLine(self, line):
+        line.set_animated(True)
+
+    def invalidate(self):
+        """Makes the next redraw draw the whole figure, which is required when other than lines have changed"""
+        self._background = None
+
+    def redraw(self):
+        if self._background is None or self._state != self._axesState():
+            self._canvas.draw_idle()
+        else:
+            self._canvas.restore_region(self._background)
+            self._drawLines()
+            self._canvas.blit(self._canvas.figure.bbox)
+
+    def _axesState(self):
+        return tuple(self._axes.get_xlim()), tuple(self._axes.get_ylim()), self._axes.bbox.bounds
+
+    def _onDraw(self, event):
+        self._background = self._canvas.copy_from_bbox(self._canvas.figure.bbox)
+        self._state = self._axesState()
+        self._drawLines()
+
+    def _drawLines(self):
+        for line in self._axes.get_lines():
+            if line.get_animated():
+                self._axes.draw_artist(line)
@@ -19,6 +19,8 @@ from matplotlib.lines import Line2D
 from baramFlow.coredb import coredb
 from baramFlow.coredb.general_db import GeneralDB
 from baramFlow.coredb.run_calculation_db import TimeSteppingMethod, RunCalculationDB
+from baramFlow.libbaram.time_series import TimeSeriesStore
+from baramFlow.view.widgets.chart_lod import MinMaxPyramid, ChartRenderer
 
 SIDE_MARGIN = 0.05  # 5% margin between line end and right axis
 
@@ -27,9 +29,10 @@ class ChartWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
 
-        self._data = None
+        self._data = TimeSeriesStore()
 
         self._lines: typing.Dict[str, Line2D] = {}
+        self._pyramids: typing.Dict[str, MinMaxPyramid] = {}
 
         self._logScale = False
         self._initialMaxX = 10
@@ -43,25 +46,28 @@ class ChartWidget(QWidget):
         layout.addWidget(self._canvas)
 
         self._axes = self._canvas.figure.subplots()
+        self._renderer = ChartRenderer(self._canvas, self._axes)
         self.clear()
 
     def setTitle(self, title):
         self._axes.set_title(title)
+        self._renderer.invalidate()
 
     def logScaleOn(self):
         self._logScale = True
         self._axes.set_yscale('log')
+        self._renderer.invalidate()
 
     def setData(self, data):
-        self._data = data
-        self._updateChart(1.0)
+        self._data = TimeSeriesStore()
+        self.appendData(data)
 
     def fitChart(self):
-        if self._data is None:
+        if len(self._data) == 0:
             return
 
-        minX = float(self._data.first_valid_index())
-        maxX = float(self._data.last_valid_index())
+        minX = float(self._data.times()[0])
+        maxX = float(self._data.times()[-1])
 
         dataWidth = maxX - minX
         if dataWidth == 0:
@@ -70,36 +76,45 @@ class ChartWidget(QWidget):
         margin = dataWidth * SIDE_MARGIN / (1 - 2 * SIDE_MARGIN)
 
         self._axes.set_xlim([minX-margin, maxX+margin])
+        self._updateLines()
         self._adjustYRange(minX, maxX)
 
-        self._canvas.draw()
+        self._renderer.redraw()
 
     def appendData(self, data: pd.DataFrame):
-        if self._data is None:
-            self._data = data
-        else:
-            self._data = pd.concat([self._data[self._data.index < data.first_valid_index()], data])
+        """Appends rows indexed by Time
 
-        d = self._data.reset_index()  # "Time" is back to a column to serve as X value in numpy transpose below
+        Rows starting at or before the last time replace the rows from that time.
+        """
+        kept = self._data.append(data)
 
-        for c in self._data.columns.values.tolist():
+        times = self._data.times()
+        newLines = False
+        for c in self._data.columns:
             if c not in self._lines:
-                self._lines[c], = self._axes.plot('Time', c, '', label=c, data=d)
+                self._lines[c], = self._axes.plot([], [], '', label=c)
                 self._lines[c].set_linewidth(0.8)
-            else:
-                self._lines[c].set_data(d[['Time', c]].to_numpy().transpose())
+                self._renderer.addLine(self._lines[c])
+                self._pyramids[c] = MinMaxPyramid()
+                newLines = True
 
-        legend = self._axes.legend()
-        for h in legend.legendHandles:
-            h.set_linewidth(1.6)
+            self._pyramids[c].update(times, self._data.values(c), kept)
+
+        if newLines:
+            legend = self._axes.legend()
+            for h in legend.legendHandles:
+                h.set_linewidth(1.6)
+            self._renderer.invalidate()
 
         self._updateChart(1.0)
 
     def clear(self):
         self._axes.cla()
 
-        self._data = None
+        self._data = TimeSeriesStore()
         self._lines = {}
+        self._pyramids = {}
+        self._renderer.invalidate()
 
         self._axes.grid(alpha=0.6, linestyle='--')
         self._axes.xaxis.set_major_formatter(ticker.FuncFormatter(lambda num, _: '{:g}'.format(num)))
@@ -131,11 +146,11 @@ class ChartWidget(QWidget):
         self._canvas.draw()
 
     def _updateChart(self, scale: float):
-        if self._data is None:
+        if len(self._data) == 0:
             return
 
-        timeMin = float(self._data.first_valid_index())
-        timeMax = float(self._data.last_valid_index())
+        timeMin = float(self._data.times()[0])
+        timeMax = float(self._data.times()[-1])
 
         dataWidth = timeMax - timeMin
 
@@ -156,21 +171,30 @@ class ChartWidget(QWidget):
 
         self._axes.set_xlim([minX-margin, maxX+margin])
 
+        self._updateLines()
         self._adjustYRange(minX, maxX)
 
-        self._canvas.draw()  # force re-draw the next time the GUI refreshes
-        # self._canvas.draw_idle()
+        self._renderer.redraw()
 
     def _onScroll(self, event):
         scale = np.power(1.05, -event.step)
         self._updateChart(scale)
 
+    def _updateLines(self):
+        # Lines are drawn with points decimated for the visible range, which keep the peaks of the values
+        left, right = self._axes.get_xlim()
+        width = max(int(self._axes.bbox.width), 1)
+        for c, line in self._lines.items():
+            line.set_data(*self._pyramids[c].decimate(left, right, width))
+
     def _adjustYRange(self, minX: float, maxX: float):
-        data = self._data
+        values = [y[(x >= minX) & (x <= maxX)] for x, y in (line.get_data() for line in self._lines.values())]
+        values = np.concatenate(values) if values else np.empty(0)
+        if np.isnan(values).all():
+            return
 
-        d = data[(data.index >= minX) & (data.index <= maxX)]
-        minY = d.min().min()
-        maxY = d.max().max()
+        minY = np.nanmin(values)
+        maxY = np.nanmax(values)
 
         if self._logScale:
             # value cannot be "0" or close to "0" in log scale chart
@@ -1,40 +1,103 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import os
+from collections.abc import MutableMapping
 from enum import Enum
+from pathlib import Path
 
 import h5py
+import numpy as np
+from vtkmodules.util import numpy_support
+from vtkmodules.vtkCommonCore import vtkPoints, vtkDataArray, VTK_TYPE_INT32, VTK_TYPE_INT64, VTK_BIT
+from vtkmodules.vtkCommonDataModel import vtkPolyData, vtkCellArray
 from vtkmodules.vtkIOXML import vtkXMLPolyDataWriter, vtkXMLPolyDataReader
 
 CONFIGURATIONS_KEY = 'configurations'
 
 POLYDATA_PREFIX = 'polyData'
 
+_CELL_TYPES = ['verts', 'lines', 'polys', 'strips']
+_ATTRIBUTE_DATA = ['pointData', 'cellData']
+_COMPRESSION = {'compression': 'gzip', 'compression_opts': 4, 'shuffle': True}
+
 
 class FileGroup(Enum):
     GEOMETRY_POLY_DATA = 'geometry'
 
 
+class PolyDataFiles(MutableMapping):
+    """vtkPolyData of geometries, read from the file on the first access
+
+    Geometries stored as XML strings by previous versions are read in the same way and written as datasets.
+    """
+    def __init__(self, path=None, keys=()):
+        self._path = path
+        self._unloaded = set(keys)
+        self._data = {}
+
+    def __getitem__(self, key):
+        if key in self._unloaded:
+            with h5py.File(self._path, 'r') as f:
+                self._data[key] = _readPolyData(f[FileGroup.GEOMETRY_POLY_DATA.value][key])
+            self._unloaded.discard(key)
+
+        return self._data[key]
+
+    def __setitem__(self, key, value):
+        self._unloaded.discard(key)
+        self._data[key] = value
+
+    def __delitem__(self, key):
+        if key in self._unloaded:
+            self._unloaded.discard(key)
+        else:
+            del self._data[key]
+
+    def __iter__(self):
+        yield from self._data
+        yield from self._unloaded
+
+    def __len__(self):
+        return len(self._data) + len(self._unloaded)
+
+    def write(self, group: h5py.Group):
+        if self._unloaded:
+            with h5py.File(self._path, 'r') as f:
+                source = f[FileGroup.GEOMETRY_POLY_DATA.value]
+                for key in self._unloaded:
+                    if isinstance(source[key], h5py.Group):
+                        source.copy(source[key], group, key)
+                    else:   # Geometry in XML, migrated to datasets
+                        _writePolyData(group, key, _readPolyData(source[key]))
+
+        for key, polyData in self._data.items():
+            if polyData:
+                _writePolyData(group, key, polyData)
+
+    def relocate(self, path):
+        self._path = path
+
+
 def newFiles():
     return {
-        FileGroup.GEOMETRY_POLY_DATA.value: {}
+        FileGroup.GEOMETRY_POLY_DATA.value: PolyDataFiles()
     }
 
 
 def writeConfigurations(path, configurations, files):
-    with h5py.File(path, 'w') as f:
+    path = Path(path)
+    temp = path.with_suffix('.tmp')
+    with h5py.File(temp, 'w') as f:
         f[CONFIGURATIONS_KEY] = configurations
 
         geometryPolyData = f.create_group(FileGroup.GEOMETRY_POLY_DATA.value)
         polyData = files[FileGroup.GEOMETRY_POLY_DATA.value]
-        for key in polyData:
-            if polyData[key]:
-                writer = vtkXMLPolyDataWriter()
-                writer.SetInputData(polyData[key])
-                writer.WriteToOutputStringOn()
-                writer.Update()
+        polyData.write(geometryPolyData)
 
-                geometryPolyData[key] = writer.GetOutputString()
+    # Written to another file first, because geometries not loaded yet are copied from the file being replaced
+    os.replace(temp, path)
+    polyData.relocate(path)
 
 
 def readConfigurations(path):
@@ -45,21 +108,116 @@ def readConfigurations(path):
         maxIds = {}
 
         geometryPolyData = f[FileGroup.GEOMETRY_POLY_DATA.value]
-        polyData = {}
         maxIndex = 0
         prefixLen = len(POLYDATA_PREFIX)
         for key in geometryPolyData.keys():
-            reader = vtkXMLPolyDataReader()
-            reader.ReadFromInputStringOn()
-            reader.SetInputString(geometryPolyData[key][()])
-            reader.Update()
-            polyData[key] = reader.GetOutput()
-
             index = int(key[prefixLen:])
             if index > maxIndex:
                 maxIndex = index
 
-        files[FileGroup.GEOMETRY_POLY_DATA.value] = polyData
+        files[FileGroup.GEOMETRY_POLY_DATA.value] = PolyDataFiles(path, geometryPolyData.keys())
         maxIds[FileGroup.GEOMETRY_POLY_DATA.value] = maxIndex
 
         return configurations, files, maxIds
+
+
+def _isWritableAsDatasets(polyData: vtkPolyData):
+    if polyData.GetFieldData().GetNumberOfArrays() > 0:
+        return False
+
+    for attributes in [polyData.GetPointData(), polyData.GetCellData()]:
+        for i in range(attributes.GetNumberOfArrays()):
+            array = attributes.GetAbstractArray(i)
+            if not isinstance(array, vtkDataArray) or array.GetDataType() == VTK_BIT or not array.GetName():
+                return False
+
+    return True
+
+
+def _createDataset(group, name, data):
+    if data.size:
+        group.create_dataset(name, data=data, chunks=True, **_COMPRESSION)
+    else:
+        group.create_dataset(name, data=data)
+
+
+def _writePolyData(parent: h5py.Group, key, polyData: vtkPolyData):
+    if not _isWritableAsDatasets(polyData):
+        writer = vtkXMLPolyDataWriter()
+        writer.SetInputData(polyData)
+        writer.WriteToOutputStringOn()
+        writer.Update()
+
+        parent[key] = writer.GetOutputString()
+
+        return
+
+    group = parent.create_group(key)
+
+    points = polyData.GetPoints()
+    _createDataset(group, 'points',
+                   numpy_support.vtk_to_numpy(points.GetData()) if points else np.empty((0, 3), dtype=np.float32))
+
+    for name in _CELL_TYPES:
+        cells: vtkCellArray = getattr(polyData, f'Get{name.capitalize()}')()
+        if cells.GetNumberOfCells() > 0:
+            offsets = numpy_support.vtk_to_numpy(cells.GetOffsetsArray())
+            connectivity = numpy_support.vtk_to_numpy(cells.GetConnectivityArray())
+            if offsets[-1] <= np.iinfo(np.int32).max:
+                offsets = offsets.astype(np.int32, copy=False)
+                connectivity = connectivity.astype(np.int32, copy=False)
+
+            cellGroup = group.create_group(name)
+            _createDataset(cellGroup, 'offsets', offsets)
+            _createDataset(cellGroup, 'connectivity', connectivity)
+
+    for name, attributes in zip(_ATTRIBUTE_DATA, [polyData.GetPointData(), polyData.GetCellData()]):
+        attributeGroup = group.create_group(name)
+        for i in range(attributes.GetNumberOfArrays()):
+            array = attributes.GetArray(i)
+            _createDataset(attributeGroup, array.GetName(), numpy_support.vtk_to_numpy(array))
+
+        if scalars := attributes.GetScalars():
+            attributeGroup.attrs['scalars'] = scalars.GetName()
+        if normals := attributes.GetNormals():
+            attributeGroup.attrs['normals'] = normals.GetName()
+
+
+def _readPolyData(item):
+    if isinstance(item, h5py.Dataset):
+        reader = vtkXMLPolyDataReader()
+        reader.ReadFromInputStringOn()
+        reader.SetInputString(item[()])
+        reader.Update()
+
+        return reader.GetOutput()
+
+    # Arrays are copied into VTK, because VTK keeps no reference to the numpy arrays read
+    polyData = vtkPolyData()
+
+    points = vtkPoints()
+    points.SetData(numpy_support.numpy_to_vtk(item['points'][()], deep=1))
+    polyData.SetPoints(points)
+
+    for name in _CELL_TYPES:
+        if name in item:
+            offsets = item[name]['offsets'][()]
+            connectivity = item[name]['connectivity'][()]
+            arrayType = VTK_TYPE_INT32 if offsets.dtype == np.int32 else VTK_TYPE_INT64
+            cells = vtkCellArray()
+            cells.SetData(numpy_support.numpy_to_vtk(offsets, deep=1, array_type=arrayType),
+                          numpy_support.numpy_to_vtk(connectivity, deep=1, array_type=arrayType))
+            getattr(polyData, f'Set{name.capitalize()}')(cells)
+
+    for name, attributes in zip(_ATTRIBUTE_DATA, [polyData.GetPointData(), polyData.GetCellData()]):
+        for arrayName, dataset in item[name].items():
+            array = numpy_support.numpy_to_vtk(dataset[()], deep=1)
+            array.SetName(arrayName)
+            attributes.AddArray(array)
+
+        if 'scalars' in item[name].attrs:
+            attributes.SetActiveScalars(item[name].attrs['scalars'])
+        if 'normals' in item[name].attrs:
+            attributes.SetActiveNormals(item[name].attrs['normals'])
+
+    return polyData
@@ -132,8 +132,14 @@ class RedistributionTask(QObject):
 
             self.progress.emit(self.tr(f'Decomposition done.'))
 
-    def _reportTimeProgress(self, msg):
+    def _reportTimeProgress(self, output):
+        # Lines are emitted in batches, and only the last time of them is reported
+        times = [line for line in output.splitlines() if line.startswith('Time = ')]
+        if not times:
+            return
+
+        msg = times[-1]
         if msg.startswith('Time = constant'):
             self.progress.emit(self.tr(f'{self._reconstructMessage} (constant)'))
-        elif msg.startswith('Time = '):
+        else:
             self.progress.emit(self.tr(f'{self._reconstructMessage} ({msg.strip()}/{self._latestTime})'))
@@ -0,0 +1,169 @@
+import gc
+import unittest
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+import h5py
+import numpy as np
+from vtkmodules.util.numpy_support import numpy_to_vtk, numpy_to_vtkIdTypeArray, vtk_to_numpy
+from vtkmodules.vtkCommonCore import vtkPoints, vtkStringArray
+from vtkmodules.vtkCommonDataModel import vtkPolyData, vtkCellArray
+from vtkmodules.vtkIOXML import vtkXMLPolyDataWriter
+
+from baramMesh.db import file_db
+from baramMesh.db.file_db import FileGroup, newFiles, writeConfigurations, readConfigurations
+
+
+CONFIGURATIONS = 'version: 1\n'
+
+
+def createPolyData():
+    polyData = vtkPolyData()
+
+    points = vtkPoints()
+    points.SetData(numpy_to_vtk(np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]], dtype=np.float32), deep=1))
+    polyData.SetPoints(points)
+
+    polys = vtkCellArray()
+    polys.SetData(numpy_to_vtkIdTypeArray(np.array([0, 3, 7]), deep=1),
+                  numpy_to_vtkIdTypeArray(np.array([0, 1, 2, 0, 1, 2, 3]), deep=1))
+    polyData.SetPolys(polys)
+
+    lines = vtkCellArray()
+    lines.SetData(numpy_to_vtkIdTypeArray(np.array([0, 2]), deep=1), numpy_to_vtkIdTypeArray(np.array([0, 3]), deep=1))
+    polyData.SetLines(lines)
+
+    normals = numpy_to_vtk(np.tile(np.array([0, 0, 1], dtype=np.float32), (4, 1)), deep=1)
+    normals.SetName('Normals')
+    polyData.GetPointData().SetNormals(normals)
+
+    regions = numpy_to_vtk(np.array([7, 8, 9], dtype=np.int32), deep=1)
+    regions.SetName('RegionId')
+    polyData.GetCellData().SetScalars(regions)
+
+    return polyData
+
+
+def createStringArray():
+    names = vtkStringArray()
+    names.SetName('name')
+    names.InsertNextValue('geometry')
+
+    return names
+
+
+class TestFileDB(unittest.TestCase):
+    def setUp(self):
+        self._path = Path('testFileDB')
+        self._path.mkdir(exist_ok=True)
+        self._file = self._path / 'configurations.h5'
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self._path)
+
+    def _write(self, **polyData):
+        files = newFiles()
+        for key, value in polyData.items():
+            files[FileGroup.GEOMETRY_POLY_DATA.value][key] = value
+
+        writeConfigurations(self._file, CONFIGURATIONS, files)
+
+        return files
+
+    def assertPolyDataEqual(self, expected: vtkPolyData, actual: vtkPolyData):
+        np.testing.assert_array_equal(vtk_to_numpy(expected.GetPoints().GetData()),
+                                      vtk_to_numpy(actual.GetPoints().GetData()))
+        for name in ['Polys', 'Lines']:
+            e, a = getattr(expected, f'Get{name}')(), getattr(actual, f'Get{name}')()
+            np.testing.assert_array_equal(vtk_to_numpy(e.GetOffsetsArray()), vtk_to_numpy(a.GetOffsetsArray()))
+            np.testing.assert_array_equal(vtk_to_numpy(e.GetConnectivityArray()),
+                                          vtk_to_numpy(a.GetConnectivityArray()))
+
+        np.testing.assert_array_equal(vtk_to_numpy(expected.GetPointData().GetNormals()),
+                                      vtk_to_numpy(actual.GetPointData().GetNormals()))
+        np.testing.assert_array_equal(vtk_to_numpy(expected.GetCellData().GetScalars()),
+                                      vtk_to_numpy(actual.GetCellData().GetScalars()))
+
+    def testRoundTrip(self):
+        polyData = createPolyData()
+        self._write(polyData1=polyData, polyData3=createPolyData())
+
+        configurations, files, maxIds = readConfigurations(self._file)
+        self.assertEqual(CONFIGURATIONS, configurations.decode())
+        self.assertEqual(3, maxIds[FileGroup.GEOMETRY_POLY_DATA.value])
+
+        with h5py.File(self._file, 'r') as f:
+            self.assertIsInstance(f[FileGroup.GEOMETRY_POLY_DATA.value]['polyData1'], h5py.Group)
+
+        geometries = files[FileGroup.GEOMETRY_POLY_DATA.value]
+        self.assertEqual({'polyData1', 'polyData3'}, set(geometries))
+
+        actual = geometries['polyData1']
+        gc.collect()    # Arrays should be alive after the file and the arrays read are released
+        self.assertPolyDataEqual(polyData, actual)
+        self.assertEqual('Normals', actual.GetPointData().GetNormals().GetName())
+        self.assertEqual('RegionId', actual.GetCellData().GetScalars().GetName())
+
+    def testXmlFallback(self):
+        polyData = createPolyData()
+        polyData.GetFieldData().AddArray(createStringArray())
+        self._write(polyData1=polyData)
+
+        with h5py.File(self._file, 'r') as f:
+            self.assertIsInstance(f[FileGroup.GEOMETRY_POLY_DATA.value]['polyData1'], h5py.Dataset)
+
+        _, files, _ = readConfigurations(self._file)
+        actual = files[FileGroup.GEOMETRY_POLY_DATA.value]['polyData1']
+        self.assertPolyDataEqual(polyData, actual)
+        self.assertEqual('geometry', actual.GetFieldData().GetAbstractArray('name').GetValue(0))
+
+    def testXmlMigration(self):
+        polyData = createPolyData()
+        writer = vtkXMLPolyDataWriter()
+        writer.SetInputData(polyData)
+        writer.WriteToOutputStringOn()
+        writer.Update()
+
+        # Written by previous versions
+        with h5py.File(self._file, 'w') as f:
+            f[file_db.CONFIGURATIONS_KEY] = CONFIGURATIONS
+            f.create_group(FileGroup.GEOMETRY_POLY_DATA.value)['polyData1'] = writer.GetOutputString()
+
+        _, files, _ = readConfigurations(self._file)
+        writeConfigurations(self._file, CONFIGURATIONS, files)
+
+        with h5py.File(self._file, 'r') as f:
+            self.assertIsInstance(f[FileGroup.GEOMETRY_POLY_DATA.value]['polyData1'], h5py.Group)
+
+        _, files, _ = readConfigurations(self._file)
+        self.assertPolyDataEqual(polyData, files[FileGroup.GEOMETRY_POLY_DATA.value]['polyData1'])
+
+    def testLazyLoading(self):
+        polyData = createPolyData()
+        self._write(polyData1=polyData, polyData2=createPolyData())
+
+        with patch.object(file_db, '_readPolyData', wraps=file_db._readPolyData) as readPolyData:
+            _, files, _ = readConfigurations(self._file)
+            geometries = files[FileGroup.GEOMETRY_POLY_DATA.value]
+            self.assertEqual(2, len(geometries))
+            readPolyData.assert_not_called()
+
+            self.assertPolyDataEqual(polyData, geometries['polyData1'])
+            geometries['polyData1']
+            self.assertEqual(1, readPolyData.call_count)
+
+            # Geometries not loaded are copied as they are, and the others are written
+            del geometries['polyData2']
+            geometries['polyData4'] = createPolyData()
+            writeConfigurations(self._file, CONFIGURATIONS, files)
+            self.assertEqual(1, readPolyData.call_count)
+
+        _, files, maxIds = readConfigurations(self._file)
+        self.assertEqual({'polyData1', 'polyData4'}, set(files[FileGroup.GEOMETRY_POLY_DATA.value]))
+        self.assertEqual(4, maxIds[FileGroup.GEOMETRY_POLY_DATA.value])
+        self.assertPolyDataEqual(polyData, files[FileGroup.GEOMETRY_POLY_DATA.value]['polyData4'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import unittest
+import shutil
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from baramMesh.view.geometry.stl_reader import readStl
+
+
+# Two triangles of a square sharing an edge, and a triangle of zero area
+TRIANGLES = [
+    [[0, 0, 0], [1, 0, 0], [1, 1, 0]],
+    [[-0.0, 0, 0], [1, 1, 0], [0, 1, -0.0]],
+    [[0, 0, 0], [1, 0, 0], [2, 0, 0]],
+]
+
+
+def asciiSolid(name, triangles):
+    lines = [f'solid {name}']
+    for triangle in triangles:
+        lines.append('  facet normal 0 0 1')
+        lines.append('    outer loop')
+        lines.extend(f'      vertex {x:e} {y:e} {z:e}' for x, y, z in triangle)
+        lines.append('    endloop')
+        lines.append('  endfacet')
+    lines.append(f'endsolid {name}')
+
+    return '\n'.join(lines) + '\n'
+
+
+def binaryStl(header, triangles):
+    facets = np.zeros(len(triangles), dtype=[('normal', '<f4', (3,)), ('vertices', '<f4', (3, 3)),
+                                              ('attribute', '<u2')])
+    facets['vertices'] = np.reshape(triangles, (-1, 3, 3))
+
+    return header.ljust(80, b' ') + len(triangles).to_bytes(4, 'little') + facets.tobytes()
+
+
+class TestStlReader(unittest.TestCase):
+    def setUp(self):
+        self._path = Path(tempfile.mkdtemp())
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self._path)
+
+    def assertSquare(self, solid):
+        self.assertEqual(np.float32, solid.points.dtype)
+        self.assertEqual((2, 3), solid.triangles.shape)
+
+        # The points at 0.0 and -0.0 are merged
+        self.assertEqual(4, len(solid.points))
+        np.testing.assert_array_equal(TRIANGLES[:2], solid.points[solid.triangles])
+        self.assertFalse(np.signbit(solid.points).any())
+
+    def testBinary(self):
+        path = self._path / 'square.stl'
+        path.write_bytes(binaryStl(b'binary square', TRIANGLES))
+
+        solids = readStl(path)
+        self.assertEqual(1, len(solids))
+        self.assertEqual('', solids[0].name)
+        self.assertSquare(solids[0])
+
+    def testBinaryHeaderStartingWithSolid(self):
+        # Binary by the size of the file, although the header starts with "solid" as ascii files do
+        path = self._path / 'square.stl'
+        path.write_bytes(binaryStl(b'solid square', TRIANGLES))
+
+        solids = readStl(path)
+        self.assertEqual(1, len(solids))
+        self.assertSquare(solids[0])
+
+    def testBinaryEmpty(self):
+        path = self._path / 'empty.stl'
+        path.write_bytes(binaryStl(b'empty', []))
+        self.assertEqual([], readStl(path))
+
+        path.write_bytes(binaryStl(b'zero area', TRIANGLES[2:]))
+        self.assertEqual([], readStl(path))
+
+    def testAscii(self):
+        path = self._path / 'solids.stl'
+        path.write_text(asciiSolid('upper wall', TRIANGLES)
+                        + asciiSolid('degenerated', TRIANGLES[2:])
+                        + asciiSolid('inlet', TRIANGLES[:1]))
+
+        solids = readStl(path)
+        self.assertEqual(['upper_wall', 'inlet'], [s.name for s in solids])
+        self.assertSquare(solids[0])
+
+        self.assertEqual(3, len(solids[1].points))
+        np.testing.assert_array_equal(TRIANGLES[:1], solids[1].points[solids[1].triangles])
+
+    def testAsciiWithoutName(self):
+        path = self._path / 'square.stl'
+        path.write_text(asciiSolid('', TRIANGLES))
+
+        solids = readStl(path)
+        self.assertEqual([''], [s.name for s in solids])
+        self.assertSquare(solids[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import unittest
+import shutil
+import tempfile
+from pathlib import Path
+
+import numpy as np
+from vtkmodules.util.numpy_support import numpy_to_vtk, numpy_to_vtkIdTypeArray, vtk_to_numpy
+from vtkmodules.vtkCommonCore import vtkPoints
+from vtkmodules.vtkCommonDataModel import vtkPolyData, vtkCellArray
+from vtkmodules.vtkFiltersCore import vtkTriangleFilter
+from vtkmodules.vtkFiltersSources import vtkCubeSource
+from vtkmodules.vtkIOGeometry import vtkSTLWriter
+
+from baramMesh.view.geometry.stl_utility import StlImporter, _splitByRegion
+
+
+def cells(polyData):
+    offsets = vtk_to_numpy(polyData.GetPolys().GetOffsetsArray())
+    connectivity = vtk_to_numpy(polyData.GetPolys().GetConnectivityArray())
+
+    return [connectivity[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
+
+
+def expectedRegions(polyData, arrayName):
+    """Returns the coordinates of the cells and the cell and point values of each region, cell by cell"""
+    points = vtk_to_numpy(polyData.GetPoints().GetData())
+    regionIds = vtk_to_numpy(polyData.GetCellData().GetArray(arrayName))
+    cellValues = vtk_to_numpy(polyData.GetCellData().GetArray('value'))
+    pointValues = vtk_to_numpy(polyData.GetPointData().GetArray('value'))
+
+    regions = {}
+    for i, cell in enumerate(cells(polyData)):
+        regions.setdefault(int(regionIds[i]), []).append(
+            (points[cell].tolist(), int(cellValues[i]), pointValues[cell].tolist()))
+
+    return regions
+
+
+class TestStlUtility(unittest.TestCase):
+    def setUp(self):
+        self._path = Path(tempfile.mkdtemp())
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self._path)
+
+    def testSplitByRegion(self):
+        rng = np.random.default_rng(0)
+        nPoints = 50
+
+        # Triangles and quads in random regions, with unused points
+        sizes = rng.choice([3, 4], 200)
+        offsets = np.concatenate([[0], np.cumsum(sizes)])
+        connectivity = rng.integers(0, nPoints - 5, offsets[-1])
+
+        polyData = vtkPolyData()
+        points = vtkPoints()
+        points.SetData(numpy_to_vtk(rng.random((nPoints, 3)), deep=1))
+        polyData.SetPoints(points)
+        polys = vtkCellArray()
+        polys.SetData(numpy_to_vtkIdTypeArray(offsets, deep=1), numpy_to_vtkIdTypeArray(connectivity, deep=1))
+        polyData.SetPolys(polys)
+
+        for name, data, values in [('RegionId', polyData.GetCellData(), rng.integers(0, 7, 200).astype(np.int32)),
+                                   ('value', polyData.GetCellData(), np.arange(200, dtype=np.int32)),
+                                   ('value', polyData.GetPointData(), rng.random(nPoints))]:
+            array = numpy_to_vtk(values, deep=1)
+            array.SetName(name)
+            data.AddArray(array)
+
+        expected = expectedRegions(polyData, 'RegionId')
+
+        split = list(_splitByRegion(polyData, 'RegionId'))
+        self.assertEqual(sorted(expected), [rid for rid, _ in split])
+        for rid, region in split:
+            # Cells in the original order, on the points used by the region only
+            self.assertEqual(expected[rid], expectedRegions(region, 'RegionId')[rid])
+            self.assertEqual(region.GetNumberOfPoints(), len(np.unique(np.concatenate(cells(region)))))
+
+    def testSplit(self):
+        cube = vtkCubeSource()
+        cube.SetXLength(2)
+        triangles = vtkTriangleFilter()
+        triangles.SetInputConnection(cube.GetOutputPort())
+        writer = vtkSTLWriter()
+        writer.SetInputConnection(triangles.GetOutputPort())
+        writer.SetFileName(str(self._path / 'cube.stl'))
+        writer.Write()
+
+        importer = StlImporter()
+        importer.load([self._path / 'cube.stl'])
+        segments, _, _ = importer.split(30, 0)
+
+        # Faces of the cube
+        self.assertEqual(6, len(segments))
+        np.testing.assert_allclose(sorted(area for _, area in segments), [10, 10, 20, 20, 20, 20])
+
+        volumes, surfaces = importer.identifyVolumes()
+        self.assertEqual(1, len(volumes))
+        self.assertEqual(6, len(volumes[0]))
+        for surface in volumes[0]:
+            self.assertEqual('cube', surface.fName)
+            self.assertEqual(2, surface.polyData.GetNumberOfCells())
+            self.assertEqual(4, surface.polyData.GetNumberOfPoints())
+
+
+if __name__ == '__main__':
+    unittest.main()
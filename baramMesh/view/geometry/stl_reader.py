@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import mmap
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from vtkmodules.util.numpy_support import vtk_to_numpy
+from vtkmodules.vtkCommonDataModel import vtkPolyData
+from vtkmodules.vtkIOGeometry import vtkSTLReader
+
+
+_BINARY_HEADER_SIZE = 84
+_BINARY_FACET = np.dtype([('normal', '<f4', (3,)), ('vertices', '<f4', (3, 3)), ('attribute', '<u2')])
+
+
+@dataclass
+class StlSolid:
+    """A solid of an STL file, as triangles on the points merged
+
+    points are float32 as in STL files, and triangles are indices of the points of shape (n, 3).
+    """
+    name: str
+    points: np.ndarray
+    triangles: np.ndarray
+
+
+def readStl(path: Path) -> [StlSolid]:
+    """Reads an STL file into NumPy arrays
+
+    Binary files are memory-mapped. Ascii files are tokenized by vtkSTLReader without merging points,
+    which is faster than tokenizing in Python, and its output is taken as arrays.
+    Triangles of zero area are dropped, and the points at the same coordinates are merged in each solid.
+    Solids with no triangles are not returned, and the solid of a binary file has no name.
+
+    Args:
+        path: path of the STL file
+
+    Returns:
+        Solids in the file in the order in the file
+    """
+    with open(path, 'rb') as f:
+        size = f.seek(0, 2)
+        f.seek(0)
+        header = f.read(_BINARY_HEADER_SIZE)
+
+        if _isBinary(header, size):
+            count = int.from_bytes(header[80:84], 'little')
+            if count == 0:
+                return []
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                facets = np.frombuffer(buffer, dtype=_BINARY_FACET, count=count, offset=_BINARY_HEADER_SIZE)
+                vertices = facets['vertices']
+                vertices = vertices[_nonZeroArea(vertices)]  # Fancy indexing copies, so that the map can be closed
+                del facets
+
+            return [_solid('', vertices)] if len(vertices) else []
+
+    return _readAscii(path)
+
+
+def _isBinary(header, size):
+    # A binary file has a size fixed by the number of the facets, while an ascii file can start with "solid" as well
+    return (len(header) == _BINARY_HEADER_SIZE
+            and size == _BINARY_HEADER_SIZE + int.from_bytes(header[80:84], 'little') * _BINARY_FACET.itemsize)
+
+
+def _readAscii(path):
+    reader = vtkSTLReader()
+    reader.SetFileName(str(path))
+    reader.MergingOff()
+    reader.ScalarTagsOn()
+    reader.Update()
+
+    stl: vtkPolyData = reader.GetOutput()
+    if stl.GetNumberOfCells() == 0:
+        return []
+
+    points = vtk_to_numpy(stl.GetPoints().GetData()).astype(np.float32, copy=False)
+    vertices = points[vtk_to_numpy(stl.GetPolys().GetConnectivityArray()).reshape(-1, 3)]
+
+    labels = stl.GetCellData().GetScalars('STLSolidLabeling')
+    if labels is None or reader.GetBinaryHeader() is not None:
+        names = []
+        labels = np.zeros(len(vertices), dtype=np.int64)
+    else:
+        # Names are the words after "solid" joined by underscores
+        names = ['_'.join(n.split()) for n in reader.GetHeader().splitlines()]
+        labels = vtk_to_numpy(labels).astype(np.int64)
+
+    keep = _nonZeroArea(vertices)
+    vertices = vertices[keep]
+    labels = labels[keep]
+
+    # Triangles are partitioned by the solids at once, keeping their order in each solid
+    order = np.argsort(labels, kind='stable')
+    solidIds, starts = np.unique(labels[order], return_index=True)
+    ends = np.append(starts[1:], len(order))
+
+    return [_solid(names[sId] if sId < len(names) else '', vertices[order[start:end]])
+            for sId, start, end in zip(solidIds, starts, ends)]
+
+
+def _nonZeroArea(vertices):
+    a = vertices[:, 0].astype(np.float64)
+    return np.linalg.norm(np.cross(vertices[:, 1] - a, vertices[:, 2] - a), axis=1) > 0
+
+
+def _solid(name, vertices):
+    """Merges the vertices at the same coordinates by hashing their bits"""
+    vertices = vertices.reshape(-1, 3) + np.float32(0)  # -0.0 to 0.0, which are the same point
+    bits = vertices.view(np.uint32).astype(np.uint64)
+
+    xy, _ = pd.factorize((bits[:, 0] << np.uint64(32)) | bits[:, 1])
+    ids, unique = pd.factorize((xy.astype(np.uint64) << np.uint64(32)) | bits[:, 2])
+
+    points = np.empty((len(unique), 3), dtype=np.float32)
+    points[ids] = vertices
+
+    return StlSolid(name, points, ids.reshape(-1, 3))
@@ -1,17 +1,19 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-import sys
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from vtkmodules.vtkCommonCore import vtkIdTypeArray, vtkIdList, vtkIntArray
-from vtkmodules.vtkCommonDataModel import vtkPolyData, vtkCellArray, vtkCell, vtkLine, vtkDataObject
+import numpy as np
+from vtkmodules.util.numpy_support import numpy_to_vtk, numpy_to_vtkIdTypeArray, vtk_to_numpy
+from vtkmodules.vtkCommonCore import vtkPoints, VTK_INT
+from vtkmodules.vtkCommonDataModel import vtkPolyData, vtkCellArray, vtkDataSetAttributes
 from vtkmodules.vtkFiltersCore import vtkAppendPolyData, vtkIdFilter, vtkFeatureEdges, \
-    vtkPolyDataEdgeConnectivityFilter, vtkThreshold, vtkCleanPolyData
-from vtkmodules.vtkFiltersGeometry import vtkGeometryFilter
+    vtkPolyDataEdgeConnectivityFilter, vtkCleanPolyData
 from vtkmodules.vtkFiltersModeling import vtkSelectEnclosedPoints
-from vtkmodules.vtkFiltersVerdict import vtkCellSizeFilter
-from vtkmodules.vtkIOGeometry import vtkSTLReader
+
+from baramMesh.view.geometry.stl_reader import readStl, StlSolid
 
 
 class StringIndex:
@@ -88,6 +90,114 @@ def composeVolume(surfaces):
     return volumes, remains
 
 
+def _polyData(solid: StlSolid) -> vtkPolyData:
+    points = vtkPoints()
+    points.SetData(numpy_to_vtk(solid.points, deep=1))
+
+    cells = vtkCellArray()
+    cells.SetData(numpy_to_vtkIdTypeArray(np.arange(0, solid.triangles.size + 1, 3, dtype=np.int64), deep=1),
+                  numpy_to_vtkIdTypeArray(solid.triangles.ravel().astype(np.int64), deep=1))
+
+    polyData = vtkPolyData()
+    polyData.SetPoints(points)
+    polyData.SetPolys(cells)
+
+    return polyData
+
+
+def _barrierLines(edges: vtkPolyData) -> vtkCellArray:
+    """Returns the lines of the edges on the ids of the original points, which are in the "pointId" array"""
+    orgPointIds = vtk_to_numpy(edges.GetPointData().GetArray('pointId')).astype(np.int64)
+    connectivity = orgPointIds[vtk_to_numpy(edges.GetLines().GetConnectivityArray())]
+
+    lines = vtkCellArray()
+    lines.SetData(numpy_to_vtkIdTypeArray(np.arange(0, connectivity.size + 1, 2, dtype=np.int64), deep=1),
+                  numpy_to_vtkIdTypeArray(connectivity, deep=1))
+
+    return lines
+
+
+def _splitByRegion(polyData: vtkPolyData, arrayName: str):
+    """Splits the polygons of polyData by the region ids in a cell array in a pass
+
+    Cells are sorted by the regions and the points of all the regions are compacted at once,
+    then each region is sliced out of the sorted arrays.
+
+    Args:
+        polyData: polygons with the region id array
+        arrayName: name of the cell array of region ids
+
+    Yields:
+        Region id and vtkPolyData of the region, in the order of the region ids
+    """
+    regionIds = vtk_to_numpy(polyData.GetCellData().GetArray(arrayName)).astype(np.int64)
+    polys = polyData.GetPolys()
+    offsets = vtk_to_numpy(polys.GetOffsetsArray()).astype(np.int64)
+    connectivity = vtk_to_numpy(polys.GetConnectivityArray()).astype(np.int64)
+    sizes = np.diff(offsets)
+
+    order = np.argsort(regionIds, kind='stable')
+    sortedSizes = sizes[order]
+    sortedOffsets = np.concatenate(([0], np.cumsum(sortedSizes)))
+    sortedRegions = np.repeat(regionIds[order], sortedSizes)
+    sortedConnectivity = connectivity[np.repeat(offsets[:-1][order] - sortedOffsets[:-1], sortedSizes)
+                                      + np.arange(sortedOffsets[-1])]
+
+    # Points used by each region, as pairs of region and point sorted, with the connectivity on them
+    numPoints = polyData.GetNumberOfPoints()
+    keys, localConnectivity = np.unique(sortedRegions * numPoints + sortedConnectivity, return_inverse=True)
+    pointIds = keys % numPoints
+    pointRegions = keys // numPoints
+
+    rids, cellStarts = np.unique(regionIds[order], return_index=True)
+    cellEnds = np.append(cellStarts[1:], len(order))
+    pointStarts = np.searchsorted(pointRegions, rids)
+    pointEnds = np.append(pointStarts[1:], len(keys))
+
+    points = vtk_to_numpy(polyData.GetPoints().GetData())
+    pointArrays = _dataArrays(polyData.GetPointData())
+    cellArrays = _dataArrays(polyData.GetCellData())
+
+    for rid, cellStart, cellEnd, pointStart, pointEnd in zip(rids, cellStarts, cellEnds, pointStarts, pointEnds):
+        regionPoints = vtkPoints()
+        regionPoints.SetData(numpy_to_vtk(points[pointIds[pointStart:pointEnd]], deep=1))
+
+        start, end = sortedOffsets[cellStart], sortedOffsets[cellEnd]
+        cells = vtkCellArray()
+        cells.SetData(numpy_to_vtkIdTypeArray(sortedOffsets[cellStart:cellEnd + 1] - start, deep=1),
+                      numpy_to_vtkIdTypeArray(localConnectivity[start:end] - pointStart, deep=1))
+
+        region = vtkPolyData()
+        region.SetPoints(regionPoints)
+        region.SetPolys(cells)
+        _copyArrays(region.GetPointData(), pointArrays, pointIds[pointStart:pointEnd])
+        _copyArrays(region.GetCellData(), cellArrays, order[cellStart:cellEnd])
+
+        yield int(rid), region
+
+
+def _dataArrays(data: vtkDataSetAttributes):
+    arrays = []
+    for i in range(data.GetNumberOfArrays()):
+        if array := data.GetArray(i):  # None for arrays not numeric
+            arrays.append((array.GetName(), array.GetDataType(), vtk_to_numpy(array)))
+
+    return arrays
+
+
+def _copyArrays(data: vtkDataSetAttributes, arrays, indices):
+    for name, dataType, values in arrays:
+        array = numpy_to_vtk(values[indices], deep=1, array_type=dataType)
+        array.SetName(name)
+        data.AddArray(array)
+
+
+def _addArray(polyData: vtkPolyData, arrayName: str, value: int):
+    array = numpy_to_vtk(np.full(polyData.GetNumberOfCells(), value, dtype=np.int32), deep=1, array_type=VTK_INT)
+    array.SetName(arrayName)
+    polyData.GetCellData().AddArray(array)
+
+
 class StlImporter:
     def __init__(self):
         self._stringIndices = StringIndex()
@@ -98,11 +208,14 @@ class StlImporter:
         self._stringIndices.clear()
         self._solids.clear()
         self._surfaceList.clear()
-        for f in files:
-            solids = self._loadSTLFile(f)
-            # solids and surfaceList are same without split
-            self._solids.extend(solids)
-            self._surfaceList.extend(solids)
+
+        # Files are read in parallel, and surfaces are created in the order of the files
+        with ThreadPoolExecutor(max_workers=min(len(files), os.cpu_count()) or 1) as executor:
+            for f, solids in zip(files, executor.map(readStl, files)):
+                surfaces = self._createSurfaces(f, solids)
+                # solids and surfaceList are same without split
+                self._solids.extend(surfaces)
+                self._surfaceList.extend(surfaces)
 
     def split(self, angle: float, minArea: float):
         appendFilter = vtkAppendPolyData()
@@ -134,26 +247,10 @@ class StlImporter:
 
         edges: vtkPolyData = edgeFilter.GetOutput()
 
-        orgPtIdScalars: vtkIdTypeArray = edges.GetPointData().GetScalars("pointId")
-
-        lines = vtkCellArray()
-
-        for i in range(0, edges.GetNumberOfCells()):
-            cell: vtkCell = edges.GetCell(i)
-            pointIds: vtkIdList = cell.GetPointIds()
-
-            p1 = int(orgPtIdScalars.GetTuple(pointIds.GetId(0))[0])
-            p2 = int(orgPtIdScalars.GetTuple(pointIds.GetId(1))[0])
-
-            line = vtkLine()
-            line.GetPointIds().SetId(0, p1)
-            line.GetPointIds().SetId(1, p2)
-            lines.InsertNextCell(line)
-
         # barrier should have the same points with original surface
         barrier = vtkPolyData()
         barrier.SetPoints(orgSurface.GetPoints())
-        barrier.SetLines(lines)
+        barrier.SetLines(_barrierLines(edges))
 
         conn = vtkPolyDataEdgeConnectivityFilter()
         conn.SetInputData(orgSurface)
@@ -173,26 +270,7 @@ class StlImporter:
         self._surfaceList.clear()
         segments = []
         totalArea = conn.GetTotalArea()
-        numRegions = conn.GetNumberOfExtractedRegions()
-        for rid in range(0, numRegions):
-            t = vtkThreshold()
-            t.SetInputData(regionedData)
-            t.SetLowerThreshold(rid - 0.5)
-            t.SetUpperThreshold(rid + 0.5)
-            t.SetThresholdFunction(vtkThreshold.THRESHOLD_BETWEEN)
-            t.SetInputArrayToProcess(0, 0, 0, vtkDataObject.FIELD_ASSOCIATION_CELLS, 'RegionId')
-            t.Update()
-
-            # Output of vtkThreshold filter is Unstructured Grid
-            # Convert it to vtkPolyData by vtkGeometryFilter
-            geometry = vtkGeometryFilter()
-            geometry.SetInputData(t.GetOutput())
-            geometry.Update()
-
-            polyData: vtkPolyData = geometry.GetOutput()
-            if polyData.GetNumberOfCells() == 0:
-                continue
-
+        for rid, polyData in _splitByRegion(regionedData, 'RegionId'):
             fIndex = polyData.GetCellData().GetAbstractArray("fIndex").GetValue(0)
             fName = self._stringIndices.getString(fIndex)
 
@@ -208,95 +286,22 @@ class StlImporter:
 
         return segments, regionedData, edges
 
-    def _loadSTLFile(self, path: Path):
-        reader: vtkSTLReader = vtkSTLReader()
-        reader.SetFileName(str(path))
-        reader.ScalarTagsOn()
-        reader.Update()
-
-        cleanFilter = vtkCleanPolyData()
-        cleanFilter.SetInputData(reader.GetOutput())
-        cleanFilter.Update()
-
-        cellSizeFilter = vtkCellSizeFilter()
-        cellSizeFilter.SetInputData(cleanFilter.GetOutput())
-        cellSizeFilter.Update()
-
-        threshold = vtkThreshold()
-        threshold.AllScalarsOff()
-        threshold.SetThresholdFunction(vtkThreshold.THRESHOLD_UPPER)
-
-        threshold.SetUpperThreshold(sys.float_info.min)  # To get only the cells bigger than zero
-        threshold.SetInputArrayToProcess(0, 0, 0, vtkDataObject.FIELD_ASSOCIATION_CELLS, 'Area')
-
-        threshold.SetInputData(cellSizeFilter.GetOutput())
-        threshold.Update()
-
-        # Output of vtkThreshold filter is Unstructured Grid
-        # Convert it to vtkPolyData by vtkGeometryFilter
-        geometry = vtkGeometryFilter()
-        geometry.SetInputData(threshold.GetOutput())
-        geometry.Update()
-
-        stl: vtkPolyData = geometry.GetOutput()
-
-        numCells = stl.GetNumberOfCells()
-
+    def _createSurfaces(self, path: Path, solids: [StlSolid]):
         fName = path.stem.replace(' ', '_')
-        self._addArray(stl, 'fIndex', fName, numCells)
-
-        if reader.GetBinaryHeader() is not None:  # BINARY STL
-            sName = ''
-            sIndex = self._addArray(stl, 'sIndex', sName, numCells)
-
-            return [StlSurface(stl, fName, sName, sIndex)]
-
-        # ASCII STL
-        names = list(map(str.strip, reader.GetHeader().splitlines()))
-        names = ['_'.join(n.split()) for n in names]  # collapse multiple whitespaces into underscore
-
-        minSolid, maxSolid = stl.GetCellData().GetScalars('STLSolidLabeling').GetRange()
-        if minSolid == maxSolid:
-            sName = names[0] if names else ''
-            sIndex = self._addArray(stl, 'sIndex', sName, numCells)
+        fIndex = self._stringIndices.putString(fName)
 
-            return [StlSurface(stl, fName, sName, sIndex)]
-
-        solids = []
-        for sId in range(int(minSolid), int(maxSolid) + 1):
-            threshold = vtkThreshold()
-            threshold.SetInputData(stl)
-            threshold.SetLowerThreshold(sId - 0.5)
-            threshold.SetUpperThreshold(sId + 0.5)
-            threshold.SetThresholdFunction(vtkThreshold.THRESHOLD_BETWEEN)
-            threshold.SetInputArrayToProcess(0, 0, 0, vtkDataObject.FIELD_ASSOCIATION_CELLS, 'STLSolidLabeling')
-            threshold.Update()
-
-            # Output of vtkThreshold filter is Unstructured Grid
-            # Convert it to vtkPolyData by vtkGeometryFilter
-
-            geometryFilter = vtkGeometryFilter()
-            geometryFilter.SetInputData(threshold.GetOutput())
-            geometryFilter.Update()
-
-            solid = geometryFilter.GetOutput()
-
-            sName = names[sId] if sId < len(names) and names[sId] else ''
-            sIndex = self._addArray(solid, 'sIndex', sName, solid.GetNumberOfCells())
-
-            solids.append(StlSurface(solid, fName, sName, sIndex))
+        surfaces = []
+        for solid in solids:
+            sName = solid.name
+            sIndex = self._stringIndices.putString(sName)
 
-        return solids
+            polyData = _polyData(solid)
+            _addArray(polyData, 'fIndex', fIndex)
+            _addArray(polyData, 'sIndex', sIndex)
 
-    def _addArray(self, polyData: vtkPolyData, arrayName: str, value: str, count: int):
-        index = self._stringIndices.putString(value)
-        array = vtkIntArray()
-        array.SetName(arrayName)
-        for i in range(0, count):
-            array.InsertNextValue(index)
-        polyData.GetCellData().AddArray(array)
+            surfaces.append(StlSurface(polyData, fName, sName, sIndex))
 
-        return index
+        return surfaces
 
     def identifyVolumes(self):
         volumes = []
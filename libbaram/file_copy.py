@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import errno
+import os
+import platform
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from threading import Lock
+
+from PySide6.QtCore import QObject, Signal
+
+
+CHUNK_SIZE = 1 << 26            # Bytes copied by a task, so that a large file is copied by several threads
+PROGRESS_INTERVAL = 0.1         # Seconds between progress reports
+
+_BUFFER_SIZE = 1 << 20
+_FICLONE = 0x40049409           # ioctl request to share the extents of a file on btrfs, xfs and others on Linux
+
+# Errors meaning that the file system cannot do the operation, not that the operation failed
+_UNSUPPORTED = {errno.EXDEV, errno.EOPNOTSUPP, errno.ENOTSUP, errno.EINVAL, errno.ENOTTY, errno.ENOSYS, errno.EPERM,
+                errno.EMLINK}
+
+
+class FileCopier(QObject):
+    """Copies files by the cheapest way the file system allows, reporting the progress in bytes
+
+    A file is copied by
+        1. reflink, which shares the data blocks until one of the files is modified, on file systems supporting it
+        2. hardlink, if the file is linkable and on the same file system
+        3. copy_file_range, or reading and writing where it is not available, in chunks by multiple threads
+
+    Only files that are replaced, not modified in place, when they are changed should be linkable,
+    because a hardlinked file is the same file as the source.
+
+    copy() blocks until all the files are copied. It is to be called in a thread, and emits progress from the thread.
+    """
+    progress = Signal('qint64', 'qint64')  # Bytes copied and total bytes
+
+    def __init__(self, workers=None):
+        super().__init__()
+
+        self._workers = workers or min(8, os.cpu_count())
+        self._files = []
+        self._total = 0
+        self._copied = 0
+        self._reportedAt = 0
+        self._lock = Lock()
+
+    def addFile(self, source: Path, target: Path, linkable=False):
+        size = source.stat().st_size
+        self._files.append((source, target, size, linkable))
+        self._total += size
+
+    def addTree(self, source: Path, target: Path, linkable=None):
+        """Adds the files in the source directory to be copied into the target directory
+
+        Args:
+            source: directory to copy
+            target: directory to copy to, which is created if it does not exist
+            linkable: function deciding whether a file can be hardlinked by its path, None if no file can be
+        """
+        target.mkdir(parents=True, exist_ok=True)
+        for path in sorted(source.iterdir()):
+            if path.is_dir():
+                self.addTree(path, target / path.name, linkable)
+            else:
+                self.addFile(path, target / path.name, linkable is not None and linkable(path))
+
+    def totalSize(self):
+        return self._total
+
+    def copy(self):
+        """Copies the files added"""
+        chunks = []
+        for source, target, size, linkable in self._files:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            if _reflink(source, target) or (linkable and _link(source, target)):
+                self._advance(size)
+            else:
+                with open(target, 'wb') as f:
+                    f.truncate(size)
+                chunks.extend((source, target, offset, min(CHUNK_SIZE, size - offset))
+                              for offset in range(0, size, CHUNK_SIZE))
+
+        with ThreadPoolExecutor(max_workers=self._workers) as executor:
+            for future in [executor.submit(self._copyChunk, *chunk) for chunk in chunks]:
+                future.result()
+
+        self._files = []
+        self.progress.emit(self._total, self._total)
+
+    def _copyChunk(self, source, target, offset, size):
+        with open(source, 'rb') as src, open(target, 'r+b') as dst:
+            copied = 0
+            if hasattr(os, 'copy_file_range'):
+                try:
+                    while copied < size:
+                        n = os.copy_file_range(src.fileno(), dst.fileno(), size - copied,
+                                               offset + copied, offset + copied)
+                        if n == 0:
+                            break
+
+                        copied += n
+                        self._advance(n)
+                except OSError as e:
+                    if e.errno not in _UNSUPPORTED:
+                        raise
+
+            src.seek(offset + copied)
+            dst.seek(offset + copied)
+            while copied < size and (data := src.read(min(_BUFFER_SIZE, size - copied))):
+                dst.write(data)
+                copied += len(data)
+                self._advance(len(data))
+
+        if copied < size:
+            raise OSError(errno.EIO, f'{source} is truncated while copying', str(source))
+
+    def _advance(self, size):
+        with self._lock:
+            self._copied += size
+            now = time.monotonic()
+            if now - self._reportedAt < PROGRESS_INTERVAL:
+                return
+
+            self._reportedAt = now
+            copied = self._copied
+
+        self.progress.emit(copied, self._total)
+
+
+def _reflink(source, target):
+    if platform.system() != 'Linux':
+        return False
+
+    import fcntl
+
+    with open(source, 'rb') as src, open(target, 'wb') as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+            return True
+        except OSError as e:
+            if e.errno not in _UNSUPPORTED:
+                raise
+
+    return False
+
+
+def _link(source, target):
+    try:
+        target.unlink(missing_ok=True)
+        os.link(source, target)
+        return True
+    except OSError as e:
+        if e.errno not in _UNSUPPORTED:
+            raise
+
+    return False
@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from array import array
+from bisect import bisect_right
+from pathlib import Path
+
+import numpy as np
+
+
+SCAN_LIMIT = 1 << 24    # Bytes indexed at most in an update
+
+_CHUNK_SIZE = 1 << 22
+_NEWLINE = ord('\n')
+
+
+class LogFile:
+    """Text file written by another process, of which lines are read from the disk on demand
+
+    Only the offsets of the lines are kept in memory, so that a log of any size can be shown and searched.
+    The file is not kept open or memory-mapped, because the process may truncate or rewrite it at any time.
+    """
+    def __init__(self, path: Path):
+        self._path = path
+
+        self._offsets = array('q', [0])  # Start offsets of the lines, and the end offset of the last line
+
+    @property
+    def path(self):
+        return self._path
+
+    def lineCount(self):
+        return len(self._offsets) - 1
+
+    def update(self, final=False):
+        """Indexes the lines appended to the file since the last update
+
+        Up to SCAN_LIMIT bytes are indexed in an update.
+        A line is indexed when its newline is written, or at the end of the file if final is True.
+
+        Args:
+            final: True if the file is not written anymore
+
+        Returns:
+            True if there are more bytes to index
+            False if all the bytes are indexed
+
+        Raises:
+            EOFError: the file is truncated or removed after the last update, and the index is cleared
+        """
+        indexed = self._offsets[-1]
+        try:
+            size = self._path.stat().st_size
+        except FileNotFoundError:
+            size = 0
+
+        if size < indexed:
+            self._offsets = array('q', [0])
+            raise EOFError
+
+        end = min(size, indexed + SCAN_LIMIT)
+        if end > indexed:
+            with open(self._path, 'rb') as f:
+                f.seek(indexed)
+                position = indexed
+                while position < end:
+                    chunk = np.frombuffer(f.read(min(_CHUNK_SIZE, end - position)), np.uint8)
+                    if not len(chunk):
+                        break
+
+                    newlines = np.flatnonzero(chunk == _NEWLINE) + (position + 1)
+                    self._offsets.frombytes(newlines.astype(np.int64).tobytes())
+                    position += len(chunk)
+
+        if end < size:
+            return True
+
+        if final and self._offsets[-1] < size:
+            self._offsets.append(size)
+
+        return False
+
+    def lines(self, start, end):
+        """Returns the lines from start to end, not including end"""
+        if start >= end:
+            return []
+
+        with open(self._path, 'rb') as f:
+            f.seek(self._offsets[start])
+            data = f.read(self._offsets[end] - self._offsets[start])
+
+        lines = data.decode('UTF-8', errors='replace').split('\n')
+        if len(lines) > end - start:  # Empty string after the last newline
+            lines.pop()
+
+        return [line.rstrip() for line in lines]
+
+    def find(self, text, start, end):
+        """Finds the text in the lines from start to end without reading all the lines into memory
+
+        The text is compared case-insensitively for ASCII characters.
+
+        Returns:
+            Number of the first line containing the text, or None if not found
+        """
+        pattern = text.encode('UTF-8').lower()
+        if not pattern or start >= end:
+            return None
+
+        position = self._offsets[start]
+        endPosition = self._offsets[end]
+        overlap = len(pattern) - 1
+        with open(self._path, 'rb') as f:
+            while position < endPosition:
+                f.seek(position)
+                chunk = f.read(min(_CHUNK_SIZE, endPosition - position)).lower()
+                if not chunk:
+                    break
+
+                if (found := chunk.find(pattern)) >= 0:
+                    return bisect_right(self._offsets, position + found) - 1
+
+                if position + len(chunk) >= endPosition:
+                    break
+
+                position += max(1, len(chunk) - overlap)
+
+        return None
@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import io
+import re
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+
+CHUNK_SIZE = 1 << 26    # Bytes parsed at once, not to hold a whole large file in memory
+
+_TOKEN_PATTERN = re.compile(rb'\([^)]*\)|[^\s()]+')
+_PARENTHESES = bytes.maketrans(b'()', b'  ')
+_COMPONENTS = 'xyz'
+
+
+class DatFile:
+    """Data file written by OpenFOAM function objects, such as solverInfo.dat and coefficient.dat
+
+    Lines appended to the file are read in bytes from where the last read ended,
+    and a line not complete yet is left to the next read.
+    Comment lines at the beginning of the file are the header,
+    and data lines are parsed by the C engine of pandas in chunks.
+    Values in parentheses, such as vectors, are split into the columns of their components,
+    and "N/A" is read as NaN.
+    """
+    def __init__(self, path: Path):
+        self._path = path
+        self._offset = 0
+        self._comments = []
+        self._headerRead = False
+        self._widths = None     # Number of values of each column, from the first data line
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def comments(self):
+        """Comment lines of the header, without "#" """
+        return self._comments
+
+    def readHeader(self) -> bool:
+        """Reads the comment lines at the beginning of the file
+
+        Returns:
+            True if the header is complete, that is, a data line follows the comment lines
+        """
+        if self._headerRead:
+            return True
+
+        with open(self._path, 'rb') as f:
+            f.seek(self._offset)
+            while line := f.readline():
+                if not line.endswith(b'\n'):
+                    break
+
+                if not line.startswith(b'#'):
+                    self._headerRead = True
+                    break
+
+                self._comments.append(line[1:].decode('UTF-8', errors='replace').strip())
+                self._offset += len(line)
+
+        return self._headerRead
+
+    def read(self, names, usecols=None, dtype=None, final=False) -> Optional[pd.DataFrame]:
+        """Reads the data lines appended since the last read
+
+        Args:
+            names: names of the columns.
+                A column of values in parentheses is split into the columns of its components,
+                named with the suffixes "_x", "_y" and "_z" for vectors, or the indices of the components.
+            usecols: names of the columns to read, all the columns if None
+            dtype: types of the columns as read_csv() of pandas
+            final: True if the file is not written anymore, to read the last line without newline
+
+        Returns:
+            DataFrame of the rows read, or None if there is no data line to read
+        """
+        if not self.readHeader():
+            return None
+
+        frames = []
+        with open(self._path, 'rb') as f:
+            f.seek(self._offset)
+            data = b''
+            while chunk := f.read(CHUNK_SIZE):
+                data += chunk
+                end = data.rfind(b'\n') + 1
+                if end:
+                    frames.append(self._parse(data[:end], names, usecols, dtype))
+                    self._offset += end
+                    data = data[end:]
+
+            if final and data.strip():
+                frames.append(self._parse(data, names, usecols, dtype))
+                self._offset += len(data)
+
+        frames = [df for df in frames if df is not None]
+        if not frames:
+            return None
+
+        return frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+
+    def _parse(self, data: bytes, names, usecols, dtype):
+        if not data.strip():
+            return None
+
+        if self._widths is None:
+            firstLine = data.lstrip().split(b'\n', 1)[0]
+            self._widths = [len(token[1:-1].split()) if token.startswith(b'(') else 1
+                            for token in _TOKEN_PATTERN.findall(firstLine)]
+
+        if any(width > 1 for width in self._widths):
+            names = _componentNames(names, self._widths)
+            data = data.translate(_PARENTHESES)
+
+        return pd.read_csv(io.BytesIO(data), sep=r'\s+', header=None, names=names, usecols=usecols, dtype=dtype,
+                           na_values=['N/A'])
+
+
+def _componentNames(names, widths):
+    expanded = []
+    for name, width in zip(names, widths):
+        if width == 1:
+            expanded.append(name)
+        elif width == len(_COMPONENTS):
+            expanded.extend(f'{name}_{c}' for c in _COMPONENTS)
+        else:
+            expanded.extend(f'{name}_{i}' for i in range(width))
+
+    return expanded + names[len(widths):]
@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 
 from enum import Enum
+import hashlib
 import tempfile
 from pathlib import Path
 
@@ -36,6 +37,7 @@ class DictionaryFile:
         }
         self._data = None
         self._casePath = casePath
+        self._text = None
 
     def isBuilt(self):
         return self._data is not None
@@ -57,21 +59,41 @@ class DictionaryFile:
         return self._casePath / processorDir / self._header['location'] / self._header['object']
 
     def asDict(self):
+        self._text = None   # The dictionary returned can be changed
+
         return self._data
 
+    def contentHash(self):
+        """Returns the hash of the content to be written
+
+        Returns:
+            Hash string, or None if the content is not known until written
+        """
+        if self._data:
+            return hashlib.sha1(self._content().encode()).hexdigest()
+
+        return None
+
     def write(self):
         self._write()
 
     def writeAtomic(self):
         if self._data:
             with tempfile.NamedTemporaryFile(mode='w', delete=False, dir=self.fullPath().parent) as f:
-                f.write(str(FoamFileGenerator(self._data, header=self._header)))
+                f.write(self._content())
                 p = Path(f.name)
             p.replace(self.fullPath())
 
     def copyFromResource(self, src):
         resource.copy(src, self.fullPath())
 
+    def _content(self):
+        # The text is generated once for the data built, to be hashed and written as it is
+        if self._text is None or self._text[0] is not self._data:
+            self._text = (self._data, str(FoamFileGenerator(self._data, header=self._header)))
+
+        return self._text[1]
+
     def _setFormat(self, fileFormat: Format):
         self._header['format'] = fileFormat.value
 
@@ -83,7 +105,7 @@ class DictionaryFile:
         if self._data:
             path.parent.mkdir(parents=True, exist_ok=True)
             with open(path, 'w') as f:
-                f.write(str(FoamFileGenerator(self._data, header=self._header)))
+                f.write(self._content())
         else:
             path.unlink(missing_ok=True)
 
@@ -0,0 +1,421 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+from PyFoam.Basics.FoamFileGenerator import FoamFileGenerator
+
+
+_SPACE = b' \t\r\n\f\v'
+_WORD_DELIMITERS = _SPACE + b';{}()[]"'
+_OPENING = b'({['
+_CLOSING = b')}]'
+
+_OPEN_PARENTHESIS = ord('(')
+_OPEN_BRACE = ord('{')
+_CLOSE_BRACE = ord('}')
+_SEMICOLON = ord(';')
+_QUOTE = ord('"')
+_HASH = ord('#')
+_BACKSLASH = ord('\\')
+
+_LIST_TYPE_PATTERN = re.compile(rb'List<(\w+)>')
+_LABEL_SIZE_PATTERN = re.compile(r'label=(\d+)')
+_SCALAR_SIZE_PATTERN = re.compile(r'scalar=(\d+)')
+
+_CHUNK_SIZE = 1 << 22
+
+# Number of components of the primitive types that are written as contiguous blocks in binary format
+_COMPONENTS = {
+    b'label': 1,
+    b'scalar': 1,
+    b'vector': 3,
+    b'vector2D': 2,
+    b'sphericalTensor': 1,
+    b'symmTensor': 6,
+    b'tensor': 9,
+}
+
+
+class FieldFileError(Exception):
+    pass
+
+
+@dataclass
+class _Encoding:
+    binary: bool = False
+    labelSize: int = 4
+    scalarSize: int = 8
+
+    def dtype(self, type_):
+        if type_ == b'label':
+            return np.dtype(f'<i{self.labelSize}')
+
+        return np.dtype(f'<f{self.scalarSize}')
+
+
+class RawValue:
+    """Value of an entry kept as the span of the file content it was read from"""
+    def __init__(self, raw: memoryview, isDict=False):
+        self._raw = raw
+        self._isDict = isDict
+
+    @property
+    def raw(self) -> memoryview:
+        return self._raw
+
+    def isDict(self):
+        return self._isDict
+
+    def __str__(self):
+        return bytes(self._raw).decode()
+
+
+class FieldValue(RawValue):
+    """Value of a field, "uniform <value>" or "nonuniform List<type> <size>(<values>)"
+
+    The values are not parsed until they are requested as an array.
+    """
+    def __init__(self, raw: memoryview, encoding: _Encoding):
+        super().__init__(raw)
+        self._encoding = encoding
+
+    def isUniform(self):
+        return bytes(self._raw[:7]) == b'uniform'
+
+    def array(self) -> np.ndarray:
+        """Returns the values as an array of shape (size,) for scalars or (size, components) for others
+
+        A uniform value is returned as an array of its components.
+        """
+        if self.isUniform():
+            return _parseNumbers(bytes(self._raw[7:]))
+
+        data = bytes(self._raw)
+        match = _LIST_TYPE_PATTERN.search(data)
+        if match is None:
+            raise FieldFileError(f'Unknown nonuniform value: {data[:80]}')
+
+        type_ = match.group(1)
+        components = _COMPONENTS.get(type_)
+        opening = data.index(b'(', match.end())
+        size = int(data[match.end():opening])
+
+        if self._encoding.binary and components is not None:
+            dtype = self._encoding.dtype(type_)
+            start = opening + 1
+            values = np.frombuffer(data, dtype=dtype, count=size * components, offset=start)
+        else:
+            values = _parseNumbers(data[opening:data.rindex(b')') + 1])
+
+        return values if components == 1 else values.reshape(size, -1)
+
+
+def _parseNumbers(text: bytes) -> np.ndarray:
+    return np.array(text.replace(b'(', b' ').replace(b')', b' ').split(), dtype=float)
+
+
+class FieldFile:
+    """OpenFOAM field file of which only the header and boundaryField are parsed
+
+    The other entries, including internalField, are kept as spans of the file content,
+    and nonuniform values in boundaryField are kept in the same way,
+    so that large fields are never tokenized nor re-serialized.
+    Both ascii and binary formats are supported.
+
+    Patches in boundaryField are dictionaries that can be modified.
+    Values read from the file are strings for single words, FieldValue for fields and RawValue for others.
+    Other values set by the caller are generated in OpenFOAM dictionary format on writing.
+    """
+    def __init__(self, path):
+        self._path = Path(path)
+        self._content = self._path.read_bytes()
+        self._view = memoryview(self._content)
+        self._header = {}
+        self._encoding = _Encoding()
+        self._entries = {}
+        self._boundaryField = {}
+        self._boundaryFieldSpan = None
+
+        self._parse()
+
+    @property
+    def header(self) -> dict:
+        return self._header
+
+    @property
+    def boundaryField(self) -> dict:
+        return self._boundaryField
+
+    @property
+    def internalField(self):
+        return self.entry('internalField')
+
+    def isBinary(self):
+        return self._encoding.binary
+
+    def entry(self, keyword):
+        """Returns the value of a top level entry, or None if it does not exist"""
+        if keyword not in self._entries:
+            return None
+
+        start, end = self._entries[keyword]
+        return self._decode(start, end)
+
+    def write(self, path=None):
+        """Writes the file, replacing only boundaryField of the original content
+
+        Args:
+            path: path to write the file to, the path it was read from if not given
+        """
+        start, end = self._boundaryFieldSpan
+        with open(path or self._path, 'wb') as f:
+            f.write(self._view[:start + 1])
+            f.write(b'\n')
+            for name, patch in self._boundaryField.items():
+                if patch is None:
+                    f.write(f'    {name}\n'.encode())
+                else:
+                    self._writePatch(f, name, patch)
+            f.write(self._view[end:])
+
+    def _writePatch(self, f, name, patch):
+        f.write(f'    {name}\n    {{\n'.encode())
+
+        for key, value in patch.items():
+            if value is None:
+                if key.startswith('#'):
+                    f.write(f'        {key}\n'.encode())
+            elif isinstance(value, RawValue):
+                f.write(f'        {key}'.encode())
+                if value.isDict():
+                    f.write(b'\n        ')
+                    f.write(value.raw)
+                    f.write(b'\n')
+                else:
+                    f.write(b' ')
+                    f.write(value.raw)
+                    f.write(b';\n')
+            else:
+                text = str(FoamFileGenerator({key: value}))
+                f.write(''.join(f'        {line}\n' for line in text.splitlines() if line.strip()).encode())
+
+        f.write(b'    }\n')
+
+    def _parse(self):
+        entries = self._parseEntries(0, len(self._content), topLevel=True)
+
+        if 'FoamFile' not in entries:
+            raise FieldFileError(f'No FoamFile header in {self._path}')
+
+        if 'boundaryField' not in entries:
+            raise FieldFileError(f'No boundaryField in {self._path}')
+
+        start, end = entries.pop('boundaryField')
+        self._boundaryFieldSpan = (start, end - 1)
+        for name, (patchStart, patchEnd) in self._parseEntries(start + 1, end - 1).items():
+            if patchStart is None:
+                self._boundaryField[name] = None
+            elif self._content[patchStart] != _OPEN_BRACE:
+                raise FieldFileError(f'Patch {name} is not a dictionary in {self._path}')
+            else:
+                self._boundaryField[name] = {
+                    key: None if valueStart is None else self._decode(valueStart, valueEnd)
+                    for key, (valueStart, valueEnd) in self._parseEntries(patchStart + 1, patchEnd - 1).items()}
+
+        del entries['FoamFile']
+        self._entries = entries
+
+    def _parseHeader(self, start, end):
+        for key, (valueStart, valueEnd) in self._parseEntries(start + 1, end - 1).items():
+            if valueStart is not None:
+                self._header[key] = bytes(self._view[valueStart:valueEnd]).decode().strip('"')
+
+        self._encoding.binary = self._header.get('format') == 'binary'
+        arch = self._header.get('arch', '')
+        if match := _LABEL_SIZE_PATTERN.search(arch):
+            self._encoding.labelSize = int(match.group(1)) // 8
+        if match := _SCALAR_SIZE_PATTERN.search(arch):
+            self._encoding.scalarSize = int(match.group(1)) // 8
+
+    def _parseEntries(self, pos, end, topLevel=False):
+        """Returns spans of the entry values in content[pos:end]
+
+        The span of a dictionary includes its braces.
+        Directives are returned with their whole line as the key and a span of None.
+        """
+        entries = {}
+        while (pos := self._skipSpace(pos)) < end:
+            if self._content[pos] == _HASH:
+                lineEnd = self._content.find(b'\n', pos, end)
+                lineEnd = end if lineEnd < 0 else lineEnd
+                entries[bytes(self._view[pos:lineEnd]).decode().rstrip()] = (None, None)
+                pos = lineEnd
+                continue
+
+            key, pos = self._readWord(pos)
+            start = self._skipSpace(pos)
+            if start >= end:
+                raise FieldFileError(f'Missing value of {key} in {self._path}')
+
+            pos = self._skipValue(start)
+            entries[key] = (start, pos)
+            if self._content[pos - 1] != _CLOSE_BRACE:
+                pos += 1    # Next to ";"
+
+            if topLevel and key == 'FoamFile':
+                self._parseHeader(start, pos)
+
+        return entries
+
+    def _decode(self, start, end):
+        raw = self._view[start:end]
+        text = bytes(raw[:16])
+        if text.startswith(b'uniform') or text.startswith(b'nonuniform'):
+            return FieldValue(raw, self._encoding)
+
+        if self._content[start] == _OPEN_BRACE:
+            return RawValue(raw, True)
+
+        if end - start < 256:
+            value = bytes(raw)
+            if not any(c in _WORD_DELIMITERS for c in value) or self._isString(value):
+                return value.decode()
+
+        return RawValue(raw)
+
+    def _isString(self, value):
+        return value[0] == _QUOTE and self._skipString(value, 0) == len(value)
+
+    def _skipSpace(self, pos):
+        content = self._content
+        size = len(content)
+        while pos < size:
+            if content[pos] in _SPACE:
+                pos += 1
+            elif content.startswith(b'//', pos):
+                pos = content.find(b'\n', pos)
+                if pos < 0:
+                    return size
+            elif content.startswith(b'/*', pos):
+                pos = content.find(b'*/', pos)
+                if pos < 0:
+                    raise FieldFileError(f'Unterminated comment in {self._path}')
+                pos += 2
+            else:
+                break
+
+        return pos
+
+    def _readWord(self, pos):
+        content = self._content
+        if content[pos] == _QUOTE:
+            end = self._skipString(content, pos)
+        else:
+            end = pos
+            while end < len(content) and content[end] not in _WORD_DELIMITERS:
+                end += 1
+
+        if end == pos:
+            raise FieldFileError(f'Unexpected character "{chr(content[pos])}" at {pos} in {self._path}')
+
+        return bytes(self._view[pos:end]).decode(), end
+
+    def _skipString(self, content, pos):
+        end = pos + 1
+        while True:
+            end = content.find(b'"', end)
+            if end < 0:
+                raise FieldFileError(f'Unterminated string in {self._path}')
+            if content[end - 1] != _BACKSLASH:
+                return end + 1
+
+            end += 1
+
+    def _skipValue(self, pos):
+        """Returns the end of the value starting at pos
+
+        The end is the position of ";" terminating the value, or next to "}" if the value is a dictionary.
+        """
+        content = self._content
+        isDict = content[pos] == _OPEN_BRACE
+        depth = 0
+        words = [None, None]
+        while True:
+            pos = self._skipSpace(pos)
+            if pos >= len(content):
+                raise FieldFileError(f'Unexpected end of file {self._path}')
+
+            c = content[pos]
+            if c == _SEMICOLON:
+                if depth == 0:
+                    return pos
+                pos += 1
+            elif c == _QUOTE:
+                pos = self._skipString(content, pos)
+            elif c in _OPENING:
+                if c == _OPEN_PARENTHESIS and words[-1] is not None and words[-1].isdigit():
+                    pos = self._skipList(pos, int(words[-1]), words[-2])
+                else:
+                    depth += 1
+                    pos += 1
+            elif c in _CLOSING:
+                depth -= 1
+                pos += 1
+                if depth < 0:
+                    raise FieldFileError(f'Unbalanced "{chr(c)}" at {pos} in {self._path}')
+                if depth == 0 and isDict and c == _CLOSE_BRACE:
+                    return pos
+            else:
+                end = pos
+                while end < len(content) and content[end] not in _WORD_DELIMITERS:
+                    end += 1
+                words = [words[-1], content[pos:end]]
+                pos = end
+                continue
+
+            words = [None, None]
+
+    def _skipList(self, pos, size, listType):
+        """Returns the position next to the list of the size starting with "(" at pos"""
+        type_ = None
+        if listType is not None and (match := _LIST_TYPE_PATTERN.fullmatch(listType)):
+            type_ = match.group(1)
+
+        if self._encoding.binary and type_ in _COMPONENTS:
+            end = pos + 1 + size * _COMPONENTS[type_] * self._encoding.dtype(type_).itemsize
+            if end >= len(self._content) or self._content[end] != ord(')'):
+                raise FieldFileError(f'Invalid binary list at {pos} in {self._path}')
+
+            return end + 1
+
+        return self._matchParenthesis(pos)
+
+    def _matchParenthesis(self, pos):
+        """Returns the position next to ")" matching "(" at pos
+
+        The content is scanned in chunks to find the matching parenthesis without tokenizing.
+        """
+        content = self._content
+        depth = 0
+        start = pos
+        while start < len(content):
+            chunk = content[start:start + _CHUNK_SIZE]
+            closing = chunk.count(b')')
+            if closing < depth:
+                depth += chunk.count(b'(') - closing
+            else:
+                array = np.frombuffer(chunk, dtype=np.uint8)
+                steps = (array == ord('(')).astype(np.int64) - (array == ord(')'))
+                depths = depth + np.cumsum(steps)
+                if (matched := np.flatnonzero(depths == 0)).size:
+                    return start + int(matched[0]) + 1
+
+                depth = int(depths[-1])
+
+            start += _CHUNK_SIZE
+
+        raise FieldFileError(f'Unbalanced "(" at {pos} in {self._path}')
@@ -0,0 +1,207 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import gzip
+import mmap
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+
+CHUNK_POINTS = 1 << 20  # Points transformed at once, not to hold a whole large mesh in memory
+
+_SPACE = b' \t\r\n\f\v'
+_FORMAT_PATTERN = re.compile(rb'\bformat\s+(\w+)\s*;')
+_SCALAR_SIZE_PATTERN = re.compile(rb'scalar=(\d+)')
+_PARENTHESES = bytes.maketrans(b'()', b'  ')
+
+
+class MeshTransformError(Exception):
+    pass
+
+
+@dataclass
+class AffineTransform:
+    """Transform of points p to matrix @ p + translation"""
+    matrix: np.ndarray
+    translation: np.ndarray
+
+    @classmethod
+    def scale(cls, x, y, z):
+        return cls(np.diag([float(x), float(y), float(z)]), np.zeros(3))
+
+    @classmethod
+    def translate(cls, x, y, z):
+        return cls(np.identity(3), np.array([float(x), float(y), float(z)]))
+
+    @classmethod
+    def rotate(cls, origin, axis, angle):
+        """Rotation about the axis passing through the origin
+
+        Args:
+            origin: a point on the axis
+            axis: direction of the axis
+            angle: angle of the rotation in degrees, counterclockwise looking against the axis
+        """
+        origin = np.array(origin, dtype=float)
+        axis = np.array(axis, dtype=float)
+        norm = np.linalg.norm(axis)
+        if norm == 0:
+            raise MeshTransformError('Rotation axis is a zero vector')
+
+        x, y, z = axis / norm
+        theta = np.radians(float(angle))
+        cross = np.array([[0, -z, y],
+                          [z, 0, -x],
+                          [-y, x, 0]])
+        matrix = np.identity(3) + np.sin(theta) * cross + (1 - np.cos(theta)) * (cross @ cross)
+
+        return cls(matrix, origin - matrix @ origin)
+
+    def apply(self, points: np.ndarray) -> np.ndarray:
+        """Returns the points transformed, given as an array of shape (n, 3)"""
+        return points @ self.matrix.T + self.translation
+
+
+def transformPointsFile(path: Path, transform: AffineTransform, precision=12):
+    """Transforms the points of a polyMesh "points" file
+
+    The file is memory-mapped and transformed in chunks, then replaced atomically with the transformed one,
+    so that the mesh is never left half written.
+    Both ascii and binary formats are supported, and "points.gz" is read and written compressed.
+
+    Args:
+        path: path of the points file
+        transform: transform to apply
+        precision: significant digits of the values written in ascii format
+    """
+    path = Path(path)
+    temporary = path.with_name(path.name + '.tmp')
+    compressed = path.suffix == '.gz'
+    try:
+        with open(path, 'rb') as f:
+            if compressed:
+                buffer = gzip.decompress(f.read())
+            else:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+            try:
+                with (gzip.open(temporary, 'wb', compresslevel=6) if compressed else open(temporary, 'wb')) as out:
+                    _transform(buffer, out, transform, precision, path)
+            finally:
+                if not compressed:
+                    buffer.close()  # The file cannot be replaced while it is mapped on Windows
+
+        os.replace(temporary, path)
+    except BaseException:
+        temporary.unlink(missing_ok=True)
+        raise
+
+
+def transformPointsFiles(files, transform: AffineTransform, precision=12, workers=None):
+    """Transforms the points files in parallel, a file in a process
+
+    Args:
+        files: paths of the points files, such as those of the regions and processor folders of a case
+        transform: transform to apply
+        precision: significant digits of the values written in ascii format
+        workers: maximum number of the processes, the number of CPUs by default
+    """
+    files = list(files)
+    if len(files) == 1:
+        transformPointsFile(files[0], transform, precision)
+        return
+
+    # Processes are spawned, not forked, because forking a process running GUI threads is not safe
+    with ProcessPoolExecutor(max_workers=min(len(files), workers or os.cpu_count()),
+                             mp_context=multiprocessing.get_context('spawn')) as executor:
+        for future in [executor.submit(transformPointsFile, path, transform, precision) for path in files]:
+            future.result()
+
+
+def _transform(buffer, out, transform, precision, path):
+    binary, scalarSize, size, start = _readHeader(buffer, path)
+
+    out.write(buffer[:start])
+    if binary:
+        dtype = np.dtype(f'<f{scalarSize}')
+        end = start + size * 3 * dtype.itemsize
+        if end >= len(buffer) or buffer[end] != ord(')'):
+            raise MeshTransformError(f'Invalid binary list in {path}')
+
+        for i in range(0, size, CHUNK_POINTS):
+            # No view of the buffer is kept after a chunk, so that the map can be closed
+            points = np.frombuffer(buffer, dtype=dtype, count=min(CHUNK_POINTS, size - i) * 3,
+                                   offset=start + i * 3 * dtype.itemsize)
+            out.write(transform.apply(points.reshape(-1, 3)).astype(dtype).tobytes())
+            del points
+    else:
+        end = buffer.rfind(b')')
+        count = 0
+        position = start
+        while count < size:
+            # Chunks are cut at the end of a point, which is the end of a line in the files written by OpenFOAM
+            chunkEnd = buffer.find(b'\n', min(position + CHUNK_POINTS * 48, end))
+            chunkEnd = end if chunkEnd < 0 or chunkEnd > end else chunkEnd
+            points = np.fromstring(buffer[position:chunkEnd].translate(_PARENTHESES), sep=' ')
+            if len(points) % 3 or not len(points):
+                raise MeshTransformError(f'Invalid points at {position} in {path}')
+
+            points = transform.apply(points.reshape(-1, 3))
+            out.write(((f'\n(%.{precision}g %.{precision}g %.{precision}g)' * len(points))
+                       % tuple(points.ravel())).encode())
+            count += len(points)
+            position = chunkEnd
+
+        if count != size:
+            raise MeshTransformError(f'{count} points read, not {size} in {path}')
+
+        out.write(b'\n')
+
+    out.write(buffer[end:])
+
+
+def _readHeader(buffer, path):
+    """Returns the format of the file, the number of the points and the position next to "(" of the list"""
+    start = buffer.find(b'FoamFile')
+    headerEnd = buffer.find(b'}', start) + 1
+    if start < 0 or headerEnd == 0:
+        raise MeshTransformError(f'No FoamFile header in {path}')
+
+    header = buffer[start:headerEnd]
+    binary = (match := _FORMAT_PATTERN.search(header)) is not None and match.group(1) == b'binary'
+    scalarSize = int(match.group(1)) // 8 if (match := _SCALAR_SIZE_PATTERN.search(header)) else 8
+
+    position = _skipSpace(buffer, headerEnd)
+    end = position
+    while end < len(buffer) and buffer[end:end + 1].isdigit():
+        end += 1
+
+    opening = _skipSpace(buffer, end)
+    if end == position or buffer[opening:opening + 1] != b'(':
+        raise MeshTransformError(f'No list of points in {path}')
+
+    return binary, scalarSize, int(buffer[position:end]), opening + 1
+
+
+def _skipSpace(buffer, position):
+    while position < len(buffer):
+        if buffer[position] in _SPACE:
+            position += 1
+        elif buffer[position:position + 2] == b'//':
+            position = buffer.find(b'\n', position)
+            if position < 0:
+                return len(buffer)
+        elif buffer[position:position + 2] == b'/*':
+            position = buffer.find(b'*/', position) + 2
+            if position < 2:
+                return len(buffer)
+        else:
+            break
+
+    return position
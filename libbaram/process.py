@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 
 import logging
+from collections import deque
 from pathlib import Path
 
 import psutil
@@ -9,6 +10,7 @@ import asyncio
 import os
 import platform
 import subprocess
+import threading
 
 from PySide6.QtCore import QObject, Signal
 
@@ -18,6 +20,10 @@ from libbaram.mpi import ParallelEnvironment
 
 logger = logging.getLogger(__name__)
 
+OUTPUT_CHUNK_SIZE = 65536       # Bytes read from the output of a process at once
+OUTPUT_FRAME_INTERVAL = 0.05    # Seconds between the emissions of the output lines read
+OUTPUT_BUFFER_LINES = 10000     # Lines kept until emitted, older lines are dropped if more lines are read
+
 
 class ProcessError(Exception):
     def __init__(self, returncode):
@@ -52,6 +58,71 @@ def isRunning(pid, startTime):
     return False
 
 
+async def waitProcess(pid, startTime):
+    """Waits until the process exits
+
+    The exit is notified to the event loop through a pidfd on Linux.
+    On other platforms, a thread waits for the process by psutil, which waits on the process handle on Windows.
+    Returns immediately if the process is not running.
+
+    Args:
+        pid: process id
+        startTime: creation time of the process, to tell it from another process of the same pid
+    """
+    loop = asyncio.get_running_loop()
+    exited = loop.create_future()
+
+    def notify():
+        if not exited.done():
+            exited.set_result(None)
+
+    fd = None
+    if hasattr(os, 'pidfd_open'):
+        try:
+            fd = os.pidfd_open(pid)
+        except ProcessLookupError:
+            return
+        except OSError:     # Not supported by the kernel
+            pass
+
+    try:
+        # The pidfd refers to the process running when it is opened,
+        # so the process is the one to wait if it is still running after that.
+        if not isRunning(pid, startTime):
+            return
+
+        if fd is not None:
+            try:
+                loop.add_reader(fd, notify)
+            except NotImplementedError:     # Event loops without add_reader()
+                os.close(fd)
+                fd = None
+
+        if fd is None:
+            def wait():
+                try:
+                    psutil.Process(pid).wait()
+                except psutil.NoSuchProcess:
+                    pass
+
+                try:
+                    loop.call_soon_threadsafe(notify)
+                except RuntimeError:    # The event loop is closed
+                    pass
+
+            # Daemon thread not to keep the application from exiting while the process is running
+            threading.Thread(target=wait, daemon=True).start()
+            await exited
+        else:
+            try:
+                await exited
+            finally:
+                loop.remove_reader(fd)
+    finally:
+        if fd is not None:
+            os.close(fd)
+
+
 async def runExternalScript(program: str, *args, cwd=None, useVenv=True, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL):
     ENV = os.environ.copy()
     if not useVenv:
@@ -87,7 +158,50 @@ def stopProcess(pid, startTime=None):
         pass
 
 
+class _OutputBuffer:
+    """Ring buffer of the lines read from an output stream of a process until they are emitted"""
+    def __init__(self, skipEmptyLines=False):
+        self._skipEmptyLines = skipEmptyLines
+
+        self._lines = deque(maxlen=OUTPUT_BUFFER_LINES)
+        self._partial = b''
+        self._dropped = 0
+
+    def feed(self, data: bytes):
+        lines = (self._partial + data).split(b'\n')
+        self._partial = lines.pop()
+        self._extend(lines)
+
+    def finish(self):
+        if self._partial:
+            self._extend([self._partial])
+            self._partial = b''
+
+    def take(self):
+        """Returns the lines buffered as a text, or None if there is no line"""
+        lines = [line.decode('UTF-8', errors='replace').rstrip() for line in self._lines]
+        if self._skipEmptyLines:
+            lines = [line for line in lines if line]
+
+        if self._dropped:
+            lines.insert(0, f'... {self._dropped} lines skipped')
+            self._dropped = 0
+
+        self._lines.clear()
+
+        return '\n'.join(lines) if lines else None
+
+    def _extend(self, lines):
+        self._dropped += max(0, len(self._lines) + len(lines) - OUTPUT_BUFFER_LINES)
+        self._lines.extend(lines)
+
+
 class RunSubprocess(QObject):
+    """Base of the classes running a process
+
+    Lines of the standard output and error of the process are emitted in batches,
+    at most once in OUTPUT_FRAME_INTERVAL, as a text of lines separated by newlines.
+    """
     output = Signal(str)
     errorOutput = Signal(str)
 
@@ -126,43 +240,18 @@ class RunSubprocess(QObject):
     async def wait(self):
         self._canceled = False
 
-        tasks = []
-
-        stdout = self._proc.stdout
-        outTask = asyncio.create_task(stdout.readline())
-        tasks.append(outTask)
-
-        stderr = self._proc.stderr
-        errTask = asyncio.create_task(stderr.readline())
-        tasks.append(errTask)
+        stdout = _OutputBuffer(skipEmptyLines=True)
+        stderr = _OutputBuffer()
+        readers = [asyncio.create_task(self._read(self._proc.stdout, stdout)),
+                   asyncio.create_task(self._read(self._proc.stderr, stderr))]
 
-        while len(tasks) > 0:
-            done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        pending = readers
+        while pending:
+            _, pending = await asyncio.wait(pending, timeout=OUTPUT_FRAME_INTERVAL)
+            self._emit(stdout, stderr)
 
-            tasks = list(pending)
-            if outTask in done:
-                try:
-                    if output := outTask.result().decode('UTF-8').rstrip():
-                        self.output.emit(output)
-                except UnicodeDecodeError:
-                    logger.warning(f'Unicode Decode Error: {outTask.result()}')
-
-                if not stdout.at_eof():
-                    outTask = asyncio.create_task(stdout.readline())
-                    tasks.append(outTask)
-
-            if errTask in done:
-                try:
-                    self.errorOutput.emit(errTask.result().decode('UTF-8').rstrip())
-                except UnicodeDecodeError:
-                    logger.warning(f'Unicode Decode Error: {errTask.result()}')
-
-                if not stderr.at_eof():
-                    errTask = asyncio.create_task(stderr.readline())
-                    tasks.append(errTask)
-
-            if len(done) < 1:
-                await asyncio.sleep(1)
+        for reader in readers:
+            reader.result()
 
         returncode = await self._proc.wait()
 
@@ -171,6 +260,19 @@ class RunSubprocess(QObject):
 
         return returncode
 
+    async def _read(self, stream, buffer: _OutputBuffer):
+        while data := await stream.read(OUTPUT_CHUNK_SIZE):
+            buffer.feed(data)
+
+        buffer.finish()
+
+    def _emit(self, stdout: _OutputBuffer, stderr: _OutputBuffer):
+        if (text := stdout.take()) is not None:
+            self.output.emit(text)
+
+        if (text := stderr.take()) is not None:
+            self.errorOutput.emit(text)
+
 
 class RunExternalScript(RunSubprocess):
     async def start(self):
@@ -4,6 +4,7 @@
 import os
 import platform
 import subprocess
+import time
 
 import psutil
 from pathlib import Path
@@ -131,18 +132,40 @@ def launchSolverOnLinux(solver: str, casePath: Path, uuid, parallel: ParallelEnv
     args = [OPENFOAM/'bin'/'baramd', '-project', uuid, '-cmdline']
     args.extend(parallel.makeCommand(OPENFOAM / 'bin' / solver, cwd=casePath, options=MPI_OPTIONS))
 
+    launchTime = time.time()
     process = openSolverProcess(args, casePath)
     process.wait()
 
-    processes = [p for p in psutil.process_iter(['pid', 'cmdline', 'create_time'])
-                 if (p.info['cmdline'] is not None) and (uuid in p.info['cmdline'])]
-    if processes:
-        ps = max(processes, key=lambda p: p.create_time())
+    # The daemon forked by baramd is usually given a pid next to baramd,
+    # so the processes from the pid are looked into first, and all the processes if the pids wrap around.
+    ps = _findProcess(uuid, process.pid, launchTime) or _findProcess(uuid, 0, launchTime)
+    if ps:
         return ps.pid, ps.create_time()
 
     return None
 
 
+def _findProcess(uuid, fromPid, launchTime):
+    """Returns the latest process of the uuid in the command line, among the processes started after the launch
+
+    Command lines, which are expensive to read, are read only for the processes started after the launch.
+    """
+    processes = []
+    for pid in psutil.pids():
+        if pid < fromPid:
+            continue
+
+        try:
+            ps = psutil.Process(pid)
+            # Creation time is rounded to the clock ticks
+            if ps.create_time() >= launchTime - 1 and uuid in ps.cmdline():
+                processes.append(ps)
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            pass
+
+    return max(processes, key=lambda p: p.create_time()) if processes else None
+
+
 def launchSolver(solver: str, casePath: Path, uuid, parallel: ParallelEnvironment) -> (int, float):
     """Launch solver
 
@@ -8,6 +8,9 @@ from PySide6.QtCore import Qt, Signal
 from .progress_dialog_ui import Ui_ProgressDialog
 
 
+PROGRESS_RANGE = 1000
+
+
 class ProgressDialog(QDialog):
     cancelClicked = Signal()
 
@@ -35,6 +38,14 @@ class ProgressDialog(QDialog):
     def setLabelText(self, text: str):
         self._ui.label.setText(text)
 
+    def setProgress(self, value, maximum):
+        """Shows the progress in the bar, which is busy until the progress is set
+
+        The values are scaled to the range of the bar, so that they can be larger than int, such as bytes.
+        """
+        self._ui.progressBar.setMaximum(PROGRESS_RANGE)
+        self._ui.progressBar.setValue(int(value * PROGRESS_RANGE / maximum) if maximum else PROGRESS_RANGE)
+
     def showCancelButton(self, text='Cancel'):
         self._ui.button.setText(text)
         self._ui.button.setVisible(True)